@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for dataclasses_json.
+
+Run the suite with `python -m benchmarks.run`, or with pytest-benchmark via
+`pytest benchmarks`. The workloads are defined in `benchmarks.workloads`.
+"""
@@ -0,0 +1,138 @@
+"""
+Runs the benchmark suite and compares it against a stored baseline.
+
+    python -m benchmarks.check [--baseline FILE] [--tolerance 0.25] [--update]
+
+Benchmarks are compared by the median ratio of their timing to the timing
+of a calibration workload run in alternating rounds (see
+`benchmarks.run.time_interleaved`), so a baseline recorded on one machine
+can be checked on another. A benchmark regresses if its ratio is higher
+than in the baseline by more than its tolerance.
+Tolerances default to `--tolerance` and can be set per benchmark in the
+`tolerances` mapping of the baseline file.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from benchmarks import run
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+# about twice the largest deviation (13%) seen in 5 runs of the whole suite
+# on unchanged code
+DEFAULT_TOLERANCE = 0.25
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    tolerance: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the normalized timing, > 0 means slower"""
+        if self.baseline is None or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+    @property
+    def regressed(self) -> bool:
+        change = self.change
+        return change is not None and change > self.tolerance
+
+    @property
+    def status(self) -> str:
+        if self.baseline is None:
+            return 'new'
+        if self.current is None:
+            return 'missing'
+        return 'REGRESSED' if self.regressed else 'ok'
+
+
+def normalized(results: Dict[str, Any]) -> Dict[str, float]:
+    return {name: timing['ratio']
+            for name, timing in results['benchmarks'].items()}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            default_tolerance: float = DEFAULT_TOLERANCE) -> List[Comparison]:
+    baseline_scores = normalized(baseline)
+    current_scores = normalized(current)
+    tolerances = baseline.get('tolerances', {})
+    return [Comparison(name,
+                       baseline_scores.get(name),
+                       current_scores.get(name),
+                       tolerances.get(name, default_tolerance))
+            for name in sorted(baseline_scores.keys() | current_scores.keys())]
+
+
+def format_report(comparisons: List[Comparison]) -> str:
+    lines = [f"{'benchmark':<32} {'baseline':>10} {'current':>10} "
+             f"{'change':>8} {'allowed':>8}  status"]
+    for c in comparisons:
+        baseline = '-' if c.baseline is None else f'{c.baseline:10.3f}'
+        current = '-' if c.current is None else f'{c.current:10.3f}'
+        change = '-' if c.change is None else f'{c.change:+8.1%}'
+        lines.append(f'{c.name:<32} {baseline:>10} {current:>10} '
+                     f'{change:>8} {c.tolerance:>+8.0%}  {c.status}')
+    return '\n'.join(lines)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get('format') != run.RESULTS_FORMAT:
+        raise ValueError(f"Baseline {path} has results format "
+                         f"{baseline.get('format')}, expected "
+                         f"{run.RESULTS_FORMAT}. Re-record it with --update.")
+    return baseline
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='baseline results file')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed relative slowdown, e.g. 0.25 for 25%%')
+    parser.add_argument('--repeat', type=int, default=run.DEFAULT_REPEAT,
+                        help='number of timing rounds per benchmark')
+    parser.add_argument('-k', dest='pattern',
+                        help='only run benchmarks whose name contains this')
+    parser.add_argument('--update', action='store_true',
+                        help='record the current results as the new baseline')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    current = run.run(run.select(args.pattern), repeat=args.repeat)
+
+    if args.update:
+        if os.path.exists(args.baseline):
+            # the tolerances are kept, also from a baseline of an older format
+            with open(args.baseline) as f:
+                current['tolerances'] = json.load(f).get('tolerances', {})
+        run.write_results(current, args.baseline)
+        print(f'Recorded baseline {args.baseline}', file=sys.stderr)
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if args.pattern is not None:
+        baseline['benchmarks'] = {name: timing for name, timing
+                                  in baseline['benchmarks'].items()
+                                  if args.pattern in name}
+    comparisons = compare(baseline, current, args.tolerance)
+    print(format_report(comparisons))
+    regressions = [c.name for c in comparisons if c.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Runs the benchmark suite and writes the results as JSON.
+
+    python -m benchmarks.run [-k SUBSTRING] [--repeat N] [-o results.json]
+
+The results format is stable (see `RESULTS_FORMAT`), so result files of two
+releases can be diffed or compared with each other.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from dataclasses_json import __version__
+from benchmarks.workloads import BENCHMARKS
+
+RESULTS_FORMAT = 2
+
+# rounds of each benchmark, see `time_interleaved`
+DEFAULT_REPEAT = 20
+
+
+def _calibration_workload():
+    # plain interpreter work (dicts, lists, str/float conversions), similar
+    # in nature to what the library does, but independent of its code
+    values = {}
+    for i in range(1000):
+        values[str(i)] = [i, float(i), {'key': str(i)}]
+    return sorted(values.items())
+
+
+def time_interleaved(fn: Callable[[], object],
+                     repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    Times `fn` in `repeat` rounds (all timings in seconds per call), which
+    alternate with rounds of the calibration workload. `ratio` is the median over the rounds of
+    the benchmark timing divided by the calibration timing right next to it:
+    the machine getting slower or faster during the run (other load, CPU
+    frequency scaling) affects both sides of each ratio alike, and the
+    median ignores rounds that were disturbed anyway.
+    """
+    timer = timeit.Timer(fn)
+    reference = timeit.Timer(_calibration_workload)
+    # short rounds, so that the two sides of a ratio run close together
+    number = max(1, timer.autorange()[0] // 4)
+    reference_number = max(1, reference.autorange()[0] // 4)
+    timings, calibrations, ratios = [], [], []
+    for _ in range(repeat):
+        timing = timer.timeit(number) / number
+        calibration = reference.timeit(reference_number) / reference_number
+        timings.append(timing)
+        calibrations.append(calibration)
+        ratios.append(timing / calibration)
+    return {
+        'calls_per_round': number,
+        'rounds': repeat,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'stdev': statistics.stdev(timings) if repeat > 1 else 0.0,
+        'calibration': statistics.median(calibrations),
+        'ratio': statistics.median(ratios),
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'dataclasses_json': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def select(pattern: Optional[str] = None) -> Iterable[str]:
+    return sorted(name for name in BENCHMARKS
+                  if pattern is None or pattern in name)
+
+
+def run(names: Iterable[str], repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    benchmarks = {name: time_interleaved(BENCHMARKS[name], repeat)
+                  for name in names}
+    return {
+        'format': RESULTS_FORMAT,
+        'environment': environment(),
+        'calibration': min(timing['calibration']
+                           for timing in benchmarks.values()),
+        'benchmarks': benchmarks,
+    }
+
+
+def write_results(results: Dict[str, Any], path: Optional[str]) -> None:
+    text = json.dumps(results, indent=2, sort_keys=True) + '\n'
+    if path is None:
+        sys.stdout.write(text)
+    else:
+        with open(path, 'w') as f:
+            f.write(text)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='pattern',
+                        help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='number of timing rounds per benchmark')
+    parser.add_argument('-o', '--output',
+                        help='write the results to this file instead of stdout')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    names = select(args.pattern)
+    if not names:
+        print(f'No benchmarks match {args.pattern!r}', file=sys.stderr)
+        return 1
+    results = run(names, repeat=args.repeat)
+    for name, timing in results['benchmarks'].items():
+        print(f"{name:<32} {timing['median'] * 1e6:>12.2f} us", file=sys.stderr)
+    write_results(results, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
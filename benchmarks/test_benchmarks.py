@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks.workloads import BENCHMARKS
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark(benchmark, name):
+    benchmark(BENCHMARKS[name])
@@ -0,0 +1,246 @@
+"""
+Representative workloads for the benchmark suite.
+
+Every benchmark is a zero-argument callable registered in `BENCHMARKS` under a
+stable `<workload>.<operation>` name. The inputs are built once, up front, so
+that only the library code under test is timed.
+"""
+import random
+from dataclasses import dataclass, field, make_dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+from dataclasses_json import (CatchAll, DataClassJsonMixin, LetterCase,
+                              Undefined, dataclass_json)
+
+BENCHMARKS: Dict[str, Callable[[], object]] = {}
+
+_random = random.Random(1234)
+
+
+def benchmark(name: str):
+    def register(fn: Callable[[], object]) -> Callable[[], object]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name {name}")
+        BENCHMARKS[name] = fn
+        return fn
+
+    return register
+
+
+# flat, wide records ----------------------------------------------------------
+
+_WIDE_TYPES = (int, float, str, bool, Optional[int])
+Wide = make_dataclass(
+    'Wide',
+    [(f'field_{i}', _WIDE_TYPES[i % len(_WIDE_TYPES)]) for i in range(40)],
+    bases=(DataClassJsonMixin,))
+
+
+def _wide_value(type_, i):
+    if type_ is str:
+        return f'value {i}'
+    if type_ is bool:
+        return i % 2 == 0
+    if type_ is float:
+        return i * 0.5
+    return i
+
+
+wide_dict = {f'field_{i}': _wide_value(_WIDE_TYPES[i % len(_WIDE_TYPES)], i)
+             for i in range(40)}
+wide = Wide.from_dict(wide_dict)
+
+
+@benchmark('flat_wide.from_dict')
+def flat_wide_from_dict():
+    return Wide.from_dict(wide_dict)
+
+
+@benchmark('flat_wide.to_dict')
+def flat_wide_to_dict():
+    return wide.to_dict()
+
+
+# deep nesting ----------------------------------------------------------------
+
+@dataclass
+class Node(DataClassJsonMixin):
+    value: int
+    child: Optional['Node'] = None
+
+
+def _chain_dict(depth):
+    node = None
+    for value in range(depth):
+        node = {'value': value, 'child': node}
+    return node
+
+
+deep_dict = _chain_dict(50)
+deep = Node.from_dict(deep_dict)
+
+
+@benchmark('deep_nesting.from_dict')
+def deep_nesting_from_dict():
+    return Node.from_dict(deep_dict)
+
+
+@benchmark('deep_nesting.to_dict')
+def deep_nesting_to_dict():
+    return deep.to_dict()
+
+
+# large numeric vectors -------------------------------------------------------
+
+@dataclass
+class Series(DataClassJsonMixin):
+    name: str
+    points: List[float]
+
+
+series_dict = {'name': 'series',
+               'points': [_random.random() for _ in range(10_000)]}
+series = Series.from_dict(series_dict)
+
+
+@benchmark('float_list.from_dict')
+def float_list_from_dict():
+    return Series.from_dict(series_dict)
+
+
+@benchmark('float_list.to_dict')
+def float_list_to_dict():
+    return series.to_dict()
+
+
+# unions ----------------------------------------------------------------------
+
+@dataclass
+class Circle(DataClassJsonMixin):
+    radius: float
+
+
+@dataclass
+class Rectangle(DataClassJsonMixin):
+    width: float
+    height: float
+
+
+@dataclass
+class Drawing(DataClassJsonMixin):
+    shapes: List[Union[Rectangle, Circle]]
+
+
+drawing_dict = {'shapes': [{'radius': 1.0} if i % 2 else
+                           {'width': 1.0, 'height': 2.0}
+                           for i in range(200)]}
+drawing = Drawing.from_dict(drawing_dict)
+
+
+@benchmark('unions.from_dict')
+def unions_from_dict():
+    return Drawing.from_dict(drawing_dict)
+
+
+@benchmark('unions.to_dict')
+def unions_to_dict():
+    return drawing.to_dict()
+
+
+# undefined parameters (INCLUDE) ----------------------------------------------
+
+@dataclass_json(undefined=Undefined.INCLUDE)
+@dataclass
+class WithUnknown:
+    id: int
+    name: str
+    unknown: CatchAll = field(default_factory=dict)
+
+
+unknown_dict = {'id': 1, 'name': 'name',
+                **{f'extra_{i}': i for i in range(10)}}
+with_unknown = WithUnknown.from_dict(unknown_dict)  # type: ignore[attr-defined]
+
+
+@benchmark('undefined_include.from_dict')
+def undefined_include_from_dict():
+    return WithUnknown.from_dict(unknown_dict)  # type: ignore[attr-defined]
+
+
+@benchmark('undefined_include.to_dict')
+def undefined_include_to_dict():
+    return with_unknown.to_dict()
+
+
+# letter case -----------------------------------------------------------------
+
+@dataclass_json(letter_case=LetterCase.CAMEL)  # type: ignore[arg-type]
+@dataclass
+class Camel:
+    first_name: str
+    last_name: str
+    date_of_birth: float
+    favourite_colour: Optional[str] = None
+
+
+camel_dict = {'firstName': 'Ada', 'lastName': 'Lovelace',
+              'dateOfBirth': -4_865_011_200.0, 'favouriteColour': 'green'}
+camel = Camel.from_dict(camel_dict)  # type: ignore[attr-defined]
+
+
+@benchmark('letter_case.from_dict')
+def letter_case_from_dict():
+    return Camel.from_dict(camel_dict)  # type: ignore[attr-defined]
+
+
+@benchmark('letter_case.to_dict')
+def letter_case_to_dict():
+    return camel.to_dict()
+
+
+# marshmallow schema with many=True --------------------------------------------
+
+@dataclass
+class Person(DataClassJsonMixin):
+    name: str
+    age: int
+    email: Optional[str]
+
+
+people_dicts = [{'name': f'person {i}', 'age': i, 'email': None}
+                for i in range(100)]
+people = [Person.from_dict(person) for person in people_dicts]
+person_schema = Person.schema()
+
+
+@benchmark('schema_many.load')
+def schema_many_load():
+    return person_schema.load(people_dicts, many=True)
+
+
+@benchmark('schema_many.dump')
+def schema_many_dump():
+    return person_schema.dump(people, many=True)
+
+
+# end-to-end JSON -------------------------------------------------------------
+
+@dataclass
+class Team(DataClassJsonMixin):
+    name: str
+    members: List[Person]
+    tags: Dict[str, str]
+
+
+team = Team('team', people[:20], {f'key {i}': f'tag {i}' for i in range(20)})
+team_json = team.to_json()
+
+
+@benchmark('json.from_json')
+def json_from_json():
+    return Team.from_json(team_json)
+
+
+@benchmark('json.to_json')
+def json_to_json():
+    return team.to_json()
@@ -1,12 +1,16 @@
 # flake8: noqa
 from dataclasses_json.api import (DataClassJsonMixin,
-                                  dataclass_json)
+                                  dataclass_json, materialize)
+from dataclasses_json.columns import Columns
 from dataclasses_json.cfg import (config, global_config,
-                                  Exclude, LetterCase)
+                                  Exclude, LetterCase, WarningPolicy,
+                                  refresh_local_timezone)
+from dataclasses_json.core import NOT_DECODED
 from dataclasses_json.undefined import CatchAll, Undefined
 
 from dataclasses_json.__version__ import __version__
 
-__all__ = ['DataClassJsonMixin', 'LetterCase', 'dataclass_json',
-           'config', 'global_config', 'Exclude',
-           'CatchAll', 'Undefined']
+__all__ = ['DataClassJsonMixin', 'LetterCase', 'dataclass_json', 'materialize',
+           'config', 'global_config', 'Exclude', 'WarningPolicy',
+           'CatchAll', 'Undefined', 'refresh_local_timezone', 'NOT_DECODED',
+           'Columns']
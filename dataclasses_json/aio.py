@@ -0,0 +1,352 @@
+"""
+Streaming decoding and encoding for asyncio.
+
+    async for order in Order.aiter_jsonl(reader):   # e.g. an asyncio.StreamReader
+        ...
+
+    await write_jsonl(orders, writer)               # e.g. an asyncio.StreamWriter
+
+    orders = await Order.from_dict_many_async(records)
+
+Streams are consumed incrementally, so a long-lived connection can be decoded
+as the data arrives. To not block the event loop on large batches, control is
+handed back to it every `yield_every` records, or after every chunk of
+`from_dict_many_async`.
+"""
+import asyncio
+import codecs
+import json
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (Any, AsyncIterable, AsyncIterator, Iterable, List,
+                    Optional, Type, TypeVar, Union)
+
+from dataclasses_json.core import (_ExtendedEncoder, _asdict,
+                                   _decode_dataclass, _records)
+from dataclasses_json.parallel import _check_picklable, _decode_chunk
+
+T = TypeVar('T')
+
+Chunks = AsyncIterable[Union[bytes, str]]
+
+_WHITESPACE = ' \t\n\r'
+# the rest of a string after its opening quote, up to the closing quote or to
+# the end of the text (then `closing` is '' or a pending backslash)
+_STRING_REST_PATTERN = r'[^"\\]*(?:\\.[^"\\]*)*(?P<closing>"|\\?\Z)'
+_STRING_REST = re.compile(_STRING_REST_PATTERN, re.S)
+# a complete or incomplete string, or a bracket
+_STRUCTURE = re.compile(r'"' + _STRING_REST_PATTERN + r'|[][{}]', re.S)
+_SCALAR_END = re.compile(r'[ \t\n\r,\]]')
+
+
+async def aiter_jsonl(cls: Type[T], stream: Chunks, *,
+                      infer_missing: bool = False,
+                      yield_every: int = 100) -> AsyncIterator[T]:
+    """
+    Decodes JSON Lines (one JSON object per line) from an async iterable of
+    `bytes` or `str` chunks, which may split lines anywhere.
+    """
+    _check_positive('yield_every', yield_every)
+    decode = _text_decoder()
+    pending: List[str] = []
+    count = 0
+    async for chunk in stream:
+        for line in _split_lines(pending, decode(chunk)):
+            if line.strip():
+                yield _decode_dataclass(cls, json.loads(line), infer_missing)
+                count += 1
+                if count % yield_every == 0:
+                    await asyncio.sleep(0)
+    pending.append(decode(b'', final=True))
+    line = ''.join(pending)
+    if line.strip():
+        yield _decode_dataclass(cls, json.loads(line), infer_missing)
+
+
+def _split_lines(pending: List[str], text: str) -> List[str]:
+    """
+    The lines completed by `text`. `pending` holds the pieces of the
+    incomplete last line, which are only joined once the line is complete.
+    """
+    lines = []
+    start = 0
+    newline = text.find('\n')
+    while newline >= 0:
+        pending.append(text[start:newline])
+        lines.append(''.join(pending))
+        pending.clear()
+        start = newline + 1
+        newline = text.find('\n', start)
+    pending.append(text[start:])
+    return lines
+
+
+async def aiter_json(cls: Type[T], stream: Chunks, *,
+                     infer_missing: bool = False,
+                     yield_every: int = 100) -> AsyncIterator[T]:
+    """
+    Decodes the elements of a JSON array from an async iterable of `bytes` or
+    `str` chunks, yielding every element as soon as it is complete.
+    """
+    _check_positive('yield_every', yield_every)
+    decode = _text_decoder()
+    parser = _ArrayParser()
+    count = 0
+    async for chunk in stream:
+        for kvs in parser.feed(decode(chunk)):
+            yield _decode_dataclass(cls, kvs, infer_missing)
+            count += 1
+            if count % yield_every == 0:
+                await asyncio.sleep(0)
+    for kvs in parser.feed(decode(b'', final=True), final=True):
+        yield _decode_dataclass(cls, kvs, infer_missing)
+
+
+async def decode_many(cls: Type[T], data: Any, *,
+                      layout: str = 'records',
+                      infer_missing: bool = False,
+                      chunk_size: int = 500,
+                      max_stall: Optional[float] = None,
+                      executor: Optional[Executor] = None) -> List[T]:
+    """
+    Decodes already parsed records like `from_dict_many`, `chunk_size`
+    records at a time, and hands control back to the event loop between the
+    chunks.
+
+    With `max_stall` (in seconds) the size of the chunks is adapted to how
+    long decoding the previous chunk took, so that no chunk blocks the event
+    loop for much longer than `max_stall`. With an `executor`, the chunks are
+    decoded in it and the event loop only waits for the results.
+    """
+    _check_positive('chunk_size', chunk_size)
+    records = _records(data, layout)
+    if not isinstance(records, list):
+        records = list(records)
+    if executor is not None:
+        if isinstance(executor, ProcessPoolExecutor):
+            _check_picklable(cls)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, _decode_chunk,
+                                 (cls, records[i:i + chunk_size], 'records',
+                                  infer_missing, False))
+            for i in range(0, len(records), chunk_size)))
+        return [instance for result in results for instance in result]
+
+    instances: List[T] = []
+    size = chunk_size
+    start = 0
+    while start < len(records):
+        began = time.perf_counter()
+        end = min(start + size, len(records))
+        for index in range(start, end):
+            instances.append(_decode_dataclass(cls, records[index],
+                                               infer_missing))
+        if max_stall is not None:
+            elapsed = time.perf_counter() - began
+            size = (max(1, int((end - start) * max_stall / elapsed))
+                    if elapsed > 0 else size * 2)
+        start = end
+        if start < len(records):
+            await asyncio.sleep(0)
+    return instances
+
+
+async def write_jsonl(objs: Iterable[Any], writer, *,
+                      chunk_size: int = 100) -> None:
+    """
+    Encodes dataclass instances as JSON Lines to `writer` (e.g. an
+    `asyncio.StreamWriter`), `chunk_size` lines per write. Waits for
+    `writer.drain()` after every write, so a slow reader slows the encoding
+    down instead of filling up memory.
+    """
+    lines = []
+    for obj in objs:
+        lines.append(_dumps(obj))
+        if len(lines) == chunk_size:
+            await _write(writer, '\n'.join(lines) + '\n')
+            lines = []
+    if lines:
+        await _write(writer, '\n'.join(lines) + '\n')
+
+
+async def write_json(objs: Iterable[Any], writer, *,
+                     chunk_size: int = 100) -> None:
+    """Like `write_jsonl`, but writes a single JSON array."""
+    items = []
+    head = '['
+    for obj in objs:
+        items.append(_dumps(obj))
+        if len(items) == chunk_size:
+            await _write(writer, head + ', '.join(items))
+            items, head = [], ', '
+    if items:
+        await _write(writer, head + ', '.join(items) + ']')
+    else:
+        await _write(writer, '[]' if head == '[' else ']')
+
+
+def _dumps(obj) -> str:
+    return json.dumps(_asdict(obj), cls=_ExtendedEncoder)
+
+
+async def _write(writer, text: str) -> None:
+    writer.write(text.encode())
+    await writer.drain()
+    # `drain` only suspends while the transport's buffer is full
+    await asyncio.sleep(0)
+
+
+def _check_positive(name: str, value: int) -> None:
+    if value <= 0:
+        raise ValueError(f"`{name}` must be positive, got {value!r}")
+
+
+def _text_decoder():
+    # decodes UTF-8 incrementally, a chunk may end in the middle of a
+    # multi-byte character
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+
+    def decode(chunk, final=False):
+        if isinstance(chunk, str):
+            return chunk
+        return utf8.decode(chunk, final)
+
+    return decode
+
+
+class _ArrayParser:
+    """
+    Incremental parser of a JSON array: `feed` returns the elements that are
+    complete so far.
+
+    Elements that are complete in the fed text are decoded right away. The
+    text of an incomplete element is kept in pieces together with where the
+    scan for its end stopped (nesting depth, inside a string or not), so that
+    every character is scanned only once even if the element arrives in many
+    small chunks, and is decoded once it is complete.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        # 'start' before the '[', 'first' / 'element' / 'separator' inside
+        # the array, 'value' while scanning an element, 'end' after the ']'
+        self._state = 'start'
+        self._pieces: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        # a number, `true`, `false` or `null`, which ends at a delimiter
+        self._scalar = False
+
+    def feed(self, text: str, final: bool = False) -> list:
+        pos = 0
+        elements = []
+        while True:
+            if self._state == 'value':
+                end = self._scan(text, pos)
+                if end is None:
+                    self._pieces.append(text[pos:])
+                    break
+                self._pieces.append(text[pos:end])
+                elements.append(self._decode())
+                pos = end
+                continue
+            pos = _skip_whitespace(text, pos)
+            if pos == len(text):
+                break
+            char = text[pos]
+            if self._state == 'start':
+                if char != '[':
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                self._state = 'first'
+                pos += 1
+            elif self._state in ('first', 'separator') and char == ']':
+                self._state = 'end'
+                pos += 1
+            elif self._state == 'separator':
+                if char != ',':
+                    raise ValueError(f"Expected ',' or ']' in JSON array, "
+                                     f"got {char!r}")
+                self._state = 'element'
+                pos += 1
+            elif self._state in ('first', 'element'):
+                scalar = char not in '[{"'
+                try:
+                    element, end = self._decoder.raw_decode(text, pos)
+                except json.JSONDecodeError:
+                    end = None
+                # a number at the end of the text may continue in the next
+                if end is not None and (end < len(text) or not scalar
+                                        or final):
+                    elements.append(element)
+                    self._state = 'separator'
+                    pos = end
+                else:
+                    # incomplete (or invalid), scan it as the text arrives
+                    self._state = 'value'
+                    self._scalar = scalar
+            else:
+                raise ValueError(f"Unexpected {char!r} after the JSON array")
+        if final:
+            # a number at the very end of the text
+            if self._state == 'value' and self._scalar:
+                elements.append(self._decode())
+            if self._state != 'end':
+                raise ValueError("Incomplete JSON array")
+        return elements
+
+    def _scan(self, text: str, pos: int) -> Optional[int]:
+        """
+        Continues scanning the current element at `pos`: the index right
+        after its end, or `None` if it doesn't end in `text`.
+        """
+        if self._scalar:
+            match = _SCALAR_END.search(text, pos)
+            return match.start() if match is not None else None
+        if self._in_string:
+            if self._escaped:
+                if pos == len(text):
+                    return None
+                pos += 1
+                self._escaped = False
+            # always matches, at least up to the end of the text
+            match = _STRING_REST.match(text, pos)
+            if match is None or not self._string_ends(match):
+                return None
+            pos = match.end()
+            if self._depth == 0:
+                return pos
+        while True:
+            match = _STRUCTURE.search(text, pos)
+            if match is None:
+                return None
+            pos = match.end()
+            token = match.group()
+            if token[0] == '"':
+                if not self._string_ends(match):
+                    return None
+            else:
+                self._depth += 1 if token in '[{' else -1
+            if self._depth == 0:
+                return pos
+
+    def _string_ends(self, match) -> bool:
+        # whether the string matched by `_STRING_REST` is closed in the text
+        closing = match.group('closing')
+        self._in_string = closing != '"'
+        self._escaped = closing == '\\'
+        return not self._in_string
+
+    def _decode(self) -> Any:
+        text = ''.join(self._pieces)
+        self._pieces = []
+        self._state = 'separator'
+        return self._decoder.decode(text)
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
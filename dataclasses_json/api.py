@@ -1,15 +1,31 @@
 import abc
 import json
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, overload
+from collections.abc import Collection as ABCCollection, Mapping as ABCMapping
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Collection, Dict, Iterable, List, Optional,
+                    Tuple, Type, TypeVar, Union, overload)
 
+from dataclasses_json.cache import _decode_cache
 from dataclasses_json.cfg import config, LetterCase
 from dataclasses_json.core import (Json, _ExtendedEncoder, _asdict,
-                                   _decode_dataclass)
+                                   _decode_dataclass, _decode_many,
+                                   _encode_many, _memo_get, _memo_set,
+                                   _memoizes, _records)
+from dataclasses_json.columns import Columns, _decode_columns
 from dataclasses_json.mm import (JsonData, SchemaType, build_schema)
 from dataclasses_json.undefined import Undefined
 from dataclasses_json.utils import (_handle_undefined_parameters_safe,
+                                    _parse_field_paths,
                                     _undefined_parameter_action_safe)
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import Literal  # 3.8+
+
+    # imported on first use, asyncio is slow to import
+    from dataclasses_json.aio import Chunks
+
 A = TypeVar('A', bound="DataClassJsonMixin")
 T = TypeVar('T')
 Fields = List[Tuple[str, Any]]
@@ -33,18 +49,80 @@ class DataClassJsonMixin(abc.ABC):
                 separators: Optional[Tuple[str, str]] = None,
                 default: Optional[Callable] = None,
                 sort_keys: bool = False,
+                include: Optional[Collection[str]] = None,
+                exclude: Optional[Collection[str]] = None,
                 **kw) -> str:
-        return json.dumps(self.to_dict(encode_json=False),
-                          cls=_ExtendedEncoder,
-                          skipkeys=skipkeys,
-                          ensure_ascii=ensure_ascii,
-                          check_circular=check_circular,
-                          allow_nan=allow_nan,
-                          indent=indent,
-                          separators=separators,
-                          default=default,
-                          sort_keys=sort_keys,
-                          **kw)
+        memo_key = None
+        if (include is None and exclude is None and not kw
+                and _memoizes(type(self))):
+            memo_key = ('json', skipkeys, ensure_ascii, check_circular,
+                        allow_nan, indent, separators, default, sort_keys)
+            memoized = _memo_get(self, memo_key)
+            if memoized is not None:
+                return memoized
+        s = json.dumps(self.to_dict(encode_json=False, include=include,
+                                    exclude=exclude),
+                       cls=_ExtendedEncoder,
+                       skipkeys=skipkeys,
+                       ensure_ascii=ensure_ascii,
+                       check_circular=check_circular,
+                       allow_nan=allow_nan,
+                       indent=indent,
+                       separators=separators,
+                       default=default,
+                       sort_keys=sort_keys,
+                       **kw)
+        if memo_key is not None:
+            _memo_set(self, memo_key, s)
+        return s
+
+    @classmethod
+    def to_json_many(cls: Type[A],
+                     objs: Iterable[A],
+                     *,
+                     layout: str = 'records',
+                     **kw) -> str:
+        """
+        Encodes a list of instances as a JSON array of objects (`records`), or
+        as a table with the field names listed once:
+        `{"fields": [...], "rows": [[...], ...]}` (`rows`) or
+        `{"fields": [...], "columns": [[...], ...]}` (`columns`). `kw` are
+        passed to `json.dumps`.
+        """
+        kw.setdefault('cls', _ExtendedEncoder)
+        return json.dumps(_encode_many(cls, objs, layout=layout), **kw)
+
+    @overload
+    @classmethod
+    def from_json_many(cls: Type[A], s: JsonData, *, layout: str = ...,
+                       infer_missing=..., columnar: "Literal[False]" = ...,
+                       **kw) -> List[A]: ...
+
+    @overload
+    @classmethod
+    def from_json_many(cls: Type[A], s: JsonData, *, layout: str = ...,
+                       infer_missing=..., columnar: "Literal[True]",
+                       **kw) -> Columns[A]: ...
+
+    @classmethod
+    def from_json_many(cls: Type[A],
+                       s: JsonData,
+                       *,
+                       layout: str = 'records',
+                       infer_missing=False,
+                       columnar: bool = False,
+                       **kw) -> Union[List[A], Columns[A]]:
+        """
+        Decodes a list of instances encoded by `to_json_many` with the same
+        `layout`, see `from_dict_many`. `kw` are passed to `json.loads`.
+
+        To decode in several processes, pass the documents unparsed to
+        `dataclasses_json.parallel.parallel_decode` instead.
+        """
+        data = json.loads(s, **kw)
+        return cls.from_dict_many(data, layout=layout,
+                                  infer_missing=infer_missing,
+                                  columnar=columnar)  # type: ignore[call-overload]
 
     @classmethod
     def from_json(cls: Type[A],
@@ -54,23 +132,108 @@ class DataClassJsonMixin(abc.ABC):
                   parse_int=None,
                   parse_constant=None,
                   infer_missing=False,
+                  lazy=False,
+                  only=None,
                   **kw) -> A:
+        cache = _decode_cache(cls)
+        if (cache is not None and not lazy and only is None and not kw
+                and parse_float is None and parse_int is None
+                and parse_constant is None):
+            return cache.decode(s, infer_missing)
         kvs = json.loads(s,
                          parse_float=parse_float,
                          parse_int=parse_int,
                          parse_constant=parse_constant,
                          **kw)
-        return cls.from_dict(kvs, infer_missing=infer_missing)
+        return cls.from_dict(kvs, infer_missing=infer_missing, lazy=lazy,
+                             only=only)
 
     @classmethod
     def from_dict(cls: Type[A],
                   kvs: Json,
                   *,
-                  infer_missing=False) -> A:
-        return _decode_dataclass(cls, kvs, infer_missing)
+                  infer_missing=False,
+                  lazy=False,
+                  only: Optional[Collection[str]] = None) -> A:
+        return _decode_dataclass(
+            cls, kvs, infer_missing, lazy=lazy,
+            only=_parse_field_paths(only) if only is not None else None)
+
+    @overload
+    @classmethod
+    def from_dict_many(cls: Type[A], data: Json, *, layout: str = ...,
+                       infer_missing=..., columnar: "Literal[False]" = ...) -> List[A]: ...
+
+    @overload
+    @classmethod
+    def from_dict_many(cls: Type[A], data: Json, *, layout: str = ...,
+                       infer_missing=..., columnar: "Literal[True]") -> Columns[A]: ...
+
+    @classmethod
+    def from_dict_many(cls: Type[A],
+                       data: Json,
+                       *,
+                       layout: str = 'records',
+                       infer_missing=False,
+                       columnar: bool = False) -> Union[List[A], Columns[A]]:
+        """
+        Decodes a list of records in one of the layouts of `to_json_many`
+        into a list of instances or, with `columnar=True`, into `Columns`:
+        one list of decoded values per field and row views that build an
+        instance only on demand.
+        """
+        if columnar:
+            return _decode_columns(cls, _records(data, layout), infer_missing)
+        return _decode_many(cls, data, infer_missing, layout=layout)
+
+    @classmethod
+    def from_dict_many_async(cls: Type[A],
+                             data: Json,
+                             *,
+                             layout: str = 'records',
+                             infer_missing=False,
+                             chunk_size: int = 500,
+                             max_stall: Optional[float] = None,
+                             executor: Optional["Executor"] = None) -> Awaitable[List[A]]:
+        """
+        Like `from_dict_many`, but decodes in chunks and yields to the event
+        loop in between (or decodes in `executor`), see
+        `dataclasses_json.aio.decode_many`.
+        """
+        from dataclasses_json.aio import decode_many
+        return decode_many(cls, data, layout=layout,
+                           infer_missing=infer_missing, chunk_size=chunk_size,
+                           max_stall=max_stall, executor=executor)
 
-    def to_dict(self, encode_json=False) -> Dict[str, Json]:
-        return _asdict(self, encode_json=encode_json)
+    @classmethod
+    def aiter_json(cls: Type[A], stream: "Chunks", *,
+                   infer_missing=False,
+                   yield_every: int = 100) -> AsyncIterator[A]:
+        """
+        Decodes the records of a JSON array from an async stream of chunks
+        (e.g. an `asyncio.StreamReader`) as they arrive, see
+        `dataclasses_json.aio`.
+        """
+        from dataclasses_json.aio import aiter_json
+        return aiter_json(cls, stream, infer_missing=infer_missing,
+                          yield_every=yield_every)
+
+    @classmethod
+    def aiter_jsonl(cls: Type[A], stream: "Chunks", *,
+                    infer_missing=False,
+                    yield_every: int = 100) -> AsyncIterator[A]:
+        """Like `aiter_json`, but decodes JSON Lines."""
+        from dataclasses_json.aio import aiter_jsonl
+        return aiter_jsonl(cls, stream, infer_missing=infer_missing,
+                           yield_every=yield_every)
+
+    def to_dict(self, encode_json=False, *,
+                include: Optional[Collection[str]] = None,
+                exclude: Optional[Collection[str]] = None) -> Dict[str, Json]:
+        return _asdict(
+            self, encode_json=encode_json,
+            include=_parse_field_paths(include) if include is not None else None,
+            exclude=_parse_field_paths(exclude) if exclude is not None else None)
 
     @classmethod
     def schema(cls: Type[A],
@@ -102,18 +265,48 @@ class DataClassJsonMixin(abc.ABC):
                       unknown=unknown)
 
 
+def materialize(obj: T) -> T:
+    """
+    Force the decoding of all fields of an instance (recursively) that was
+    decoded with `lazy=True`. Returns the instance itself.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        for field in fields(obj):
+            materialize(getattr(obj, field.name))
+    elif isinstance(obj, ABCMapping):
+        for value in obj.values():
+            materialize(value)
+    elif (isinstance(obj, ABCCollection)
+          and not isinstance(obj, (str, bytes, Enum))):
+        for value in obj:
+            materialize(value)
+    return obj
+
+
 @overload
 def dataclass_json(_cls: None = ..., *, letter_case: Optional[LetterCase] = ...,
-                   undefined: Optional[Union[str, Undefined]] = ...) -> Callable[[Type[T]], Type[T]]: ...
+                   undefined: Optional[Union[str, Undefined]] = ...,
+                   trust_init: Optional[bool] = ...,
+                   intern: Optional[bool] = ...,
+                   memoize: Optional[bool] = ...,
+                   decode_cache: Optional[int] = ...) -> Callable[[Type[T]], Type[T]]: ...
 
 
 @overload
 def dataclass_json(_cls: Type[T], *, letter_case: Optional[LetterCase] = ...,
-                   undefined: Optional[Union[str, Undefined]] = ...) -> Type[T]: ...
+                   undefined: Optional[Union[str, Undefined]] = ...,
+                   trust_init: Optional[bool] = ...,
+                   intern: Optional[bool] = ...,
+                   memoize: Optional[bool] = ...,
+                   decode_cache: Optional[int] = ...) -> Type[T]: ...
 
 
 def dataclass_json(_cls: Optional[Type[T]] = None, *, letter_case: Optional[LetterCase] = None,
-                   undefined: Optional[Union[str, Undefined]] = None) -> Union[Callable[[Type[T]], Type[T]], Type[T]]:
+                   undefined: Optional[Union[str, Undefined]] = None,
+                   trust_init: Optional[bool] = None,
+                   intern: Optional[bool] = None,
+                   memoize: Optional[bool] = None,
+                   decode_cache: Optional[int] = None) -> Union[Callable[[Type[T]], Type[T]], Type[T]]:
     """
     Based on the code in the `dataclasses` module to handle optional-parens
     decorators. See example below:
@@ -122,10 +315,20 @@ def dataclass_json(_cls: Optional[Type[T]] = None, *, letter_case: Optional[Lett
     @dataclass_json(letter_case=LetterCase.CAMEL)
     class Example:
         ...
+
+    With `trust_init=True` decoded instances are built without calling
+    `__init__`: the decoded fields are assigned directly and `__post_init__`
+    is called if defined. Only use it if `__init__` does nothing else.
+
+    With `intern=True` all decoded strings are interned, and with
+    `memoize=True` instances of a frozen class are encoded only once. With
+    `decode_cache=n`, `from_json` caches the instances decoded from the last
+    `n` documents. See `config`.
     """
 
     def wrap(cls: Type[T]) -> Type[T]:
-        return _process_class(cls, letter_case, undefined)
+        return _process_class(cls, letter_case, undefined, trust_init, intern,
+                              memoize, decode_cache)
 
     if _cls is None:
         return wrap
@@ -133,15 +336,31 @@ def dataclass_json(_cls: Optional[Type[T]] = None, *, letter_case: Optional[Lett
 
 
 def _process_class(cls: Type[T], letter_case: Optional[LetterCase],
-                   undefined: Optional[Union[str, Undefined]]) -> Type[T]:
-    if letter_case is not None or undefined is not None:
+                   undefined: Optional[Union[str, Undefined]],
+                   trust_init: Optional[bool] = None,
+                   intern: Optional[bool] = None,
+                   memoize: Optional[bool] = None,
+                   decode_cache: Optional[int] = None) -> Type[T]:
+    if (letter_case is not None or undefined is not None or trust_init is not None
+            or intern is not None or memoize is not None or decode_cache is not None):
         cls.dataclass_json_config = config(letter_case=letter_case,  # type: ignore[attr-defined]
-                                           undefined=undefined)['dataclasses_json']
+                                           undefined=undefined,
+                                           trust_init=trust_init,
+                                           intern=intern,
+                                           memoize=memoize,
+                                           decode_cache=decode_cache)['dataclasses_json']
 
     cls.to_json = DataClassJsonMixin.to_json  # type: ignore[attr-defined]
     # unwrap and rewrap classmethod to tag it to cls rather than the literal
     # DataClassJsonMixin ABC
     cls.from_json = classmethod(DataClassJsonMixin.from_json.__func__)  # type: ignore[attr-defined]
+    cls.to_json_many = classmethod(DataClassJsonMixin.to_json_many.__func__)  # type: ignore[attr-defined]
+    cls.from_json_many = classmethod(DataClassJsonMixin.from_json_many.__func__)  # type: ignore[attr-defined]
+    cls.from_dict_many = classmethod(DataClassJsonMixin.from_dict_many.__func__)  # type: ignore[attr-defined]
+    cls.from_dict_many_async = classmethod(  # type: ignore[attr-defined]
+        DataClassJsonMixin.from_dict_many_async.__func__)  # type: ignore[attr-defined]
+    cls.aiter_json = classmethod(DataClassJsonMixin.aiter_json.__func__)  # type: ignore[attr-defined]
+    cls.aiter_jsonl = classmethod(DataClassJsonMixin.aiter_jsonl.__func__)  # type: ignore[attr-defined]
     cls.to_dict = DataClassJsonMixin.to_dict  # type: ignore[attr-defined]
     cls.from_dict = classmethod(DataClassJsonMixin.from_dict.__func__)  # type: ignore[attr-defined]
     cls.schema = classmethod(DataClassJsonMixin.schema.__func__)  # type: ignore[attr-defined]
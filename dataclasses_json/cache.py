@@ -0,0 +1,137 @@
+"""
+Caching of decoded instances by their JSON document.
+
+    @dataclass_json(decode_cache=256)
+    @dataclass(frozen=True)
+    class FeatureFlags:
+        ...
+
+    FeatureFlags.from_json(blob)        # decoded once, then served from the cache
+    decode_cache_info(FeatureFlags)     # DecodeCacheInfo(hits=41, misses=1, ...)
+
+For services that decode the same small documents (config blobs, reference
+records) over and over. Instances of frozen classes are shared by all callers
+that decode the same document; for other classes every hit returns a deep
+copy of the cached instance, which is still much faster than decoding.
+"""
+import copy
+import json
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Optional
+
+from dataclasses_json import cfg, stats
+from dataclasses_json.core import _decode_dataclass
+from dataclasses_json.utils import _class_cached
+
+DecodeCacheInfo = namedtuple('DecodeCacheInfo',
+                             ['hits', 'misses', 'evictions', 'entries',
+                              'max_entries', 'size', 'max_size'])
+
+# the total length of the cached documents, by default
+DEFAULT_MAX_SIZE = 1 << 20
+
+
+class _DecodeCache:
+    """
+    A least recently used cache of the instances of one class, keyed by the
+    JSON document (`str` or `bytes`) they were decoded from. At most
+    `max_entries` instances are kept, of documents with a total length of at
+    most `max_size`; documents longer than that are never cached. The cache
+    is emptied whenever the global config changes.
+    """
+
+    def __init__(self, cls, max_entries: int, max_size: int):
+        self._cls = cls
+        self._frozen = cls.__dataclass_params__.frozen
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._version = cfg.global_config.version
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def decode(self, s, infer_missing: bool):
+        if type(s) not in (str, bytes) or len(s) > self.max_size:
+            return _decode_dataclass(self._cls, json.loads(s), infer_missing)
+        key = (s, infer_missing)
+        version = cfg.global_config.version
+        with self._lock:
+            if self._version != version:
+                self._clear()
+                self._version = version
+            instance = self._entries.get(key)
+            if instance is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if stats._enabled:
+            stats._increment('decode_cache_hits' if instance is not None
+                             else 'decode_cache_misses',
+                             self._cls.__qualname__)
+        if instance is None:
+            instance = _decode_dataclass(self._cls, json.loads(s),
+                                         infer_missing)
+            self._put(key, instance, version)
+        return instance if self._frozen else copy.deepcopy(instance)
+
+    def _put(self, key, instance, version) -> None:
+        with self._lock:
+            # decoded with an outdated config, or by a concurrent miss
+            if self._version != version or key in self._entries:
+                return
+            self._entries[key] = instance
+            self._size += len(key[0])
+            while (len(self._entries) > self.max_entries
+                   or self._size > self.max_size):
+                (s, _), _ = self._entries.popitem(last=False)
+                self._size -= len(s)
+                self.evictions += 1
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> DecodeCacheInfo:
+        with self._lock:
+            return DecodeCacheInfo(self.hits, self.misses, self.evictions,
+                                   len(self._entries), self.max_entries,
+                                   self._size, self.max_size)
+
+
+@_class_cached
+def _decode_cache(cls: Any) -> Optional[_DecodeCache]:
+    """The decode cache of `cls`, if it is configured with `decode_cache`."""
+    cls_config = getattr(cls, 'dataclass_json_config', None) or {}
+    max_entries = cls_config.get('decode_cache')
+    if not max_entries:
+        return None
+    return _DecodeCache(cls, max_entries,
+                        cls_config.get('decode_cache_size', DEFAULT_MAX_SIZE))
+
+
+def decode_cache_info(cls) -> DecodeCacheInfo:
+    """
+    The hits, misses and evictions of the decode cache of `cls` since it was
+    created or last cleared, and its current and maximum number of entries
+    and size.
+    """
+    cache = _decode_cache(cls)
+    if cache is None:
+        raise ValueError(f"{cls.__qualname__} has no decode cache, configure "
+                         f"one with `decode_cache`")
+    return cache.info()
+
+
+def decode_cache_clear(cls) -> None:
+    """Empties the decode cache of `cls` and resets its statistics."""
+    cache = _decode_cache(cls)
+    if cache is not None:
+        cache.clear()
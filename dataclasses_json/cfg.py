@@ -1,12 +1,16 @@
+import array
 import functools
+import itertools
+from datetime import tzinfo
 from enum import Enum
-from typing import Callable, Dict, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
 
 from marshmallow.fields import Field as MarshmallowField  # type: ignore
 
 from dataclasses_json.stringcase import (camelcase, pascalcase, snakecase,
                                          spinalcase)  # type: ignore
 from dataclasses_json.undefined import Undefined, UndefinedParameterError
+from dataclasses_json.utils import _local_timezone
 
 T = TypeVar("T")
 
@@ -20,8 +24,77 @@ class Exclude:
     NEVER: Callable[[object], bool] = lambda _: False
 
 
-# TODO: add warnings?
+class WarningPolicy(Enum):
+    """
+    What to do with the warnings emitted for individual values while
+    encoding or decoding, e.g. a `None` value of a non-optional field.
+    """
+    # warn for every value (the default)
+    ALWAYS = 'always'
+    # warn only the first time for each warning site (class, field or type)
+    ONCE = 'once'
+    # don't warn, only count the warnings in `stats` under 'warnings'
+    AGGREGATE = 'aggregate'
+    # ignore the warnings altogether
+    OFF = 'off'
+    # raise the warning as an exception
+    RAISE = 'raise'
+
+
+_versions = itertools.count(1)
+
+
+class _VersionedDict(dict):
+    """
+    A dict that gives the global config a new version whenever it changes,
+    so that caches derived from it can tell that they are stale.
+    """
+
+    def _changed(self):
+        global_config._bump_version()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def pop(self, *args):
+        try:
+            return super().pop(*args)
+        finally:
+            self._changed()
+
+    def popitem(self):
+        try:
+            return super().popitem()
+        finally:
+            self._changed()
+
+    def setdefault(self, key, default=None):
+        try:
+            return super().setdefault(key, default)
+        finally:
+            self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def __ior__(self, other):  # type: ignore[misc]
+        self.update(other)
+        return self
+
+
 class _GlobalConfig:
+    # changes whenever the config does, see `_VersionedDict`
+    version: int
 
     def __init__(self):
         self.encoders: Dict[Union[type, Optional[type]], Callable] = {}
@@ -30,8 +103,23 @@ class _GlobalConfig:
             Union[type, Optional[type]],
             MarshmallowField
         ] = {}
+        # timezone that decoded timestamps are converted to, `None` means
+        # the local timezone of the machine
+        self.timestamp_tz: Optional[tzinfo] = None
+        self.warning_policy: WarningPolicy = WarningPolicy.ALWAYS
         # self._json_module = json
 
+    def __setattr__(self, name, value):
+        if name in ('encoders', 'decoders', 'mm_fields'):
+            # a copy: changes to the caller's dict can't bump the version
+            value = _VersionedDict(value)
+        super().__setattr__(name, value)
+        self._bump_version()
+
+    def _bump_version(self):
+        # `next` on a count is atomic, a plain `+= 1` is not
+        object.__setattr__(self, 'version', next(_versions))
+
     # TODO: #180
     # @property
     # def json_module(self):
@@ -47,6 +135,15 @@ class _GlobalConfig:
 global_config = _GlobalConfig()
 
 
+def refresh_local_timezone() -> None:
+    """
+    The local timezone used to decode timestamps is resolved once and cached.
+    Call this if the local UTC offset has changed since (e.g. after a DST
+    transition or after changing the `TZ` environment variable).
+    """
+    _local_timezone.cache_clear()
+
+
 class LetterCase(Enum):
     CAMEL = camelcase
     KEBAB = spinalcase
@@ -64,7 +161,35 @@ def config(metadata: Optional[dict] = None, *,
            undefined: Optional[Union[str, Undefined]] = None,
            field_name: Optional[str] = None,
            exclude: Optional[Callable[[T], bool]] = None,
+           trust_init: Optional[bool] = None,
+           dtype: Any = None,
+           compact: Optional[str] = None,
+           intern: Optional[bool] = None,
+           memoize: Optional[bool] = None,
+           decode_cache: Optional[int] = None,
+           decode_cache_size: Optional[int] = None,
            ) -> Dict[str, dict]:
+    """
+    The `metadata` of a dataclass field with the given overrides, or, as
+    `dataclass_json_config = config(...)['dataclasses_json']`, the overrides
+    of all fields of a class.
+
+    With `intern=True`, the strings of decoded values (also within lists and
+    dicts, and the keys of dicts, e.g. of a `CatchAll` field) are interned
+    with `sys.intern`: equal strings decoded from many documents share one
+    object instead of each record holding its own copy.
+
+    With `memoize=True` on a frozen class, `to_dict` and `to_json` (without
+    `include`, `exclude` or extra `json.dumps` arguments) encode an instance
+    only once and return the memoized result afterwards, which also speeds up
+    encoding the classes that contain it. The result is shared between calls,
+    so it must not be modified, and the instance must be deeply immutable: a
+    list in a frozen instance can still change.
+
+    With `decode_cache=n`, `from_json` keeps the instances decoded from the
+    last `n` distinct documents, with a total length of at most
+    `decode_cache_size`, see `dataclasses_json.cache`.
+    """
     if metadata is None:
         metadata = {}
 
@@ -107,4 +232,28 @@ def config(metadata: Optional[dict] = None, *,
     if exclude is not None:
         lib_metadata['exclude'] = exclude
 
+    if trust_init is not None:
+        lib_metadata['trust_init'] = trust_init
+
+    if dtype is not None:
+        lib_metadata['dtype'] = dtype
+
+    if compact is not None:
+        if compact not in array.typecodes:
+            raise ValueError(f"Invalid compact typecode {compact!r}, must "
+                             f"be one of {list(array.typecodes)}")
+        lib_metadata['compact'] = compact
+
+    if intern is not None:
+        lib_metadata['intern'] = intern
+
+    if memoize is not None:
+        lib_metadata['memoize'] = memoize
+
+    if decode_cache is not None:
+        lib_metadata['decode_cache'] = decode_cache
+
+    if decode_cache_size is not None:
+        lib_metadata['decode_cache_size'] = decode_cache_size
+
     return metadata
@@ -0,0 +1,135 @@
+"""
+Columnar ("struct of arrays") decoding of record lists.
+
+    table = Order.from_dict_many(records, columnar=True)
+    sum(table.columns['total'])   # no Order instances are created
+    table[0].total                # a row view, reading from the columns
+    table[0].instance()           # an Order, built on demand
+"""
+from typing import Any, Dict, Generic, Iterator, List, Type, TypeVar
+
+from dataclasses_json.core import (_construct_trusted, _decode_field,
+                                   _decode_letter_case_overrides,
+                                   _field_plan, _intern_strings,
+                                   _is_new_type, _prepare_kvs,
+                                   _type_hints, _user_overrides_or_exts,
+                                   _warn_none)
+
+T = TypeVar('T')
+
+
+class Columns(Generic[T]):
+    """
+    Decoded records of a dataclass stored as one list per init field. The
+    values are decoded like the fields of `from_dict` would be.
+    """
+
+    def __init__(self, cls: Type[T], columns: Dict[str, List[Any]],
+                 length: int):
+        self.cls = cls
+        self.columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> "Row[T]":
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Columns index out of range')
+        return Row(self, index)
+
+    def __iter__(self) -> Iterator["Row[T]"]:
+        for index in range(self._length):
+            yield Row(self, index)
+
+    def instances(self) -> List[T]:
+        """Builds all instances, as `from_dict_many` would have returned."""
+        return [row.instance() for row in self]
+
+    def __repr__(self) -> str:
+        return (f'Columns({self.cls.__name__}, {len(self)} rows, '
+                f'fields={list(self.columns)})')
+
+
+class Row(Generic[T]):
+    """
+    A view of one record of `Columns`: its fields are read as attributes
+    from the columns, `instance()` builds the dataclass instance.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: Columns[T], index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            column = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._table.cls.__name__} row has no field {name!r}") from None
+        return column[self._index]
+
+    def instance(self) -> T:
+        cls: Any = self._table.cls
+        init_kwargs = {name: column[self._index]
+                       for name, column in self._table.columns.items()}
+        plan = _field_plan(cls)
+        if plan.trust_init:
+            return _construct_trusted(cls, plan, init_kwargs)
+        return cls(**init_kwargs)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={column[self._index]!r}'
+                           for name, column in self._table.columns.items())
+        return f'Row[{self._table.cls.__name__}]({values})'
+
+
+def _decode_columns(cls, records, infer_missing=False) -> Columns:
+    """
+    Decodes an iterable of dicts into `Columns`: the records are first split
+    into raw columns, then every column is decoded with the converter of its
+    field.
+    """
+    plan = _field_plan(cls)
+    overrides = _user_overrides_or_exts(cls)
+    decode_names = _decode_letter_case_overrides(plan.names, overrides)
+    init_fields = [field for field in plan.fields if field.init]
+    raw_columns: Dict[str, List[Any]] = {field.name: []
+                                         for field in init_fields}
+    length = 0
+    for kvs in records:
+        # defaults that need no decoding decode to themselves below as well
+        kvs, _ = _prepare_kvs(cls, plan, overrides, decode_names, kvs,
+                              infer_missing)
+        for name, column in raw_columns.items():
+            column.append(kvs[name])
+        length += 1
+
+    types = _type_hints(cls)
+    for field in init_fields:
+        field_type = types[field.name]
+        while _is_new_type(field_type):
+            field_type = field_type.__supertype__
+        override = overrides[field.name]
+        column = raw_columns[field.name]
+        for index, value in enumerate(column):
+            if value is None:
+                _warn_none(cls, field, types[field.name], infer_missing)
+            else:
+                if override.intern:
+                    value = _intern_strings(value)
+                column[index] = _decode_field(field_type, value, override,
+                                              infer_missing)
+    return Columns(cls, raw_columns, length)
+
+
+def _concat_columns(cls, tables: List[Columns]) -> Columns:
+    names = [field.name for field in _field_plan(cls).fields if field.init]
+    columns: Dict[str, List[Any]] = {name: [] for name in names}
+    for table in tables:
+        for name, column in columns.items():
+            column.extend(table.columns[name])
+    return Columns(cls, columns, sum(len(table) for table in tables))
@@ -1,7 +1,13 @@
 import copy
+import dataclasses
+import functools
+import inspect
 import json
+import operator
 import sys
 import warnings
+import weakref
+from array import array
 from collections import defaultdict, namedtuple
 from collections.abc import (Collection as ABCCollection, Mapping as ABCMapping, MutableMapping, MutableSequence,
                              MutableSet, Sequence, Set)
@@ -9,30 +15,44 @@ from dataclasses import (MISSING,
                          fields,
                          is_dataclass  # type: ignore
                          )
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from types import MappingProxyType
-from typing import (Any, Collection, Mapping, Union, get_type_hints,
+from typing import (Any, Collection, Dict, ForwardRef, Mapping, Union, get_type_hints,
                     Tuple, TypeVar, Type)
 from uuid import UUID
 
 from typing_inspect import is_union_type  # type: ignore
 
-from dataclasses_json import cfg
+from dataclasses_json import cfg, profiling, stats
+from dataclasses_json.cfg import WarningPolicy
+from dataclasses_json.undefined import Undefined
 from dataclasses_json.utils import (_get_type_cons, _get_type_origin,
                                     _handle_undefined_parameters_safe,
                                     _is_collection, _is_mapping, _is_new_type,
-                                    _is_optional, _isinstance_safe,
+                                    _is_nonstr_collection, _is_optional,
+                                    _isinstance_safe,
                                     _get_type_arg_param,
                                     _get_type_args, _is_counter,
                                     _NO_ARGS,
                                     _issubclass_safe, _is_tuple,
-                                    _is_generic_dataclass)
+                                    _is_generic_dataclass,
+                                    _is_ndarray_type, _ndarray_dtype,
+                                    _ndarray_type,
+                                    _timestamp_to_dt_aware, _class_cached,
+                                    _undefined_parameter_action_safe)
 
 Json = Union[dict, list, str, int, float, bool, None]
 
-confs = ['encoder', 'decoder', 'mm_field', 'letter_case', 'exclude']
+try:
+    # `list[int]` and friends (3.9+)
+    from types import GenericAlias as _GenericAlias  # type: ignore
+except ImportError:
+    _GenericAlias = None  # type: ignore
+
+confs = ['encoder', 'decoder', 'mm_field', 'letter_case', 'exclude', 'dtype',
+         'compact', 'intern']
 FieldOverride = namedtuple('FieldOverride', confs)  # type: ignore
 collections_abc_type_to_implementation_type = MappingProxyType({
     ABCCollection: tuple,
@@ -48,7 +68,10 @@ collections_abc_type_to_implementation_type = MappingProxyType({
 class _ExtendedEncoder(json.JSONEncoder):
     def default(self, o) -> Json:
         result: Json
-        if _isinstance_safe(o, Collection):
+        # checked first: enum.Flag members are Collections in Python 3.11+
+        if isinstance(o, Enum):
+            result = o.value
+        elif _isinstance_safe(o, Collection):
             if _isinstance_safe(o, Mapping):
                 result = dict(o)
             else:
@@ -57,8 +80,6 @@ class _ExtendedEncoder(json.JSONEncoder):
             result = o.timestamp()
         elif _isinstance_safe(o, UUID):
             result = str(o)
-        elif _isinstance_safe(o, Enum):
-            result = o.value
         elif _isinstance_safe(o, Decimal):
             result = str(o)
         else:
@@ -66,7 +87,36 @@ class _ExtendedEncoder(json.JSONEncoder):
         return result
 
 
+@_class_cached
+def _overrides_slot(cls) -> list:
+    """
+    Holds the `(global config version, overrides)` of `cls` last computed by
+    `_user_overrides_or_exts` as its only item.
+    """
+    return [None]
+
+
 def _user_overrides_or_exts(cls):
+    """
+    The `FieldOverride` of every field of a dataclass (or of the class of a
+    dataclass instance), cached on the class until the global config
+    changes. Safe to call from many threads: reads take no lock, and
+    concurrent misses compute equal results.
+    """
+    if not isinstance(cls, type):
+        cls = type(cls)
+    version = cfg.global_config.version
+    slot = _overrides_slot(cls)
+    cached = slot[0]
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    overrides = _compute_overrides(cls)
+    # replaced as a whole, readers never see a version with other overrides
+    slot[0] = (version, overrides)
+    return overrides
+
+
+def _compute_overrides(cls):
     global_metadata = defaultdict(dict)
     encoders = cfg.global_config.encoders
     decoders = cfg.global_config.decoders
@@ -104,6 +154,8 @@ def _user_overrides_or_exts(cls):
 
 
 def _encode_json_type(value, default=_ExtendedEncoder().default):
+    if isinstance(value, Enum):
+        return value.value
     if isinstance(value, Json.__args__):  # type: ignore
         if isinstance(value, list):
             return [_encode_json_type(i) for i in value]
@@ -133,7 +185,9 @@ def _encode_overrides(kvs, overrides, encode_json=False):
                 )
 
             encoder = overrides[original_key].encoder
-            v = encoder(v) if encoder is not None else v
+            if encoder is not None:
+                v = profiling._call_hook(profiling._active, 'encoder',
+                                         encoder, v)
 
         if encode_json:
             v = _encode_json_type(v)
@@ -141,6 +195,30 @@ def _encode_overrides(kvs, overrides, encode_json=False):
     return override_kvs
 
 
+_warned_sites: "set[str]" = set()
+
+
+def _warn(site, message, category=UserWarning):
+    """
+    Emits a warning according to `cfg.global_config.warning_policy`.
+    `message` is a callable returning the warning message, so that the
+    (potentially large) values it mentions are only formatted if the warning
+    is actually emitted. `site` identifies the warning for
+    `WarningPolicy.ONCE` and `WarningPolicy.AGGREGATE`.
+    """
+    policy = cfg.global_config.warning_policy
+    if policy is WarningPolicy.ALWAYS:
+        warnings.warn(message(), category, stacklevel=2)
+    elif policy is WarningPolicy.ONCE:
+        if site not in _warned_sites:
+            _warned_sites.add(site)
+            warnings.warn(message(), category, stacklevel=2)
+    elif policy is WarningPolicy.AGGREGATE:
+        stats._increment('warnings', site)
+    elif policy is WarningPolicy.RAISE:
+        raise category(message())
+
+
 def _decode_letter_case_overrides(field_names, overrides):
     """Override letter case of field names for encode/decode"""
     names = {}
@@ -153,96 +231,501 @@ def _decode_letter_case_overrides(field_names, overrides):
     return names
 
 
-def _decode_dataclass(cls, kvs, infer_missing):
-    if _isinstance_safe(kvs, cls):
-        return kvs
-    overrides = _user_overrides_or_exts(cls)
-    kvs = {} if kvs is None and infer_missing else kvs
-    field_names = [field.name for field in fields(cls)]
-    decode_names = _decode_letter_case_overrides(field_names, overrides)
-    kvs = {decode_names.get(k, k): v for k, v in kvs.items()}
-    missing_fields = {field for field in fields(cls) if field.name not in kvs}
+class _NotDecoded:
+    """
+    Placeholder for fields without a default that were left out of the `only`
+    projection when decoding.
+    """
+
+    def __repr__(self):
+        return 'NOT_DECODED'
+
+    def __reduce__(self):
+        return 'NOT_DECODED'
+
+
+NOT_DECODED = _NotDecoded()
+
+_LAZY_PREFIX = '__dataclasses_json_lazy_'
 
-    for field in missing_fields:
+
+class _LazyField:
+    """
+    Non-data descriptor installed on the fields of dataclasses that were
+    deferred by a decode with `lazy=True`. The raw JSON value of a deferred field is stored in the
+    instance `__dict__` under a prefixed key and decoded on first access.
+    Once decoded, the value is written to the instance `__dict__`, which
+    takes precedence over this descriptor for all later lookups.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self.raw_key = _LAZY_PREFIX + name
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            if self.default is MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        instance_dict = instance.__dict__
+        pending = instance_dict.get(self.raw_key)
+        if pending is None:
+            # another thread may have decoded the value in the meantime
+            try:
+                return instance_dict[self.name]
+            except KeyError:
+                raise AttributeError(
+                    f"'{owner.__name__}' object has no attribute "
+                    f"'{self.name}'") from None
+        type_, value, infer_missing, only = pending
+        if is_dataclass(type_):
+            decoded = _decode_dataclass(type_, value, infer_missing,
+                                        lazy=True, only=only)
+        elif only is not None:
+            decoded = _decode_projected(type_, value, infer_missing, only)
+        else:
+            decoded = _decode_type(type_, value, infer_missing)
+        instance_dict[self.name] = decoded
+        instance_dict.pop(self.raw_key, None)
+        return decoded
+
+
+def _supports_lazy(cls):
+    # deferred values live in the instance `__dict__`, `__post_init__` must
+    # only ever see decoded values, and pickling must decode them first
+    return (cls.__dictoffset__ != 0 and not hasattr(cls, '__post_init__')
+            and getattr(cls, '__getstate__', None) in _DEFAULT_GETSTATES)
+
+
+def _is_lazy_candidate(type_):
+    # numeric arrays are decoded in one call, no need to defer that
+    return (is_dataclass(type_)
+            or _is_generic_dataclass(type_)
+            or (_is_nonstr_collection(type_) and type_ is not array
+                and not _is_ndarray_type(type_)))
+
+
+def _lazy_getstate(self):
+    """
+    The state of a lazily decoded instance for pickling and copying, with
+    all deferred fields decoded: the process that unpickles it may not have
+    the descriptors that would decode them.
+    """
+    instance_dict = self.__dict__
+    for key in [key for key in instance_dict if key.startswith(_LAZY_PREFIX)]:
+        name = key[len(_LAZY_PREFIX):]
+        if name in instance_dict:
+            # assigned before it was ever read
+            del instance_dict[key]
+        else:
+            getattr(self, name)
+    return instance_dict
+
+
+# `object.__getstate__` only exists on 3.11+
+_DEFAULT_GETSTATES = (None, _lazy_getstate,
+                      getattr(object, '__getstate__', None))
+
+
+def _install_lazy_fields(cls, names):
+    # only on deferred fields, reading the others stays a plain lookup
+    for field in fields(cls):
+        if (field.name in names
+                and not isinstance(cls.__dict__.get(field.name), _LazyField)):
+            setattr(cls, field.name, _LazyField(field.name, field.default))
+    if '__getstate__' not in cls.__dict__:
+        cls.__getstate__ = _lazy_getstate
+
+
+_FieldPlan = namedtuple('_FieldPlan', ['fields', 'names', 'defaults',
+                                       'default_factories', 'required',
+                                       'verbatim_defaults', 'trust_init'])
+
+# defaults of these types decode to themselves if the field has the same type
+_VERBATIM_DEFAULT_TYPES = (str, int, float, bool)
+
+
+@_class_cached
+def _field_plan(cls):
+    """
+    The fields of a dataclass split by how a missing value is filled in,
+    computed once per class: `defaults` and `default_factories` as
+    `(name, default)` pairs, and the names of the `required` fields.
+    `verbatim_defaults` are the names of the init fields whose default can be
+    passed to `__init__` without decoding it. `trust_init` tells whether
+    decoded instances are built by `_construct_trusted`.
+    """
+    cls_fields = fields(cls)
+    types = _type_hints(cls)
+    defaults, default_factories, required, verbatim_defaults = [], [], [], set()
+    for field in cls_fields:
         if field.default is not MISSING:
-            kvs[field.name] = field.default
+            defaults.append((field.name, field.default))
+            default_type = type(field.default)
+            if (field.init
+                    and (default_type in _VERBATIM_DEFAULT_TYPES
+                         or isinstance(field.default, Enum))
+                    and _unwrap_optional(types[field.name]) is default_type):
+                verbatim_defaults.add(field.name)
         elif field.default_factory is not MISSING:
-            kvs[field.name] = field.default_factory()
-        elif infer_missing:
-            kvs[field.name] = None
+            default_factories.append((field.name, field.default_factory))
+        else:
+            required.append(field.name)
+    cls_config = getattr(cls, 'dataclass_json_config', None) or {}
+    trust_init = bool(cls_config.get('trust_init'))
+    if trust_init and not _has_generated_init(cls):
+        _warn(f"{cls.__name__}:trust_init",
+              lambda: f"{cls.__name__} doesn't use the __init__ generated by "
+                      f"@dataclass, ignoring trust_init=True.")
+        trust_init = False
+    # init-only variables can't be passed to `__post_init__` by us, `fields`
+    # leaves them out, so they are found by their annotations
+    has_init_vars = any(hint is dataclasses.InitVar
+                        or isinstance(hint, dataclasses.InitVar)
+                        for hint in types.values())
+    return _FieldPlan(cls_fields, tuple(field.name for field in cls_fields),
+                      tuple(defaults), tuple(default_factories),
+                      tuple(required), frozenset(verbatim_defaults),
+                      trust_init and not has_init_vars)
 
-    # Perform undefined parameter action
-    kvs = _handle_undefined_parameters_safe(cls, kvs, usage="from")
 
-    init_kwargs = {}
-    types = get_type_hints(cls)
-    for field in fields(cls):
-        # The field should be skipped from being added
-        # to init_kwargs as it's not intended as a constructor argument.
-        if not field.init:
-            continue
+def _has_generated_init(cls):
+    """
+    Whether `cls.__init__` is the one generated by `@dataclass` (possibly
+    wrapped for its undefined parameter action), not one of the user's.
+    """
+    if not cls.__dataclass_params__.init:
+        return False
+    init = inspect.unwrap(cls.__init__)
+    # `dataclasses` compiles the methods it generates from source strings
+    code = getattr(init, '__code__', None)
+    return code is not None and code.co_filename == '<string>'
 
-        field_value = kvs[field.name]
-        field_type = types[field.name]
-        if field_value is None:
-            if not _is_optional(field_type):
-                warning = (
-                    f"value of non-optional type {field.name} detected "
-                    f"when decoding {cls.__name__}"
-                )
-                if infer_missing:
-                    warnings.warn(
-                        f"Missing {warning} and was defaulted to None by "
-                        f"infer_missing=True. "
-                        f"Set infer_missing=False (the default) to prevent "
-                        f"this behavior.", RuntimeWarning
-                    )
-                else:
-                    warnings.warn(
-                        f"'NoneType' object {warning}.", RuntimeWarning
-                    )
-            init_kwargs[field.name] = field_value
+
+def _construct_trusted(cls, plan, init_kwargs):
+    """
+    Builds an instance like the `__init__` generated by `dataclasses` would,
+    without its overhead: the (already decoded and partitioned) `init_kwargs`
+    are assigned directly, even on frozen dataclasses, non-init fields get
+    their defaults and `__post_init__` is called.
+    """
+    instance = object.__new__(cls)
+    for field in plan.fields:
+        name = field.name
+        if field.init:
+            value = init_kwargs[name]
+        elif field.default is not MISSING:
+            value = field.default
+        elif field.default_factory is not MISSING:
+            value = field.default_factory()
+        else:
             continue
+        object.__setattr__(instance, name, value)
+    post_init = getattr(instance, '__post_init__', None)
+    if post_init is not None:
+        post_init()
+    return instance
 
-        while True:
-            if not _is_new_type(field_type):
-                break
 
-            field_type = field_type.__supertype__
+def _decode_dataclass(cls, kvs, infer_missing, lazy=False, only=None):
+    """
+    `only` is a tree of field paths as returned by `_parse_field_paths`. Init
+    fields outside of it are not decoded, but set to their default or to
+    `NOT_DECODED` if they have none.
+    """
+    if _isinstance_safe(kvs, cls):
+        return kvs
+    profile = profiling._active
+    if profile is not None:
+        frame = profile.enter('decode', cls.__qualname__)
+    try:
+        lazy = lazy and _supports_lazy(cls)
+        deferred = {}
+        overrides = _user_overrides_or_exts(cls)
+        kvs = {} if kvs is None and infer_missing else kvs
+        plan = _field_plan(cls)
+        types = _type_hints(cls)
+        if only is not None:
+            _validate_only(cls, only, types)
+        decode_names = _decode_letter_case_overrides(plan.names, overrides)
+        kvs, init_kwargs = _prepare_kvs(cls, plan, overrides, decode_names,
+                                        kvs, infer_missing, only)
+
+        for field in plan.fields:
+            # The field should be skipped from being added
+            # to init_kwargs as it's not intended as a constructor argument.
+            if not field.init or field.name in init_kwargs:
+                continue
+
+            if only is not None and field.name not in only:
+                init_kwargs[field.name] = _default_or_not_decoded(field)
+                continue
+            nested_only = only[field.name] if only is not None else None
 
-        if (field.name in overrides
-                and overrides[field.name].decoder is not None):
-            # FIXME hack
-            if field_type is type(field_value):
+            field_value = kvs[field.name]
+            field_type = types[field.name]
+            if field_value is None:
+                _warn_none(cls, field, field_type, infer_missing)
                 init_kwargs[field.name] = field_value
+                continue
+
+            while True:
+                if not _is_new_type(field_type):
+                    break
+
+                field_type = field_type.__supertype__
+
+            if profile is not None:
+                field_frame = profile.enter('field', field.name)
+            override = overrides[field.name]
+            if override.intern:
+                field_value = _intern_strings(field_value)
+            if (lazy and override.decoder is None and override.compact is None
+                    and _is_lazy_candidate(_unwrap_optional(field_type))
+                    and not is_dataclass(field_value)):
+                deferred[field.name] = (_unwrap_optional(field_type),
+                                        field_value, infer_missing, nested_only)
+                init_kwargs[field.name] = field_value
+            elif nested_only is not None and override.decoder is None:
+                init_kwargs[field.name] = _decode_projected(
+                    field_type, field_value, infer_missing, nested_only)
             else:
-                init_kwargs[field.name] = overrides[field.name].decoder(
-                    field_value)
-        elif is_dataclass(field_type):
-            # FIXME this is a band-aid to deal with the value already being
-            # serialized when handling nested marshmallow schema
-            # proper fix is to investigate the marshmallow schema generation
-            # code
-            if is_dataclass(field_value):
-                value = field_value
-            else:
-                value = _decode_dataclass(field_type, field_value,
-                                          infer_missing)
-            init_kwargs[field.name] = value
-        elif _is_supported_generic(field_type) and field_type != str:
-            init_kwargs[field.name] = _decode_generic(field_type,
-                                                      field_value,
-                                                      infer_missing)
+                init_kwargs[field.name] = _decode_field(
+                    field_type, field_value, override, infer_missing, profile)
+            if profile is not None:
+                profile.exit(field_frame)
+
+        if plan.trust_init:
+            instance = _construct_trusted(cls, plan, init_kwargs)
         else:
-            init_kwargs[field.name] = _support_extended_types(field_type,
-                                                              field_value)
+            instance = cls(**init_kwargs)
+        if deferred:
+            _install_lazy_fields(cls, deferred)
+            instance_dict = instance.__dict__
+            for name, pending in deferred.items():
+                del instance_dict[name]
+                instance_dict[_LAZY_PREFIX + name] = pending
+        if stats._enabled:
+            stats._increment('decoded', cls.__qualname__)
+        return instance
+    finally:
+        if profile is not None:
+            profile.exit(frame)
+
+
+def _prepare_kvs(cls, plan, overrides, decode_names, kvs, infer_missing,
+                 only=None):
+    """
+    Maps the keys of `kvs` to field names, fills in missing fields and
+    applies the undefined parameter action. Returns the new `kvs` and the
+    init kwargs of the fields whose default needs no decoding, which
+    includes the defaults of fields outside of `only`.
+    """
+    kvs = {decode_names.get(k, k): v for k, v in kvs.items()}
+
+    init_kwargs = {}
+    for name, default in plan.defaults:
+        if name not in kvs:
+            kvs[name] = default
+            if (name in plan.verbatim_defaults
+                    and overrides[name].decoder is None):
+                init_kwargs[name] = default
+    for name, default_factory in plan.default_factories:
+        if name not in kvs:
+            if only is not None and name not in only:
+                init_kwargs[name] = default_factory()
+            else:
+                kvs[name] = default_factory()
+    if infer_missing:
+        for name in plan.required:
+            if name not in kvs:
+                kvs[name] = None
+                if stats._enabled:
+                    stats._increment('infer_missing',
+                                     f'{cls.__qualname__}.{name}')
+
+    # Perform undefined parameter action
+    kvs = _handle_undefined_parameters_safe(cls, kvs, usage="from")
+    return kvs, init_kwargs
+
+
+def _warn_none(cls, field, field_type, infer_missing):
+    if _is_optional(field_type):
+        return
+    warning = (
+        f"value of non-optional type {field.name} detected "
+        f"when decoding {cls.__name__}"
+    )
+    if infer_missing:
+        _warn(
+            f"{cls.__qualname__}.{field.name}:infer_missing",
+            lambda: f"Missing {warning} and was defaulted to "
+                    f"None by infer_missing=True. "
+                    f"Set infer_missing=False (the default) "
+                    f"to prevent this behavior.",
+            RuntimeWarning
+        )
+    else:
+        _warn(
+            f"{cls.__qualname__}.{field.name}:none",
+            lambda: f"'NoneType' object {warning}.",
+            RuntimeWarning
+        )
+
+
+def _decode_field(field_type, field_value, override, infer_missing,
+                  profile=None):
+    """
+    Decodes the (not `None`) value of a field of type `field_type`, with the
+    `FieldOverride` of the field.
+    """
+    if override.decoder is not None:
+        # FIXME hack
+        if field_type is type(field_value):
+            return field_value
+        return profiling._call_hook(profile, 'decoder', override.decoder,
+                                    field_value)
+    if _is_ndarray_type(_unwrap_optional(field_type)):
+        return _decode_ndarray(_unwrap_optional(field_type), field_value,
+                               override.dtype)
+    if override.compact is not None or _unwrap_optional(field_type) is array:
+        return _decode_array(field_value, override.compact)
+    if is_dataclass(field_type):
+        # FIXME this is a band-aid to deal with the value already being
+        # serialized when handling nested marshmallow schema
+        # proper fix is to investigate the marshmallow schema generation
+        # code
+        if is_dataclass(field_value):
+            return field_value
+        return _decode_dataclass(field_type, field_value, infer_missing)
+    if _is_supported_generic(field_type) and field_type != str:
+        return _decode_generic(field_type, field_value, infer_missing)
+    return _support_extended_types(field_type, field_value)
+
+
+def _validate_field_paths(cls, paths, argument):
+    unknown_names = paths.keys() - {field.name for field in fields(cls)}
+    if unknown_names:
+        cls_name = getattr(cls, '__name__', type(cls).__name__)
+        raise ValueError(f"Invalid fields for {cls_name} in "
+                         f"`{argument}`: {sorted(unknown_names)}")
+
+
+def _validate_only(cls, only, types):
+    """
+    Checks the field names of `only` on `cls`, and that the fields with
+    nested paths hold dataclasses (also in collections) with those fields.
+    """
+    _validate_field_paths(cls, only, 'only')
+    for name, nested_only in only.items():
+        if nested_only is None:
+            continue
+        target = _projection_target(types[name])
+        if target is None:
+            raise ValueError(f"Invalid fields for {cls.__name__} in `only`: "
+                             f"{name!r} holds no dataclasses to select "
+                             f"fields of")
+        _validate_field_paths(target, nested_only, 'only')
 
-    return cls(**init_kwargs)
+
+def _projection_target(type_):
+    """
+    The dataclass that paths into a field of `type_` select fields of: the
+    type itself, or the type of the items of a (nested) collection of
+    dataclasses. `None` if there is none.
+    """
+    type_ = _unwrap_optional(type_)
+    while _is_new_type(type_):
+        type_ = type_.__supertype__
+    if is_dataclass(type_):
+        return type_
+    if _is_generic_dataclass(type_):
+        return _get_type_origin(type_)
+    item_type = _projection_item_type(type_)
+    return None if item_type is None else _projection_target(item_type)
+
+
+def _projection_item_type(type_):
+    if _is_mapping(type_) and not _is_counter(type_):
+        return _get_type_args(type_, (Any, Any))[1]
+    if _is_nonstr_collection(type_) and not _is_counter(type_):
+        args = _get_type_args(type_)
+        if _is_tuple(type_):
+            # only `Tuple[X, ...]`, items of fixed tuples have their own types
+            return args[0] if len(args) == 2 and args[1] is Ellipsis else None
+        return args[0] if args and args is not _NO_ARGS else None
+    return None
+
+
+def _decode_projected(type_, value, infer_missing, only):
+    """
+    Decodes `value` of a field of `type_`, which `_validate_only` found to
+    hold dataclasses, decoding only the fields in `only` of each of them.
+    """
+    if value is None:
+        return None
+    type_ = _unwrap_optional(type_)
+    while _is_new_type(type_):
+        type_ = type_.__supertype__
+    if is_dataclass(value):
+        return value
+    if is_dataclass(type_):
+        return _decode_dataclass(type_, value, infer_missing, only=only)
+    if _is_generic_dataclass(type_):
+        return _decode_dataclass(_get_type_origin(type_), value,
+                                 infer_missing, only=only)
+    item_type = _projection_item_type(type_)
+    collection_type = _resolve_collection_type_to_decode_to(type_)
+    if _is_mapping(type_):
+        keys = _decode_dict_keys(_get_type_args(type_, (Any, Any))[0],
+                                 value.keys(), infer_missing)
+        return collection_type(zip(keys, (
+            _decode_projected(item_type, item, infer_missing, only)
+            for item in value.values())))
+    return collection_type(_decode_projected(item_type, item, infer_missing,
+                                             only)
+                           for item in value)
+
+
+def _default_or_not_decoded(field):
+    if field.default is not MISSING:
+        return field.default
+    elif field.default_factory is not MISSING:
+        return field.default_factory()
+    return NOT_DECODED
+
+
+def _intern_strings(value):
+    """
+    The parsed JSON `value` with its strings, including the keys of dicts,
+    replaced by their interned copies.
+    """
+    # `sys.intern` rejects subclasses of str
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is dict:
+        return {(sys.intern(k) if type(k) is str else k): _intern_strings(v)
+                for k, v in value.items()}
+    if type(value) is list:
+        return [_intern_strings(item) for item in value]
+    return value
+
+
+def _unwrap_optional(type_):
+    if _is_optional(type_) and len(_get_type_args(type_)) == 2:
+        return next(arg for arg in _get_type_args(type_)
+                    if arg is not type(None))
+    return type_
 
 
 def _decode_type(type_, value, infer_missing):
     if _has_decoder_in_global_config(type_):
         return _get_decoder_in_global_config(type_)(value)
+    if _is_ndarray_type(type_):
+        return _decode_ndarray(type_, value)
+    if type_ is array:
+        return _decode_array(value)
     if _is_supported_generic(type_):
         return _decode_generic(type_, value, infer_missing)
     if is_dataclass(type_) or is_dataclass(value):
@@ -250,6 +733,25 @@ def _decode_type(type_, value, infer_missing):
     return _support_extended_types(type_, value)
 
 
+def _decode_ndarray(type_, value, dtype=None):
+    """
+    Builds a `numpy.ndarray` from a (nested) list in one call. The dtype is
+    the `dtype` given with `config`, else the one of the annotation, else
+    inferred by numpy.
+    """
+    if dtype is None:
+        dtype = _ndarray_dtype(type_)
+    return sys.modules['numpy'].asarray(value, dtype=dtype)
+
+
+def _decode_array(value, typecode=None):
+    """
+    Builds an `array.array` from a list of numbers in one call. The typecode
+    is the `compact` given with `config`, `'d'` (double) by default.
+    """
+    return array(typecode or 'd', value)
+
+
 def _support_extended_types(field_type, field_value):
     if _issubclass_safe(field_type, datetime):
         # FIXME this is a hack to deal with mm already decoding
@@ -258,8 +760,8 @@ def _support_extended_types(field_type, field_value):
         if isinstance(field_value, datetime):
             res = field_value
         else:
-            tz = datetime.now(timezone.utc).astimezone().tzinfo
-            res = datetime.fromtimestamp(field_value, tz=tz)
+            res = _timestamp_to_dt_aware(field_value,
+                                         cfg.global_config.timestamp_tz)
     elif _issubclass_safe(field_type, Decimal):
         res = (field_value
                if isinstance(field_value, Decimal)
@@ -287,13 +789,89 @@ def _is_supported_generic(type_):
         type_) or is_union_type(type_) or is_enum or is_generic_dataclass
 
 
+def _type_hints(cls) -> dict:
+    """
+    The type hints of a dataclass. Before Python 3.11 `get_type_hints` leaves
+    string forward references nested in builtin generics (e.g.
+    `list["Node"]`) alone; these are resolved in the namespace of the module
+    defining `cls`, where the class itself is also visible by name. Hints
+    that can't be resolved there (yet) are looked up again on every call,
+    see `_handle_pep0673`.
+    """
+    hints, unresolved = _namespace_type_hints(cls)
+    if not unresolved:
+        return hints
+    globalns, localns = _hint_namespaces(cls)
+    hints = dict(hints)
+    for name in unresolved:
+        hints[name] = _resolve_forward_refs(hints[name], globalns, localns,
+                                            owner=cls)
+    return hints
+
+
+def _hint_namespaces(cls):
+    module = sys.modules.get(cls.__module__)
+    return (vars(module) if module is not None else {}), {cls.__name__: cls}
+
+
+@_class_cached
+def _namespace_type_hints(cls):
+    """
+    The type hints of a dataclass resolved in the namespace of its module,
+    once per class, and the names of the fields whose hints still contain
+    string forward references.
+    """
+    globalns, localns = _hint_namespaces(cls)
+    try:
+        hints = get_type_hints(cls)
+    except NameError:
+        # e.g. a self-referencing class defined inside a function
+        hints = get_type_hints(cls, localns=localns)
+    hints = {name: _resolve_forward_refs(type_, globalns, localns)
+             for name, type_ in hints.items()}
+    unresolved = tuple(name for name, type_ in hints.items()
+                       if _has_forward_refs(type_))
+    return hints, unresolved
+
+
+def _resolve_forward_refs(type_, globalns, localns, owner=None):
+    if type(type_) in (str, ForwardRef):
+        hint = type_ if type(type_) is str else type_.__forward_arg__
+        try:
+            return eval(hint, globalns, localns)
+        except Exception:
+            if owner is None:
+                return type_
+            resolved = _handle_pep0673(owner, hint)
+            return type_ if resolved is hint else resolved
+    args = getattr(type_, '__args__', None)
+    if type(args) is not tuple or not args:
+        return type_
+    resolved = tuple(_resolve_forward_refs(arg, globalns, localns, owner)
+                     for arg in args)
+    if all(new is old for new, old in zip(resolved, args)):
+        return type_
+    if _GenericAlias is not None and type(type_) is _GenericAlias:
+        return _GenericAlias(type_.__origin__, resolved)
+    try:
+        return type_.copy_with(resolved)
+    except (AttributeError, TypeError):
+        return type_
+
+
+def _has_forward_refs(type_):
+    if type(type_) in (str, ForwardRef):
+        return True
+    args = getattr(type_, '__args__', None)
+    return (type(args) is tuple
+            and any(_has_forward_refs(arg) for arg in args))
+
+
 def _decode_generic(type_, value, infer_missing):
     if value is None:
         res = value
     elif _issubclass_safe(type_, Enum):
-        # Convert to an Enum using the type as a constructor.
-        # Assumes a direct match is found.
-        res = type_(value)
+        res = _decode_enum(type_, value)
     # FIXME this is a hack to fix a deeper underlying issue. A refactor is due.
     elif _is_collection(type_):
         if _is_mapping(type_) and not _is_counter(type_):
@@ -333,19 +911,53 @@ def _decode_generic(type_, value, infer_missing):
             if type(value) is dict and dict not in type_options:
                 for type_option in type_options:
                     if is_dataclass(type_option):
+                        if stats._enabled:
+                            stats._increment('union_attempts',
+                                             type_option.__qualname__)
                         try:
                             res = _decode_dataclass(type_option, value, infer_missing)
                             break
                         except (KeyError, ValueError, AttributeError):
+                            if stats._enabled:
+                                stats._increment('union_attempt_failures',
+                                                 type_option.__qualname__)
                             continue
                 if res == value:
-                    warnings.warn(
-                        f"Failed to decode {value} Union dataclasses."
-                        f"Expected Union to include a matching dataclass and it didn't."
+                    if stats._enabled:
+                        stats._increment('union_unmatched', str(type_))
+                    _warn(
+                        f"{type_}:union_unmatched",
+                        lambda: f"Failed to decode {value} Union dataclasses."
+                                f"Expected Union to include a matching dataclass and it didn't."
                     )
     return res
 
 
+@_class_cached
+def _enum_members_by_value(enum_type):
+    """
+    Value to member lookup of an enum, built once per enum type. Members with
+    unhashable values are left out and handled by the fallback in
+    `_decode_enum`.
+    """
+    members = {}
+    for member in enum_type.__members__.values():
+        try:
+            members.setdefault(member.value, member)
+        except TypeError:
+            continue
+    return members
+
+
+def _decode_enum(enum_type, value):
+    try:
+        return _enum_members_by_value(enum_type)[value]
+    except (KeyError, TypeError):
+        # composite flags, unhashable values and `_missing_` hooks go
+        # through the regular (slower) enum constructor
+        return enum_type(value)
+
+
 def _decode_dict_keys(key_type, xs, infer_missing):
     """
     Because JSON object keys must be strs, we need the extra step of decoding
@@ -383,22 +995,6 @@ def _decode_items(type_args, xs, infer_missing):
     type_arg is a typevar we need to extract the reified type information
     hence the check of `is_dataclass(vs)`
     """
-    def handle_pep0673(pre_0673_hint: str) -> Union[Type, str]:
-        for module in sys.modules.values():
-            if hasattr(module, type_args):
-                maybe_resolved = getattr(module, type_args)
-                warnings.warn(f"Assuming hint {pre_0673_hint} resolves to {maybe_resolved} "
-                              "This is not necessarily the value that is in-scope.")
-                return maybe_resolved
-
-        warnings.warn(f"Could not resolve self-reference for type {pre_0673_hint}, "
-                      f"decoded type might be incorrect or decode might fail altogether.")
-        return pre_0673_hint
-
-    # Before https://peps.python.org/pep-0673 (3.11+) self-type hints are simply strings
-    if sys.version_info.minor < 11 and type_args is not type and type(type_args) is str:
-        type_args = handle_pep0673(type_args)
-
     if _isinstance_safe(type_args, Collection) and not _issubclass_safe(type_args, Enum):
         if len(type_args) == len(xs):
             return list(_decode_type(type_arg, x, infer_missing) for type_arg, x in zip(type_args, xs))
@@ -410,6 +1006,38 @@ def _decode_items(type_args, xs, infer_missing):
     return list(_decode_type(type_args, x, infer_missing) for x in xs)
 
 
+@_class_cached
+def _self_references(cls) -> dict:
+    """The string hints of `cls` found by `_handle_pep0673`, by hint."""
+    return {}
+
+
+def _handle_pep0673(owner, pre_0673_hint: str) -> Union[Type, str]:
+    """
+    Last resort for string hints of the dataclass `owner` that can't be
+    resolved in the namespace of its module: the first module that has an
+    attribute of that name. Found classes are cached per owner, hints that
+    aren't found are looked up again next time.
+    """
+    found = _self_references(owner)
+    maybe_resolved = found.get(pre_0673_hint)
+    if maybe_resolved is None:
+        for module in list(sys.modules.values()):
+            if hasattr(module, pre_0673_hint):
+                maybe_resolved = getattr(module, pre_0673_hint)
+                found[pre_0673_hint] = maybe_resolved
+                break
+        else:
+            _warn(f"{pre_0673_hint}:self_reference_unresolved",
+                  lambda: f"Could not resolve self-reference for type {pre_0673_hint}, "
+                          f"decoded type might be incorrect or decode might fail altogether.")
+            return pre_0673_hint
+    _warn(f"{pre_0673_hint}:self_reference",
+          lambda: f"Assuming hint {pre_0673_hint} resolves to {maybe_resolved} "
+                  "This is not necessarily the value that is in-scope.")
+    return maybe_resolved
+
+
 def _resolve_collection_type_to_decode_to(type_):
     # get the constructor if using corresponding generic type in `typing`
     # otherwise fallback on constructing using type_ itself
@@ -422,35 +1050,181 @@ def _resolve_collection_type_to_decode_to(type_):
     return collections_abc_type_to_implementation_type.get(collection_type, collection_type)
 
 
-def _asdict(obj, encode_json=False):
+@_class_cached
+def _field_accessor(cls):
+    """
+    The fields of a dataclass and a function returning the values of all of
+    them from an instance in one call, which works the same for `__dict__`
+    and `__slots__` based classes.
+    """
+    cls_fields = fields(cls)
+    if not cls_fields:
+        return cls_fields, lambda obj: ()
+    get_values = operator.attrgetter(*(field.name for field in cls_fields))
+    if len(cls_fields) == 1:
+        return cls_fields, lambda obj: (get_values(obj),)
+    return cls_fields, get_values
+
+
+@_class_cached
+def _memoizes(cls: Any) -> bool:
+    """Whether the encoded instances of `cls` are memoized, see `_memo_get`."""
+    cls_config = getattr(cls, 'dataclass_json_config', None) or {}
+    if not cls_config.get('memoize'):
+        return False
+    if not cls.__dataclass_params__.frozen:
+        raise ValueError(f"{cls.__qualname__} must be a frozen dataclass "
+                         f"to memoize its encoded instances")
+    return True
+
+
+# id(instance) -> (weak reference to the instance, global config version,
+# memos by key). Kept outside the instance so that memos don't show up in
+# `vars()`, pickles or copies; keyed by id rather than by the (equal and
+# equally hashed) instances themselves, which may still encode differently.
+_memos: Dict[int, Tuple[Any, int, Dict[Any, Any]]] = {}
+
+
+def _forget_memo(key, ref):
+    # the instance is gone, and its id may already have been reused
+    memo = _memos.get(key)
+    if memo is not None and memo[0] is ref:
+        _memos.pop(key, None)
+
+
+def _memo_get(obj, key):
+    """
+    The result memoized with `_memo_set` for `key` on the instance `obj`, or
+    `None`. Memos are invalidated by any change to the global config.
+    """
+    memo = _memos.get(id(obj))
+    if (memo is None or memo[0]() is not obj
+            or memo[1] != cfg.global_config.version):
+        return None
+    return memo[2].get(key)
+
+
+def _memo_set(obj, key, value):
+    # instances that can't be weakly referenced (`__slots__`) are not memoized
+    version = cfg.global_config.version
+    memo = _memos.get(id(obj))
+    if memo is None or memo[0]() is not obj or memo[1] != version:
+        try:
+            ref = weakref.ref(obj, functools.partial(_forget_memo, id(obj)))
+        except TypeError:
+            return
+        memo = (ref, version, {})
+        _memos[id(obj)] = memo
+    memo[2][key] = value
+
+
+def _copy_encoded(value):
+    """A deep copy of an encoded value, for handing out memoized results."""
+    if type(value) is dict:
+        return {k: _copy_encoded(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_encoded(v) for v in value]
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return copy.deepcopy(value)
+
+
+def _asdict(obj, encode_json=False, include=None, exclude=None):
     """
     A re-implementation of `asdict` (based on the original in the `dataclasses`
     source) to support arbitrary Collection and Mapping types.
+
+    `include` and `exclude` are trees of field paths as returned by
+    `_parse_field_paths`. They apply to dataclasses at any depth, also inside
+    collections, and excluded fields are never recursed into.
+
+    Instances of classes configured with `memoize=True` are encoded once
+    (per `encode_json`), later calls return a copy of the memoized dict.
     """
     if is_dataclass(obj):
-        result = []
-        overrides = _user_overrides_or_exts(obj)
-        for field in fields(obj):
-            if overrides[field.name].encoder:
-                value = getattr(obj, field.name)
-            else:
-                value = _asdict(
-                    getattr(obj, field.name),
-                    encode_json=encode_json
-                )
-            result.append((field.name, value))
+        memoize = (include is None and exclude is None
+                   and not isinstance(obj, type) and _memoizes(type(obj)))
+        if memoize:
+            memoized = _memo_get(obj, encode_json)
+            if memoized is not None:
+                return _copy_encoded(memoized)
+        profile = profiling._active
+        if profile is not None:
+            frame = profile.enter('encode', type(obj).__qualname__)
+        try:
+            if include is not None:
+                _validate_field_paths(obj, include, 'include')
+            if exclude is not None:
+                _validate_field_paths(obj, exclude, 'exclude')
+            result = []
+            overrides = _user_overrides_or_exts(obj)
+            obj_fields, get_values = _field_accessor(
+                obj if isinstance(obj, type) else type(obj))
+            # with `include` / `exclude` only the kept fields are read, as
+            # reading a lazy field decodes it
+            values = (get_values(obj) if include is None and exclude is None
+                      else None)
+            for index, field in enumerate(obj_fields):
+                field_include = field_exclude = None
+                if include is not None:
+                    if field.name not in include:
+                        continue
+                    field_include = include[field.name]
+                if exclude is not None and field.name in exclude:
+                    field_exclude = exclude[field.name]
+                    if field_exclude is None:
+                        continue
+                field_value = (values[index] if values is not None
+                               else getattr(obj, field.name))
+                if overrides[field.name].encoder:
+                    value = field_value
+                else:
+                    if profile is not None:
+                        field_frame = profile.enter('field', field.name)
+                    value = _asdict(
+                        field_value,
+                        encode_json=encode_json,
+                        include=field_include,
+                        exclude=field_exclude
+                    )
+                    if profile is not None:
+                        profile.exit(field_frame)
+                result.append((field.name, value))
 
-        result = _handle_undefined_parameters_safe(cls=obj, kvs=dict(result),
-                                                   usage="to")
-        return _encode_overrides(dict(result), _user_overrides_or_exts(obj),
-                                 encode_json=encode_json)
+            result = _handle_undefined_parameters_safe(cls=obj,
+                                                       kvs=dict(result),
+                                                       usage="to")
+            encoded = _encode_overrides(dict(result), overrides,
+                                        encode_json=encode_json)
+            if stats._enabled:
+                stats._increment('encoded', type(obj).__qualname__)
+            if memoize:
+                _memo_set(obj, encode_json, encoded)
+                return _copy_encoded(encoded)
+            return encoded
+        finally:
+            if profile is not None:
+                profile.exit(frame)
+    # enum.IntFlag and enum.Flag are regarded as collections in Python 3.11,
+    # thus enums are checked before mappings and collections. Members are
+    # immutable, so they don't need to be copied either.
+    elif isinstance(obj, Enum):
+        if _has_encoder_in_global_config(type(obj)):
+            return _get_encoder_in_global_config(type(obj))(obj)
+        return obj
     elif isinstance(obj, Mapping):
         return dict((_asdict(k, encode_json=encode_json),
-                     _asdict(v, encode_json=encode_json)) for k, v in
+                     _asdict(v, encode_json=encode_json, include=include,
+                             exclude=exclude)) for k, v in
                     obj.items())
-    # enum.IntFlag and enum.Flag are regarded as collections in Python 3.11, thus a check against Enum is needed
-    elif isinstance(obj, Collection) and not isinstance(obj, (str, bytes, Enum)):
-        return list(_asdict(v, encode_json=encode_json) for v in obj)
+    elif isinstance(obj, Collection) and not isinstance(obj, (str, bytes)):
+        if type(obj) is array:
+            return obj.tolist()
+        ndarray = _ndarray_type()
+        if ndarray is not None and isinstance(obj, ndarray):
+            return obj.tolist()
+        return list(_asdict(v, encode_json=encode_json, include=include,
+                            exclude=exclude) for v in obj)
     # encoding of generics primarily relies on concrete types while decoding relies on type annotations. This makes
     # applying encoders/decoders from global configuration inconsistent.
     elif _has_encoder_in_global_config(type(obj)):
@@ -473,3 +1247,130 @@ def _has_encoder_in_global_config(type_):
 
 def _get_encoder_in_global_config(type_):
     return cfg.global_config.encoders[type_]
+
+
+_LAYOUTS = ('records', 'rows', 'columns')
+
+
+def _check_layout(layout):
+    if layout not in _LAYOUTS:
+        raise ValueError(f"Invalid layout {layout!r}, "
+                         f"must be one of {list(_LAYOUTS)}")
+
+
+def _encoded_field_names(cls):
+    overrides = _user_overrides_or_exts(cls)
+    names = []
+    for field in fields(cls):
+        letter_case = overrides[field.name].letter_case
+        names.append(letter_case(field.name)
+                     if letter_case is not None else field.name)
+    return names
+
+
+def _row_encoder(cls, encode_json=False):
+    """
+    A function encoding an instance of `cls` straight to the list of its
+    encoded field values, in the order of `fields(cls)`, without building the
+    dict of `_asdict` first. None if the records of `cls` don't all have the
+    same fields: with `exclude` predicates, or undefined parameters that are
+    encoded into the record.
+    """
+    overrides = _user_overrides_or_exts(cls)
+    if (any(override.exclude for override in overrides.values())
+            or _undefined_parameter_action_safe(cls) is Undefined.INCLUDE):
+        return None
+    names = _encoded_field_names(cls)
+    if len(set(names)) != len(names):
+        duplicate = next(name for name in names if names.count(name) > 1)
+        raise ValueError(f"Multiple fields map to the same JSON "
+                         f"key after letter case encoding: {duplicate}")
+    cls_fields, get_values = _field_accessor(cls)
+    encoders = [overrides[field.name].encoder for field in cls_fields]
+    qualname = cls.__qualname__
+
+    def encode_row(obj):
+        profile = profiling._active
+        if profile is not None:
+            frame = profile.enter('encode', qualname)
+        try:
+            row = []
+            for field, encoder, value in zip(cls_fields, encoders,
+                                             get_values(obj)):
+                if encoder is not None:
+                    value = profiling._call_hook(profile, 'encoder', encoder,
+                                                 value)
+                else:
+                    if profile is not None:
+                        field_frame = profile.enter('field', field.name)
+                    value = _asdict(value, encode_json=encode_json)
+                    if profile is not None:
+                        profile.exit(field_frame)
+                if encode_json:
+                    value = _encode_json_type(value)
+                row.append(value)
+            if stats._enabled:
+                stats._increment('encoded', qualname)
+            return row
+        finally:
+            if profile is not None:
+                profile.exit(frame)
+
+    return encode_row
+
+
+def _encode_many(cls, objs, encode_json=False, layout='records'):
+    """
+    Encodes instances of `cls` in one of the `_LAYOUTS`: a list of dicts
+    (`records`), `{"fields": [...], "rows": [[...], ...]}` with one list of
+    values per instance (`rows`), or `{"fields": [...], "columns": [[...], ...]}`
+    with one list of values per field (`columns`). Fields are in the order of
+    `fields(cls)` and named as in `to_dict`.
+    """
+    _check_layout(layout)
+    if layout == 'records':
+        return [_asdict(obj, encode_json=encode_json) for obj in objs]
+    names = _encoded_field_names(cls)
+    encode_row = _row_encoder(cls, encode_json=encode_json)
+    rows = []
+    for obj in objs:
+        # instances of subclasses may have more fields
+        if encode_row is not None and type(obj) is cls:
+            rows.append(encode_row(obj))
+            continue
+        record = _asdict(obj, encode_json=encode_json)
+        if len(record) != len(names) or not all(name in record
+                                                for name in names):
+            raise ValueError(
+                f"Cannot encode {cls.__name__} in the {layout!r} layout: "
+                f"expected the fields {names}, got {list(record)}. Fields "
+                f"excluded by `exclude` and undefined parameters are only "
+                f"supported by the 'records' layout.")
+        rows.append([record[name] for name in names])
+    if layout == 'rows':
+        return {'fields': names, 'rows': rows}
+    columns = [list(column) for column in zip(*rows)] if rows else [
+        [] for _ in names]
+    return {'fields': names, 'columns': columns}
+
+
+def _records(data, layout='records'):
+    """
+    The records (dicts) of data in any of the layouts produced by
+    `_encode_many`. The `fields` of `rows` and `columns` may be in any order.
+    """
+    _check_layout(layout)
+    if layout == 'records':
+        return data
+    names = data['fields']
+    rows = data['rows'] if layout == 'rows' else zip(*data['columns'])
+    return (dict(zip(names, row)) for row in rows)
+
+
+def _decode_many(cls, data, infer_missing=False, layout='records'):
+    """
+    Decodes a list of instances of `cls` from any of the layouts produced by
+    `_encode_many`.
+    """
+    return [_decode_dataclass(cls, kvs, infer_missing)
+            for kvs in _records(data, layout)]
@@ -3,6 +3,7 @@
 import typing
 import warnings
 import sys
+from array import array
 from copy import deepcopy
 
 from dataclasses import MISSING, is_dataclass, fields as dc_fields
@@ -16,9 +17,13 @@ from typing_inspect import is_union_type  # type: ignore
 from marshmallow import fields, Schema, post_load  # type: ignore
 from marshmallow.exceptions import ValidationError  # type: ignore
 
+from dataclasses_json import cfg
 from dataclasses_json.core import (_is_supported_generic, _decode_dataclass,
-                                   _ExtendedEncoder, _user_overrides_or_exts)
+                                   _decode_array, _decode_ndarray,
+                                   _ExtendedEncoder, _user_overrides_or_exts,
+                                   _warn)
 from dataclasses_json.utils import (_is_collection, _is_optional,
+                                    _is_ndarray_type,
                                     _issubclass_safe, _timestamp_to_dt_aware,
                                     _is_new_type, _get_type_origin,
                                     _handle_undefined_parameters_safe,
@@ -37,7 +42,7 @@ class _TimestampField(fields.Field):
 
     def _deserialize(self, value, attr, data, **kwargs):
         if value is not None:
-            return _timestamp_to_dt_aware(value)
+            return _timestamp_to_dt_aware(value, cfg.global_config.timestamp_tz)
         else:
             if not self.required:
                 return None
@@ -85,11 +90,12 @@ class _UnionField(fields.Field):
             elif isinstance(value, _get_type_origin(type_)):
                 return schema_._serialize(value, attr, obj, **kwargs)
         else:
-            warnings.warn(
-                f'The type "{type(value).__name__}" (value: "{value}") '
-                f'is not in the list of possible types of typing.Union '
-                f'(dataclass: {self.cls.__name__}, field: {self.field.name}). '
-                f'Value cannot be serialized properly.')
+            _warn(
+                f'{self.cls.__qualname__}.{self.field.name}:union_serialize',
+                lambda: f'The type "{type(value).__name__}" (value: "{value}") '
+                        f'is not in the list of possible types of typing.Union '
+                        f'(dataclass: {self.cls.__name__}, field: {self.field.name}). '
+                        f'Value cannot be serialized properly.')
         return super()._serialize(value, attr, obj, **kwargs)
 
     def _deserialize(self, value, attr, data, **kwargs):
@@ -101,11 +107,12 @@ class _UnionField(fields.Field):
                     del tmp_value['__type']
                     return schema_._deserialize(tmp_value, attr, data, **kwargs)
         elif isinstance(tmp_value, dict):
-            warnings.warn(
-                f'Attempting to deserialize "dict" (value: "{tmp_value}) '
-                f'that does not have a "__type" type specifier field into'
-                f'(dataclass: {self.cls.__name__}, field: {self.field.name}).'
-                f'Deserialization may fail, or deserialization to wrong type may occur.'
+            _warn(
+                f'{self.cls.__qualname__}.{self.field.name}:union_type_specifier',
+                lambda: f'Attempting to deserialize "dict" (value: "{tmp_value}) '
+                        f'that does not have a "__type" type specifier field into'
+                        f'(dataclass: {self.cls.__name__}, field: {self.field.name}).'
+                        f'Deserialization may fail, or deserialization to wrong type may occur.'
             )
             return super()._deserialize(tmp_value, attr, data, **kwargs)
         else:
@@ -113,14 +120,47 @@ class _UnionField(fields.Field):
                 if isinstance(tmp_value, _get_type_origin(type_)):
                     return schema_._deserialize(tmp_value, attr, data, **kwargs)
             else:
-                warnings.warn(
-                    f'The type "{type(tmp_value).__name__}" (value: "{tmp_value}") '
-                    f'is not in the list of possible types of typing.Union '
-                    f'(dataclass: {self.cls.__name__}, field: {self.field.name}). '
-                    f'Value cannot be deserialized properly.')
+                _warn(
+                    f'{self.cls.__qualname__}.{self.field.name}:union_deserialize',
+                    lambda: f'The type "{type(tmp_value).__name__}" (value: "{tmp_value}") '
+                            f'is not in the list of possible types of typing.Union '
+                            f'(dataclass: {self.cls.__name__}, field: {self.field.name}). '
+                            f'Value cannot be deserialized properly.')
             return super()._deserialize(tmp_value, attr, data, **kwargs)
 
 
+class _ArrayField(fields.Field):
+    """
+    `array.array` fields and numeric list fields with `config(compact=...)`,
+    (de)serialized as lists of numbers
+    """
+    def __init__(self, typecode=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.typecode = typecode
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        return None if value is None else value.tolist()
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        return _decode_array(value, self.typecode)
+
+
+class _NdarrayField(fields.Field):
+    """
+    `numpy.ndarray` fields, (de)serialized as (nested) lists
+    """
+    def __init__(self, type_, dtype=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.type_ = type_
+        self.dtype = dtype
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        return None if value is None else value.tolist()
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        return _decode_ndarray(self.type_, value, self.dtype)
+
+
 class _TupleVarLen(fields.List):
     """
     variable-length homogeneous tuples
@@ -243,6 +283,11 @@ def build_type(type_, options, mixin, field, cls):
 
             type_ = type_.__supertype__
 
+        if type_ is array:
+            return _ArrayField(**options)
+        if _is_ndarray_type(type_):
+            return _NdarrayField(type_, **options)
+
         if is_dataclass(type_):
             if _issubclass_safe(type_, mixin):
                 options['field_many'] = bool(
@@ -326,7 +371,12 @@ def schema(cls, mixin, infer_missing):
             if metadata.letter_case is not None:
                 options['data_key'] = metadata.letter_case(field.name)
 
-            t = build_type(type_, options, mixin, field, cls)
+            if metadata.compact is not None:
+                t = _ArrayField(metadata.compact, **options)
+            elif metadata.dtype is not None and _is_ndarray_type(type_):
+                t = _NdarrayField(type_, metadata.dtype, **options)
+            else:
+                t = build_type(type_, options, mixin, field, cls)
             if field.metadata.get('dataclasses_json', {}).get('decoder'):
                 # If the field defines a custom decoder, it should completely replace the Marshmallow field's conversion
                 # logic.
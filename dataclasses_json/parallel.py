@@ -0,0 +1,80 @@
+"""
+Decoding of large batches in worker processes.
+
+    from dataclasses_json.parallel import parallel_decode
+
+    orders = parallel_decode(Order, chunks, workers=8)
+
+Decoding is CPU-bound Python code, so with the GIL threads don't help; the
+chunks are decoded in a `concurrent.futures.ProcessPoolExecutor` instead. The
+decoded instances are pickled back to the calling process, so the class must
+be importable by the workers, i.e. defined at the top level of a module.
+
+On free-threaded builds of Python (3.13t and later) `threads=True` decodes in
+a `ThreadPoolExecutor`, which scales just as well without pickling anything.
+"""
+import json
+import os
+import pickle
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import Any, Iterable, List, Optional, Type, TypeVar, Union
+
+from dataclasses_json.columns import Columns, _concat_columns, _decode_columns
+from dataclasses_json.core import _decode_many, _records
+
+T = TypeVar('T')
+
+
+def parallel_decode(cls: Type[T],
+                    chunks: Iterable[Any],
+                    *,
+                    layout: str = 'records',
+                    infer_missing: bool = False,
+                    columnar: bool = False,
+                    workers: Optional[int] = None,
+                    threads: bool = False,
+                    executor: Optional[Executor] = None
+                    ) -> Union[List[T], Columns[T]]:
+    """
+    Decodes `chunks` in parallel and returns the results of all chunks in
+    order, concatenated into one list of instances (or one `Columns` with
+    `columnar=True`).
+
+    A chunk is a JSON document (`str` or `bytes`, which are shipped to the
+    workers as is and parsed there) or already parsed data, holding records
+    in one of the layouts of `to_json_many`. The chunks are decoded in a new
+    `ProcessPoolExecutor` (or `ThreadPoolExecutor` with `threads=True`) with
+    `workers` workers, by default one per CPU, unless an `executor` is given.
+    """
+    if executor is None and not threads:
+        _check_picklable(cls)
+    args = ((cls, chunk, layout, infer_missing, columnar) for chunk in chunks)
+    if executor is None:
+        pool_type = ThreadPoolExecutor if threads else ProcessPoolExecutor
+        with pool_type(max_workers=workers or os.cpu_count()) as pool:
+            results = list(pool.map(_decode_chunk, args))
+    else:
+        results = list(executor.map(_decode_chunk, args))
+    if columnar:
+        return _concat_columns(cls, results)
+    return [instance for result in results for instance in result]
+
+
+def _decode_chunk(args):
+    cls, chunk, layout, infer_missing, columnar = args
+    if isinstance(chunk, (str, bytes, bytearray)):
+        chunk = json.loads(chunk)
+    if columnar:
+        return _decode_columns(cls, _records(chunk, layout), infer_missing)
+    return _decode_many(cls, chunk, infer_missing, layout=layout)
+
+
+def _check_picklable(cls) -> None:
+    try:
+        pickle.dumps(cls)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise ValueError(
+            f"{cls.__qualname__} can't be decoded in worker processes, "
+            f"because they can't import it: define it at the top level of "
+            f"an importable module ({e})") from e
@@ -0,0 +1,173 @@
+"""
+Opt-in timing instrumentation of encoding and decoding.
+
+    from dataclasses_json.profiling import profile
+
+    with profile() as prof:
+        MyClass.from_json(payload)
+    prof.as_dict()     # per class and per field call counts and timings
+    prof.collapsed()   # collapsed stacks, e.g. for flamegraph.pl / speedscope
+
+Profiling only has an effect inside the `with` block, outside of it the
+instrumentation boils down to a single `None` check per dataclass.
+"""
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# (kind, name) where kind is one of 'decode', 'encode', 'field', 'decoder'
+# and 'encoder'
+Frame = Tuple[str, str]
+Path = Tuple[Frame, ...]
+
+_active: Optional["Profile"] = None
+# the `profile()` blocks that have not ended yet, in the order they started;
+# `_active` is the last of them
+_profiles: List["Profile"] = []
+_profiles_lock = threading.Lock()
+
+
+class Profile:
+    """
+    Collects call counts and timings of the instrumented frames. A frame is
+    the decoding or encoding of a dataclass, the conversion of one of its
+    fields, or a call to a custom `decoder` / `encoder` callable.
+    """
+
+    def __init__(self):
+        # path of frames -> [calls, inclusive time, exclusive time]
+        self._stats: Dict[Path, List[Any]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enter(self, kind: str, name: str) -> int:
+        """
+        Starts a frame and returns a token to pass to the matching `exit`.
+        """
+        stack = self._stack()
+        parent = stack[-1][0] if stack else ()
+        stack.append([parent + ((kind, name),), perf_counter(), 0.0])
+        return len(stack) - 1
+
+    def exit(self, token: int) -> None:
+        """
+        Ends the frame started by the `enter` call that returned `token`.
+        Frames that were started after it and never ended (because an
+        exception was raised in between) are discarded.
+        """
+        stack = self._stack()
+        path, start, children = stack[token]
+        del stack[token:]
+        elapsed = perf_counter() - start
+        if stack:
+            stack[-1][2] += elapsed
+        with self._lock:
+            stats = self._stats.setdefault(path, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += elapsed - children
+
+    def _stack(self) -> list:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregated statistics, all times in seconds:
+
+            {'decode': {cls_name: {'calls': ..., 'time': ..., 'self_time': ...,
+                                   'fields': {field_name: {...}}}},
+             'encode': {...},
+             'decoders': {callable_name: {'calls': ..., 'time': ...}},
+             'encoders': {...}}
+
+        `time` includes nested calls (counted once for recursive calls),
+        `self_time` excludes the time spent in instrumented children.
+        """
+        result: Dict[str, Dict[str, Any]] = {
+            'decode': {}, 'encode': {}, 'decoders': {}, 'encoders': {}}
+        with self._lock:
+            items = list(self._stats.items())
+        for path, (calls, inclusive, exclusive) in items:
+            kind, name = path[-1]
+            if kind in ('decode', 'encode'):
+                entry = result[kind].setdefault(name, _new_entry(fields=True))
+            elif kind == 'field':
+                owner_kind, owner = path[-2]
+                owner_entry = result[owner_kind].setdefault(
+                    owner, _new_entry(fields=True))
+                entry = owner_entry['fields'].setdefault(name, _new_entry())
+            else:
+                entry = result[kind + 's'].setdefault(name, _new_entry())
+            entry['calls'] += calls
+            entry['self_time'] += exclusive
+            # only the outermost of recursive frames adds to the total time
+            if path[-1] not in path[:-1]:
+                entry['time'] += inclusive
+        return result
+
+    def collapsed(self) -> str:
+        """
+        The exclusive time of every stack in the collapsed stack format used
+        by flame graph tools: one `frame;frame;frame <microseconds>` per line.
+        """
+        with self._lock:
+            items = sorted(self._stats.items())
+        return '\n'.join(
+            f"{';'.join(_frame_label(frame) for frame in path)} "
+            f"{round(exclusive * 1e6)}"
+            for path, (_, _, exclusive) in items)
+
+
+def _new_entry(fields: bool = False) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {'calls': 0, 'time': 0.0, 'self_time': 0.0}
+    if fields:
+        entry['fields'] = {}
+    return entry
+
+
+def _frame_label(frame: Frame) -> str:
+    kind, name = frame
+    return name if kind == 'field' else f'{kind}:{name}'
+
+
+def _callable_name(fn) -> str:
+    return getattr(fn, '__qualname__', None) or repr(fn)
+
+
+def _call_hook(profile: Optional[Profile], kind: str, hook, value):
+    """
+    Calls a custom `decoder` or `encoder` and, if `profile` is set, records
+    it as a frame of the given kind.
+    """
+    if profile is None:
+        return hook(value)
+    token = profile.enter(kind, _callable_name(hook))
+    try:
+        return hook(value)
+    finally:
+        profile.exit(token)
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Profiles all encoding and decoding done (in any thread) inside the
+    `with` block. While blocks overlap, the one started last collects;
+    blocks may end in any order.
+    """
+    global _active
+    prof = Profile()
+    with _profiles_lock:
+        _profiles.append(prof)
+        _active = prof
+    try:
+        yield prof
+    finally:
+        with _profiles_lock:
+            _profiles.remove(prof)
+            _active = _profiles[-1] if _profiles else None
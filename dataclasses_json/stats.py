@@ -0,0 +1,148 @@
+"""
+Counters for production observability of encoding and decoding.
+
+    from dataclasses_json import stats
+
+    stats.enable()
+    ...
+    stats.snapshot()    # {'decoded': {'MyClass': 1200}, ...}
+    stats.prometheus()  # the same counters in the Prometheus text format
+
+Collection is disabled by default; while disabled every hook costs a single
+flag check. The counters are:
+
+- `decoded` / `encoded`: dataclass instances successfully decoded / encoded,
+  per class
+- `union_attempts`: attempts to decode a dict into a dataclass of a `Union`,
+  per dataclass, and `union_attempt_failures` for the attempts that raised
+- `union_unmatched`: dicts that matched none of the dataclasses of a `Union`
+- `infer_missing`: missing fields set to `None` because of
+  `infer_missing=True`, per `Class.field`
+- `undefined_parameters`: undefined parameters encountered, per
+  `Undefined` action
+- `decode_cache_hits` / `decode_cache_misses`: lookups in the decode cache
+  of `from_json` (see `dataclasses_json.cache`), per class
+- `warnings`: warnings suppressed by `WarningPolicy.AGGREGATE`, per warning
+  site. These are counted even while collection is disabled.
+"""
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Tuple
+
+METRICS = ('decoded', 'encoded', 'union_attempts', 'union_attempt_failures',
+           'union_unmatched', 'infer_missing', 'undefined_parameters',
+           'decode_cache_hits', 'decode_cache_misses', 'warnings')
+
+_LABELS = {
+    'decoded': 'class',
+    'encoded': 'class',
+    'union_attempts': 'class',
+    'union_attempt_failures': 'class',
+    'union_unmatched': 'union',
+    'infer_missing': 'field',
+    'undefined_parameters': 'action',
+    'decode_cache_hits': 'class',
+    'decode_cache_misses': 'class',
+    'warnings': 'site',
+}
+
+_enabled = False
+
+# every thread counts in its own dicts, so that counting doesn't make
+# concurrent decoding wait on a lock; `snapshot` adds them up
+_Counters = DefaultDict[str, DefaultDict[str, int]]
+_local = threading.local()
+# guards `_threads` and `_retired`, not the counters themselves
+_lock = threading.Lock()
+_threads: List[Tuple[threading.Thread, _Counters]] = []
+# the counts of threads that have ended
+_retired: _Counters = defaultdict(lambda: defaultdict(int))
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """
+    Sets all counters to zero. Increments in other threads running at the
+    same time may or may not be counted.
+    """
+    with _lock:
+        _retired.clear()
+        for _, counters in _threads:
+            counters.clear()
+
+
+def _increment(metric: str, label: str, amount: int = 1) -> None:
+    try:
+        counters = _local.counters
+    except AttributeError:
+        counters = _register_thread()
+    counters[metric][label] += amount
+
+
+def _register_thread() -> _Counters:
+    counters: _Counters = defaultdict(lambda: defaultdict(int))
+    _local.counters = counters
+    with _lock:
+        _retire_ended_threads()
+        _threads.append((threading.current_thread(), counters))
+    return counters
+
+
+def snapshot() -> Dict[str, Dict[str, int]]:
+    """
+    A copy of all counters as `{metric: {label: count}}`, summed over all
+    threads. Metrics that were never incremented map to an empty dict.
+    """
+    totals: _Counters = defaultdict(lambda: defaultdict(int))
+    with _lock:
+        _retire_ended_threads()
+        for counters in [_retired] + [counters for _, counters in _threads]:
+            # copies are atomic, the owning thread may be counting right now
+            for metric, counts in list(counters.items()):
+                for label, count in counts.copy().items():
+                    totals[metric][label] += count
+    return {metric: dict(totals.get(metric, {})) for metric in METRICS}
+
+
+def _retire_ended_threads() -> None:
+    for entry in [entry for entry in _threads if not entry[0].is_alive()]:
+        _threads.remove(entry)
+        for metric, counts in entry[1].items():
+            for label, count in counts.items():
+                _retired[metric][label] += count
+
+
+def prometheus(prefix: str = 'dataclasses_json') -> str:
+    """
+    All counters in the Prometheus text exposition format, e.g.
+
+        # TYPE dataclasses_json_decoded_total counter
+        dataclasses_json_decoded_total{class="MyClass"} 1200
+    """
+    lines = []
+    for metric, counts in snapshot().items():
+        name = f'{prefix}_{metric}_total'
+        lines.append(f'# TYPE {name} counter')
+        for label, count in sorted(counts.items()):
+            lines.append(f'{name}{{{_LABELS[metric]}="{_escape(label)}"}} '
+                         f'{count}')
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(label: str) -> str:
+    return (label.replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\n', '\\n'))
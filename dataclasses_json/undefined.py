@@ -9,6 +9,7 @@ from enum import Enum
 
 from marshmallow.exceptions import ValidationError  # type: ignore
 
+from dataclasses_json import stats
 from dataclasses_json.utils import CatchAllVar
 
 KnownParameters = Dict[str, Any]
@@ -54,6 +55,10 @@ class _UndefinedParameterAction(abc.ABC):
                                     k not in field_names}
         known_given_parameters = {k: v for k, v in kvs.items() if
                                   k in field_names}
+        if stats._enabled and unknown_given_parameters:
+            stats._increment('undefined_parameters',
+                             _undefined_parameter_action_name(cls),
+                             len(unknown_given_parameters))
         return known_given_parameters, unknown_given_parameters
 
 
@@ -199,7 +204,8 @@ class _CatchAllUndefinedParameters(_UndefinedParameterAction):
     def handle_to_dict(obj, kvs: Dict[Any, Any]) -> Dict[Any, Any]:
         catch_all_field = \
             _CatchAllUndefinedParameters._get_catch_all_field(obj.__class__)
-        undefined_parameters = kvs.pop(catch_all_field.name)
+        # the catch-all field is missing if it was excluded from encoding
+        undefined_parameters = kvs.pop(catch_all_field.name, None)
         if isinstance(undefined_parameters, dict):
             kvs.update(
                 undefined_parameters)  # If desired handle letter case here
@@ -273,6 +279,13 @@ class Undefined(Enum):
     EXCLUDE = _IgnoreUndefinedParameters
 
 
+def _undefined_parameter_action_name(cls) -> str:
+    try:
+        return cls.dataclass_json_config['undefined'].name
+    except (AttributeError, KeyError, TypeError):
+        return 'UNKNOWN'
+
+
 class UndefinedParameterError(ValidationError):
     """
     Raised when something has gone wrong handling undefined parameters.
@@ -1,10 +1,11 @@
+import functools
 import inspect
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timezone, tzinfo
 from collections import Counter
 from dataclasses import is_dataclass  # type: ignore
-from typing import (Collection, Mapping, Optional, TypeVar, Any, Type, Tuple,
-                    Union, cast)
+from typing import (Collection, Dict, Iterable, Mapping, Optional, TypeVar,
+                    Any, Type, Tuple, Union, cast)
 
 
 def _get_type_cons(type_):
@@ -165,16 +166,102 @@ def _is_nonstr_collection(type_):
             and not _issubclass_safe(type_, str))
 
 
+def _ndarray_type() -> Optional[type]:
+    """
+    `numpy.ndarray` if numpy has been imported (by anyone), else `None`.
+    Fields can only be annotated with numpy types once numpy is imported, so
+    there is no need to ever import it here.
+    """
+    numpy = sys.modules.get('numpy')
+    return numpy.ndarray if numpy is not None else None
+
+
+def _is_ndarray_type(type_) -> bool:
+    ndarray = _ndarray_type()
+    return ndarray is not None and (
+        type_ is ndarray or getattr(type_, '__origin__', None) is ndarray)
+
+
+def _ndarray_dtype(type_) -> Optional[type]:
+    """
+    The scalar type of an `ndarray` annotation such as
+    `numpy.typing.NDArray[numpy.float64]`, or `None` if it has none.
+    """
+    args: Tuple[Any, ...] = getattr(type_, '__args__', None) or ()
+    if len(args) == 2:
+        dtype_args: Tuple[Any, ...] = getattr(args[1], '__args__', None) or ()
+        if dtype_args and _issubclass_safe(dtype_args[0],
+                                           sys.modules['numpy'].generic):
+            return dtype_args[0]
+    return None
+
+
 def _is_generic_dataclass(type_):
     return is_dataclass(_get_type_origin(type_))
 
 
-def _timestamp_to_dt_aware(timestamp: float):
-    tz = datetime.now(timezone.utc).astimezone().tzinfo
+def _class_cached(fn):
+    """
+    Caches the result of `fn(cls)` as an attribute of `cls` itself, so that
+    it goes away together with the class: classes created at runtime (e.g.
+    by `make_dataclass`) can still be garbage collected. Classes that don't
+    accept attributes are not cached.
+    """
+    attr = f'_dataclasses_json{fn.__name__}'
+
+    @functools.wraps(fn)
+    def cached(cls):
+        try:
+            return cls.__dict__[attr]
+        except KeyError:
+            pass
+        result = fn(cls)
+        try:
+            setattr(cls, attr, result)
+        except (AttributeError, TypeError):
+            pass
+        return result
+
+    return cached
+
+
+@functools.lru_cache(maxsize=None)
+def _local_timezone() -> Optional[tzinfo]:
+    """
+    Resolving the local timezone requires a `now()` and an `astimezone()`
+    call, so it is done once and cached. The cache has to be cleared
+    (see `cfg.refresh_local_timezone`) if the local offset changes during
+    the lifetime of the process, e.g. on a DST transition.
+    """
+    return datetime.now(timezone.utc).astimezone().tzinfo
+
+
+def _timestamp_to_dt_aware(timestamp: float, tz: Optional[tzinfo] = None):
+    if tz is None:
+        tz = _local_timezone()
     dt = datetime.fromtimestamp(timestamp, tz=tz)
     return dt
 
 
+FieldPaths = Dict[str, Optional["FieldPaths"]]  # type: ignore[misc]
+
+
+def _parse_field_paths(paths: Iterable[str]) -> FieldPaths:
+    """
+    Turns dotted field paths into a tree, e.g. `["id", "user.name"]` becomes
+    `{"id": None, "user": {"name": None}}`. `None` selects the entire field.
+    """
+    if isinstance(paths, str):
+        raise TypeError(f"Expected a collection of field paths, "
+                        f"got the str {paths!r}")
+    grouped: Dict[str, list] = {}
+    for path in paths:
+        head, _, rest = path.partition('.')
+        grouped.setdefault(head, []).append(rest)
+    return {head: None if '' in rests else _parse_field_paths(rests)
+            for head, rests in grouped.items()}
+
+
 def _undefined_parameter_action_safe(cls):
     try:
         if cls.dataclass_json_config is None:
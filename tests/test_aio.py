@@ -0,0 +1,255 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from dataclasses_json import DataClassJsonMixin, dataclass_json
+from dataclasses_json.aio import _ArrayParser, write_json, write_jsonl
+
+
+@dataclass
+class Item(DataClassJsonMixin):
+    id: int
+    name: str
+
+
+@dataclass_json
+@dataclass
+class Tagged:
+    tags: List[str]
+
+
+items = [Item(i, f'ité{i}') for i in range(250)]
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def _collect(aiterable):
+    return [item async for item in aiterable]
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class _Writer:
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.drains = 0
+
+    def write(self, data: bytes):
+        self.chunks.append(data)
+
+    async def drain(self):
+        self.drains += 1
+
+    def getvalue(self) -> str:
+        return b''.join(self.chunks).decode()
+
+
+class TestAiterJsonl:
+    payload = '\n'.join(item.to_json(ensure_ascii=False)
+                        for item in items).encode()
+
+    def test_split_chunks(self):
+        # 7 byte chunks split lines and multi-byte characters
+        assert _run(_collect(Item.aiter_jsonl(_chunks(self.payload)))) == items
+
+    def test_stream_reader(self):
+        async def decode():
+            return await _collect(Item.aiter_jsonl(_reader(self.payload)))
+
+        assert _run(decode()) == items
+
+    def test_blank_lines_and_trailing_newline(self):
+        payload = b'\n{"id": 1, "name": "a"}\n\n{"id": 2, "name": "b"}\n'
+        assert _run(_collect(Item.aiter_jsonl(_chunks(payload)))) == \
+            [Item(1, 'a'), Item(2, 'b')]
+
+    def test_decorated_class(self):
+        payload = b'{"tags": ["a"]}\n{"tags": []}'
+        assert _run(_collect(Tagged.aiter_jsonl(_chunks(payload)))) == \
+            [Tagged(['a']), Tagged([])]
+
+    def test_yields_to_the_event_loop(self):
+        ticks = []
+
+        async def decode():
+            async def tick():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            ticker = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            async for _ in Item.aiter_jsonl(_reader(self.payload),
+                                            yield_every=10):
+                pass
+            ticker.cancel()
+
+        _run(decode())
+        # the reader has all data buffered, so only `yield_every` suspends
+        assert len(ticks) >= len(items) // 10
+
+
+class TestImport:
+    def test_asyncio_is_imported_on_first_use(self):
+        code = ('import sys, dataclasses_json; '
+                'assert "asyncio" not in sys.modules, "asyncio"; '
+                'assert "dataclasses_json.aio" not in sys.modules, "aio"')
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestAiterJson:
+    payload = json.dumps([item.to_dict() for item in items],
+                         ensure_ascii=False).encode()
+
+    @pytest.mark.parametrize('size', [1, 7, 1000])
+    def test_split_chunks(self, size):
+        decoded = _run(_collect(Item.aiter_json(_chunks(self.payload, size))))
+        assert decoded == items
+
+    def test_stream_reader(self):
+        async def decode():
+            return await _collect(Item.aiter_json(_reader(self.payload)))
+
+        assert _run(decode()) == items
+
+    def test_str_chunks(self):
+        async def chunks():
+            yield ' [ {"id": 1, "name": "a"} ,'
+            yield '{"id": 2, "name": "b"}]\n'
+
+        assert _run(_collect(Item.aiter_json(chunks()))) == \
+            [Item(1, 'a'), Item(2, 'b')]
+
+    def test_empty_array(self):
+        assert _run(_collect(Item.aiter_json(_chunks(b'[ ]')))) == []
+
+    @pytest.mark.parametrize('payload', [b'{"id": 1}', b'[{"id": 1, "name": "a"}',
+                                         b'[{"id": 1, "name": "a"}] []',
+                                         b'[{"id": 1, "name": "a"} {}]'])
+    def test_invalid(self, payload):
+        with pytest.raises(ValueError):
+            _run(_collect(Item.aiter_json(_chunks(payload))))
+
+    @pytest.mark.parametrize('yield_every', [0, -1])
+    @pytest.mark.parametrize('aiter', ['aiter_json', 'aiter_jsonl'])
+    def test_non_positive_yield_every(self, aiter, yield_every):
+        stream = getattr(Item, aiter)(_chunks(b'[]'), yield_every=yield_every)
+        with pytest.raises(ValueError, match='yield_every'):
+            _run(_collect(stream))
+
+    @pytest.mark.parametrize('size', [1, 2, 5])
+    def test_parser_split_anywhere(self, size):
+        text = ('[1, -2.5e3, "a\\\\\\"]b{", true, null, '
+                '{"k": ["]", {}], "\\u00e9": "}"}, [], 7]')
+        parser = _ArrayParser()
+        elements = []
+        for i in range(0, len(text), size):
+            elements += parser.feed(text[i:i + size])
+        elements += parser.feed('', final=True)
+        assert elements == json.loads(text)
+
+    def test_parser_large_element_in_small_chunks(self):
+        parser = _ArrayParser()
+        assert parser.feed('[{"a": "') == []
+        for _ in range(1000):
+            assert parser.feed('x' * 10) == []
+        assert parser.feed('"}, 1') == [{'a': 'x' * 10000}]
+        assert parser.feed(']', final=True) == [1]
+
+
+class TestWrite:
+    def test_write_jsonl(self):
+        writer = _Writer()
+        _run(write_jsonl(items, writer, chunk_size=100))
+        assert len(writer.chunks) == writer.drains == 3
+        lines = writer.getvalue().splitlines()
+        assert [Item.from_json(line) for line in lines] == items
+
+    def test_write_json(self):
+        writer = _Writer()
+        _run(write_json(items, writer, chunk_size=100))
+        assert len(writer.chunks) == writer.drains == 3
+        assert Item.schema().loads(writer.getvalue(), many=True) == items
+
+    @pytest.mark.parametrize('count', [0, 1, 100])
+    def test_write_json_boundaries(self, count):
+        writer = _Writer()
+        _run(write_json(items[:count], writer, chunk_size=100))
+        assert [Item.from_dict(kvs) for kvs in json.loads(writer.getvalue())] \
+            == items[:count]
+
+    def test_round_trip(self):
+        writer = _Writer()
+        _run(write_json(items, writer, chunk_size=30))
+        payload = b''.join(writer.chunks)
+        assert _run(_collect(Item.aiter_json(_chunks(payload, 64)))) == items
+
+
+class TestFromDictManyAsync:
+    records = [item.to_dict() for item in items]
+
+    def test_decodes_in_chunks(self):
+        ticks = []
+
+        async def decode():
+            async def tick():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            ticker = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            decoded = await Item.from_dict_many_async(self.records,
+                                                      chunk_size=50)
+            ticker.cancel()
+            return decoded
+
+        assert _run(decode()) == items
+        # once per chunk boundary, plus the first tick
+        assert len(ticks) >= 5
+
+    def test_table_layout(self):
+        payload = json.loads(Item.to_json_many(items, layout='columns'))
+        assert _run(Item.from_dict_many_async(payload,
+                                              layout='columns')) == items
+
+    def test_decorated_class(self):
+        decoded = _run(Tagged.from_dict_many_async([{'tags': ['a']}]))
+        assert decoded == [Tagged(['a'])]
+
+    @pytest.mark.parametrize('chunk_size', [0, -1])
+    def test_non_positive_chunk_size(self, chunk_size):
+        with pytest.raises(ValueError, match='chunk_size'):
+            _run(Item.from_dict_many_async(self.records,
+                                           chunk_size=chunk_size))
+
+    def test_max_stall(self):
+        assert _run(Item.from_dict_many_async(self.records, chunk_size=1,
+                                              max_stall=0.001)) == items
+
+    def test_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            decoded = _run(Item.from_dict_many_async(self.records,
+                                                     chunk_size=30,
+                                                     executor=executor))
+        assert decoded == items
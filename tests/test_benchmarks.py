@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from benchmarks import check, run
+from benchmarks.workloads import BENCHMARKS
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_workload_runs(name):
+    assert BENCHMARKS[name]() is not None
+
+
+def test_results_format(tmp_path, monkeypatch):
+    monkeypatch.setattr(run, "time_interleaved",
+                        lambda fn, repeat: {"median": 1.0, "min": 1.0, "rounds": repeat,
+                                            "calibration": 1.0, "ratio": 1.0})
+    output = tmp_path / "results.json"
+    assert run.main(["-k", "flat_wide", "--repeat", "1", "-o", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert results["format"] == run.RESULTS_FORMAT
+    assert sorted(results["benchmarks"]) == ["flat_wide.from_dict", "flat_wide.to_dict"]
+    assert set(results["environment"]) >= {"python", "dataclasses_json"}
+
+
+def test_time_interleaved():
+    timing = run.time_interleaved(lambda: None, repeat=3)
+    assert timing["rounds"] == 3
+    assert timing["calibration"] > 0
+    assert 0 <= timing["ratio"] < 1
+
+
+def _results(calibration, **timings):
+    return {"format": run.RESULTS_FORMAT, "calibration": calibration,
+            "benchmarks": {name.replace("_", "."): {"min": value,
+                                                    "ratio": value / calibration}
+                           for name, value in timings.items()}}
+
+
+class TestCheck:
+    def test_normalizes_by_calibration(self):
+        baseline = _results(1.0, a_x=1.0, a_y=1.0)
+        # twice as slow a machine, but also one real regression
+        current = _results(2.0, a_x=2.2, a_y=3.0)
+        comparisons = {c.name: c for c in check.compare(baseline, current, 0.25)}
+        assert not comparisons["a.x"].regressed
+        assert comparisons["a.y"].regressed
+        assert comparisons["a.y"].change == pytest.approx(0.5)
+
+    def test_per_benchmark_tolerances(self):
+        baseline = _results(1.0, a_x=1.0)
+        baseline["tolerances"] = {"a.x": 1.0}
+        current = _results(1.0, a_x=1.8)
+        assert not check.compare(baseline, current, 0.25)[0].regressed
+
+    def test_new_and_missing_benchmarks(self):
+        comparisons = check.compare(_results(1.0, a_x=1.0), _results(1.0, a_y=1.0))
+        assert [c.status for c in comparisons] == ["missing", "new"]
+        assert not any(c.regressed for c in comparisons)
+        assert "missing" in check.format_report(comparisons)
+
+    def test_main_fails_on_regression(self, tmp_path, monkeypatch, capsys):
+        baseline_path = tmp_path / "baseline.json"
+        baseline_path.write_text(json.dumps(_results(1.0, a_x=1.0)))
+        monkeypatch.setattr(run, "run", lambda names, repeat: _results(1.0, a_x=2.0))
+        assert check.main(["--baseline", str(baseline_path)]) == 1
+        assert "REGRESSED" in capsys.readouterr().out
+        monkeypatch.setattr(run, "run", lambda names, repeat: _results(1.0, a_x=1.1))
+        assert check.main(["--baseline", str(baseline_path)]) == 0
@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from dataclasses_json import (Columns, DataClassJsonMixin, LetterCase,
+                              Undefined, dataclass_json)
+
+
+@dataclass
+class Address(DataClassJsonMixin):
+    city: str
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL,  # type: ignore[arg-type]
+                undefined=Undefined.EXCLUDE)
+@dataclass
+class Sale:
+    sale_id: int
+    amount: float
+    sold_at: datetime
+    address: Address
+    tags: List[str] = field(default_factory=list)
+    note: Optional[str] = None
+
+
+sold_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+records = [
+    {'saleId': 1, 'amount': 2, 'soldAt': sold_at.timestamp(),
+     'address': {'city': 'Oslo'}, 'unknown': True},
+    {'saleId': 2, 'amount': 3.5, 'soldAt': sold_at.timestamp(),
+     'address': {'city': 'Rome'}, 'tags': ['a'], 'note': 'n'},
+]
+
+
+class TestColumnar:
+    def test_columns_are_decoded(self):
+        table = Sale.from_dict_many(records, columnar=True)  # type: ignore[attr-defined]
+        assert isinstance(table, Columns) and len(table) == 2
+        assert table.columns['amount'] == [2.0, 3.5]
+        assert isinstance(table.columns['amount'][0], float)
+        assert table.columns['sold_at'] == [sold_at, sold_at]
+        assert table.columns['address'] == [Address('Oslo'), Address('Rome')]
+        assert table.columns['tags'] == [[], ['a']]
+        assert table.columns['note'] == [None, 'n']
+
+    def test_row_views(self):
+        table = Sale.from_dict_many(records, columnar=True)  # type: ignore[attr-defined]
+        row = table[-1]
+        assert row.sale_id == 2 and row.address.city == 'Rome'
+        with pytest.raises(AttributeError):
+            row.unknown
+        with pytest.raises(IndexError):
+            table[2]
+        assert [row.sale_id for row in table] == [1, 2]
+
+    def test_instances_match_from_dict(self):
+        table = Sale.from_dict_many(records, columnar=True)  # type: ignore[attr-defined]
+        expected = [Sale.from_dict(record) for record in records]  # type: ignore[attr-defined]
+        assert table[0].instance() == expected[0]
+        assert table.instances() == expected
+        assert Sale.from_dict_many(records) == expected  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize('layout', ['rows', 'columns'])
+    def test_from_table_layouts(self, layout):
+        sales = Sale.from_dict_many(records)  # type: ignore[attr-defined]
+        encoded = Sale.to_json_many(sales, layout=layout)  # type: ignore[attr-defined]
+        table = Sale.from_json_many(encoded, layout=layout,  # type: ignore[attr-defined]
+                                    columnar=True)
+        assert table.instances() == sales
+
+    def test_empty(self):
+        table = Address.from_dict_many([], columnar=True)
+        assert len(table) == 0 and table.columns == {'city': []}
@@ -0,0 +1,61 @@
+import json
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from dataclasses_json import DataClassJsonMixin, config
+
+
+@dataclass
+class Series(DataClassJsonMixin):
+    name: str
+    points: List[float] = field(metadata=config(compact='d'))
+    counts: array = field(default_factory=lambda: array('d'))
+    codes: Optional[array] = field(default=None,
+                                   metadata=config(compact='b'))
+    batches: List[array] = field(default_factory=list)
+
+
+payload = {'name': 's', 'points': [1.0, 2.5], 'counts': [3.0],
+           'codes': [1, -1], 'batches': [[1.0], [2.0, 3.0]]}
+
+
+class TestCompact:
+    def test_decode(self):
+        series = Series.from_dict(payload)
+        assert series.points == array('d', [1.0, 2.5])
+        assert series.counts == array('d', [3.0])
+        assert series.codes == array('b', [1, -1])
+        assert series.batches == [array('d', [1.0]), array('d', [2.0, 3.0])]
+
+    def test_encode(self):
+        encoded = Series.from_dict(payload).to_dict()
+        assert encoded == payload
+        assert type(encoded['points']) is list
+
+    def test_json_round_trip(self):
+        series = Series.from_json(json.dumps(payload))
+        assert Series.from_json(series.to_json()) == series
+
+    def test_smaller_than_a_list(self):
+        points = [float(i) for i in range(10_000)]
+        series = Series.from_dict({'name': 's', 'points': points})
+        list_size = sys.getsizeof(points) + sum(map(sys.getsizeof, points))
+        assert sys.getsizeof(series.points) < list_size / 2
+
+    def test_invalid_typecode(self):
+        with pytest.raises(ValueError, match='Invalid compact typecode'):
+            config(compact='x')
+
+    def test_schema(self, recwarn):
+        series = Series.from_dict(payload)
+        schema = Series.schema()
+        assert schema.dump(series) == payload
+        assert json.loads(schema.dumps(series)) == payload
+        loaded = schema.loads(json.dumps(payload))
+        assert loaded == series
+        assert loaded.codes.typecode == 'b'
+        assert not [w for w in recwarn if 'Unknown type' in str(w.message)]
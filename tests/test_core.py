@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, make_dataclass
+import gc
+import weakref
 import pytest
 from typing import Optional, Set, List
 
@@ -32,12 +34,64 @@ if sys.version_info >= (3, 9):
     reason="syntax only valid on Py3.9, but bug disappears after Python 3.11",
 )
 class TestWarning:
-    def test_warns_about_nondeterministic_resolution(self):
-        with pytest.warns(UserWarning, match="Assuming hint Option resolves to .*"):
-            config = Config.from_dict({"options": [{"label": "scope"}]})
+    @pytest.mark.filterwarnings("error")
+    def test_string_hints_resolve_in_defining_module(self):
+        config = Config.from_dict({"options": [{"label": "scope"}]})
+        assert config.options == [Option("scope")]
         assert config.to_json() == '{"options": [{"label": "scope"}]}'
 
 
     @pytest.mark.filterwarnings("error")
     def test_plain_type_hints_resolve_correctly(self):
         ConfigWithoutStringOptions.from_dict({"options": [{"label": "scope"}]})
+
+
+@dataclass_json
+@dataclass
+class Empty:
+    pass
+
+
+@dataclass_json
+@dataclass
+class Single:
+    value: int
+
+
+class TestFieldAccess:
+    def test_empty_and_single_field_classes(self):
+        assert Empty().to_dict() == {}
+        assert Single(1).to_dict() == {'value': 1}
+
+
+class TestCaches:
+    def test_runtime_classes_can_be_collected(self):
+        cls = dataclass_json(decode_cache=4)(
+            make_dataclass('Runtime', [('value', int)], frozen=True))
+        assert cls.from_json(cls(1).to_json()) == cls(1)
+        assert cls.from_dict({'value': 2}, infer_missing=True) == cls(2)
+        ref = weakref.ref(cls)
+        del cls
+        gc.collect()
+        assert ref() is None
+
+    def test_subclasses_do_not_share_cached_fields(self):
+        Sub = dataclass(make_dataclass('Sub', [('extra', int)], bases=(Single,)))
+        assert Single(1).to_dict() == {'value': 1}
+        assert Sub(1, 2).to_dict() == {'value': 1, 'extra': 2}
+
+    def test_classes_refusing_attributes_are_not_cached(self):
+        class Locking(type):
+            def __setattr__(cls, name, value):
+                if cls.__dict__.get('locked'):
+                    raise AttributeError(name)
+                super().__setattr__(name, value)
+
+        @dataclass_json
+        @dataclass
+        class Locked(metaclass=Locking):
+            value: int
+
+        Locked.locked = True
+        assert Locked.from_dict({'value': 1}).to_dict() == {'value': 1}
+        assert not any(name.startswith('_dataclasses_json') for name in vars(Locked))
@@ -0,0 +1,116 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import pytest
+
+from dataclasses_json import (DataClassJsonMixin, config, dataclass_json,
+                              global_config, stats)
+from dataclasses_json.cache import decode_cache_clear, decode_cache_info
+
+
+@dataclass_json(decode_cache=2)
+@dataclass(frozen=True)
+class Flags:
+    name: str
+    enabled: Dict[str, bool]
+
+
+@dataclass
+class Settings(DataClassJsonMixin):
+    dataclass_json_config = config(decode_cache=8,
+                                   decode_cache_size=64)['dataclasses_json']
+    hosts: List[str]
+
+
+@dataclass(frozen=True)
+class Uncached(DataClassJsonMixin):
+    name: str
+
+
+def _flags(name):
+    return json.dumps({'name': name, 'enabled': {'beta': True}})
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    decode_cache_clear(Flags)
+    decode_cache_clear(Settings)
+
+
+class TestDecodeCache:
+    def test_frozen_instances_are_shared(self):
+        a = Flags.from_json(_flags('a'))
+        assert Flags.from_json(_flags('a')) is a
+        assert Flags.from_json(_flags('a').encode()) == a
+        info = decode_cache_info(Flags)
+        assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+
+    def test_mutable_instances_are_copies(self):
+        payload = '{"hosts": ["a", "b"]}'
+        first = Settings.from_json(payload)
+        first.hosts.append('c')
+        second = Settings.from_json(payload)
+        assert second == Settings(['a', 'b'])
+        assert second is not Settings.from_json(payload)
+        assert decode_cache_info(Settings).hits == 2
+
+    def test_least_recently_used_is_evicted(self):
+        a, b = Flags.from_json(_flags('a')), Flags.from_json(_flags('b'))
+        Flags.from_json(_flags('a'))
+        Flags.from_json(_flags('c'))
+        info = decode_cache_info(Flags)
+        assert (info.entries, info.evictions) == (2, 1)
+        assert Flags.from_json(_flags('a')) is a
+        assert Flags.from_json(_flags('b')) is not b
+
+    def test_size_limit(self):
+        Settings.from_json('{"hosts": ["%s"]}' % ('x' * 20))
+        Settings.from_json('{"hosts": ["%s"]}' % ('y' * 20))
+        info = decode_cache_info(Settings)
+        assert info.entries == 1 and info.size <= info.max_size == 64
+        # longer than the whole cache, never cached
+        Settings.from_json('{"hosts": ["%s"]}' % ('z' * 100))
+        assert decode_cache_info(Settings).entries == 1
+
+    def test_arguments_bypass_the_cache(self):
+        Flags.from_json(_flags('a'), infer_missing=True)
+        Flags.from_json(_flags('a'))
+        Flags.from_json(_flags('a'), parse_int=int)
+        info = decode_cache_info(Flags)
+        assert (info.hits, info.misses) == (0, 2)
+
+    def test_global_config_change_invalidates(self):
+        @dataclass_json(decode_cache=4)
+        @dataclass(frozen=True)
+        class Event:
+            at: datetime
+
+        payload = '{"at": "2020-01-01"}'
+        global_config.decoders[datetime] = \
+            lambda s: datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
+        try:
+            assert Event.from_json(payload).at.tzinfo is timezone.utc
+        finally:
+            del global_config.decoders[datetime]
+        # decoded again, without the decoder
+        with pytest.raises(TypeError):
+            Event.from_json(payload)
+
+    def test_stats(self):
+        stats.reset()
+        stats.enable()
+        try:
+            Flags.from_json(_flags('a'))
+            Flags.from_json(_flags('a'))
+        finally:
+            stats.disable()
+        snapshot = stats.snapshot()
+        assert snapshot['decode_cache_hits'] == {'Flags': 1}
+        assert snapshot['decode_cache_misses'] == {'Flags': 1}
+
+    def test_not_configured(self):
+        assert Uncached.from_json('{"name": "a"}') == Uncached('a')
+        with pytest.raises(ValueError, match='no decode cache'):
+            decode_cache_info(Uncached)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+import pytest
+
+from dataclasses_json import config, dataclass_json
+from dataclasses_json.core import _field_plan
+
+
+class Colour(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+@dataclass_json
+@dataclass
+class Sparse:
+    id: int
+    name: str = 'unnamed'
+    score: float = 0.5
+    colour: Colour = Colour.RED
+    parent: Optional[int] = 3
+    tags: List[str] = field(default_factory=list)
+    counter: Optional[int] = field(default=0,
+                                   metadata=config(decoder=lambda value: value + 1))
+    derived: str = field(default='derived', init=False)
+
+
+class TestFieldPlan:
+    def test_fields_are_split_by_default_kind(self):
+        plan = _field_plan(Sparse)
+        assert plan.required == ('id',)
+        assert [name for name, _ in plan.defaults] == [
+            'name', 'score', 'colour', 'parent', 'counter', 'derived']
+        assert [name for name, _ in plan.default_factories] == ['tags']
+        assert plan.verbatim_defaults == {'name', 'score', 'colour', 'parent',
+                                          'counter'}
+
+    def test_missing_fields_are_defaulted(self):
+        assert Sparse.from_dict({'id': 1}) == Sparse(1, counter=1)
+
+    def test_default_factories_are_called_per_decode(self):
+        first = Sparse.from_dict({'id': 1})
+        second = Sparse.from_dict({'id': 2})
+        assert first.tags == [] and first.tags is not second.tags
+
+    def test_defaults_still_go_through_custom_decoders(self):
+        assert Sparse.from_dict({'id': 1}).counter == 1
+        assert Sparse.from_dict({'id': 1, 'counter': 5}).counter == 6
+
+    def test_present_values_are_decoded(self):
+        decoded = Sparse.from_dict({'id': 1, 'score': 2, 'colour': 'green'})
+        assert decoded.score == 2.0 and isinstance(decoded.score, float)
+        assert decoded.colour is Colour.GREEN
+
+    def test_infer_missing_only_fills_required_fields(self):
+        with pytest.warns(RuntimeWarning, match='infer_missing'):
+            decoded = Sparse.from_dict({}, infer_missing=True)
+        assert decoded == Sparse(None, counter=1)  # type: ignore[arg-type]
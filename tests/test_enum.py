@@ -1,5 +1,5 @@
 import json
-from enum import Enum, IntFlag, auto
+from enum import Enum, Flag, IntFlag, auto
 from typing import Dict, List
 import pytest
 
@@ -28,6 +28,16 @@ class MyFlag(IntFlag):
     C = auto()
 
 
+class MyPureFlag(Flag):
+    X = auto()
+    Y = auto()
+
+
+class MyEnumWithAlias(Enum):
+    ONE = 1
+    UNO = 1
+
+
 @dataclass_json
 @dataclass(frozen=True)
 class DataWithEnum:
@@ -90,6 +100,13 @@ flag_container = FlagContainer(
 )
 
 
+@dataclass_json
+@dataclass(frozen=True)
+class PureFlagContainer:
+    flag: MyPureFlag
+    alias: MyEnumWithAlias = MyEnumWithAlias.UNO
+
+
 class TestEncoder:
     def test_data_with_enum(self):
         assert d1.to_json() == d1_json, f'Actual: {d1.to_json()}, Expected: {d1_json}'
@@ -115,6 +132,9 @@ class TestEncoder:
         assert flag_container.to_json() == flag_container_json, f'Actual: {flag_container.to_json()}, Expected: {flag_container_json}'
         assert flag_container.to_dict(encode_json=True) == json.loads(flag_container_json), f'Actual: {flag_container.to_dict()}, Expected: {json.loads(flag_container_json)}'
 
+    def test_pure_flag(self):
+        assert PureFlagContainer(MyPureFlag.X | MyPureFlag.Y).to_json() == '{"flag": 3, "alias": 1}'
+
 
 class TestDecoder:
     def test_data_with_enum(self):
@@ -152,6 +172,19 @@ class TestDecoder:
         assert flag_container == flag_container_from_json
         assert flag_container_from_json.to_json() == flag_container_json
 
+    def test_composite_flag(self):
+        assert FlagContainer.from_json('{"flag_list": [3], "flag": 7}') == \
+            FlagContainer([MyFlag.A | MyFlag.B], MyFlag.A | MyFlag.B | MyFlag.C)
+
+    def test_pure_flag_and_alias(self):
+        decoded = PureFlagContainer.from_json('{"flag": 3, "alias": 1}')
+        assert decoded.flag is MyPureFlag.X | MyPureFlag.Y
+        assert decoded.alias is MyEnumWithAlias.ONE
+
+    def test_unknown_value(self):
+        with pytest.raises(ValueError):
+            DataWithEnum.from_json('{"name": "name1", "my_enum": "str4"}')
+
 
 class TestValidator:
     @pytest.mark.parametrize('enum_value, is_valid', [
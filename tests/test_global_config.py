@@ -63,3 +63,17 @@ class TestGlobalConfig:
         assert PackageDelivery.from_json(expected_json) == package_delivery
         dataclasses_json.cfg.global_config.encoders = {}
         dataclasses_json.cfg.global_config.decoders = {}
+
+    def test_assigned_dict_is_copied(self):
+        encoders = {date: date.isoformat}
+        dataclasses_json.cfg.global_config.encoders = encoders
+        try:
+            birthday = PersonWithBirthday("Kobe Bryant", date(1978, 8, 23))
+            assert birthday.to_dict(encode_json=True)["birthday"] == "1978-08-23"
+            # changes to the assigned dict itself don't reach the config
+            encoders[date] = lambda d: d.year
+            assert dataclasses_json.cfg.global_config.encoders[date] is date.isoformat
+            dataclasses_json.cfg.global_config.encoders[date] = lambda d: d.year
+            assert birthday.to_dict(encode_json=True)["birthday"] == 1978
+        finally:
+            dataclasses_json.cfg.global_config.encoders = {}
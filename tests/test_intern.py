@@ -0,0 +1,64 @@
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from dataclasses_json import (CatchAll, DataClassJsonMixin, Undefined, config,
+                              dataclass_json)
+
+
+def _fresh(s: str) -> str:
+    # a str equal to `s` that is not the same object
+    return json.loads(json.dumps(s))
+
+
+@dataclass
+class Shipment(DataClassJsonMixin):
+    status: str = field(metadata=config(intern=True))
+    note: str = ''
+
+
+@dataclass_json(intern=True, undefined=Undefined.INCLUDE)
+@dataclass
+class Record:
+    country: Optional[str]
+    tags: List[str]
+    labels: Dict[str, str]
+    extra: CatchAll
+
+
+class TestIntern:
+    def test_field(self):
+        a = Shipment.from_dict({'status': _fresh('delivered-ok'),
+                                'note': _fresh('left at the door')})
+        b = Shipment.from_dict({'status': _fresh('delivered-ok'),
+                                'note': _fresh('left at the door')})
+        assert a.status is b.status
+        assert a.note == b.note and a.note is not b.note
+
+    def test_class_and_containers(self):
+        def decode():
+            return Record.from_json('{"country": "country-de", '
+                                    '"tags": ["tag-a", "tag-b"], '
+                                    '"labels": {"label-k": "label-v"}, '
+                                    '"unknown-key": "unknown-value"}')
+
+        a, b = decode(), decode()
+        assert a == b
+        assert a.country is b.country
+        assert all(x is y for x, y in zip(a.tags, b.tags))
+        assert next(iter(a.labels)) is next(iter(b.labels))
+        assert a.labels['label-k'] is b.labels['label-k']
+        # keys and values of the CatchAll field
+        assert next(iter(a.extra)) is next(iter(b.extra))
+        assert a.extra['unknown-key'] is b.extra['unknown-key']
+
+    def test_columns(self):
+        records = [{'status': _fresh('in-transit'), 'note': 'x'}
+                   for _ in range(3)]
+        table = Shipment.from_dict_many(records, columnar=True)
+        statuses = table.columns['status']
+        assert statuses[0] is statuses[1] is statuses[2]
+
+    def test_none_and_non_strings_are_kept(self):
+        assert Record.from_dict({'country': None, 'tags': [],
+                                 'labels': {}}) == Record(None, [], {}, extra={})
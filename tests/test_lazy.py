@@ -0,0 +1,143 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+
+from dataclasses_json import DataClassJsonMixin, materialize
+from dataclasses_json.core import _LAZY_PREFIX, _LazyField
+
+
+@dataclass
+class Address(DataClassJsonMixin):
+    city: str
+
+
+@dataclass
+class User(DataClassJsonMixin):
+    name: str
+    address: Address
+    previous: List[Address] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Document(DataClassJsonMixin):
+    id: int
+    user: Optional[User]
+    tags: Dict[str, List[int]]
+    meta: Optional[User] = None
+
+
+@dataclass
+class WithPostInit(DataClassJsonMixin):
+    user: User
+
+    def __post_init__(self):
+        assert isinstance(self.user, User)
+
+
+doc_dict = {
+    "id": 1,
+    "user": {"name": "ann", "address": {"city": "Berlin"},
+             "previous": [{"city": "Oslo"}]},
+    "tags": {"a": [1, 2]},
+}
+doc = Document(1, User("ann", Address("Berlin"), [Address("Oslo")]),
+               {"a": [1, 2]})
+
+
+class TestLazyDecode:
+    def test_nested_fields_are_deferred(self):
+        lazy_doc = Document.from_dict(doc_dict, lazy=True)
+        assert vars(lazy_doc)["id"] == 1
+        assert "user" not in vars(lazy_doc)
+        assert _LAZY_PREFIX + "user" in vars(lazy_doc)
+        assert _LAZY_PREFIX + "tags" in vars(lazy_doc)
+
+    def test_decoded_on_access(self):
+        lazy_doc = Document.from_json(Document.to_json(doc), lazy=True)
+        user = lazy_doc.user
+        assert isinstance(user, User)
+        assert lazy_doc.user is user
+        assert _LAZY_PREFIX + "user" not in vars(lazy_doc)
+        # nested dataclasses are decoded lazily as well
+        assert "address" not in vars(user)
+        assert user.address == Address("Berlin")
+
+    def test_equal_to_eager_decode(self):
+        assert Document.from_dict(doc_dict, lazy=True) == doc
+        assert Document.from_dict(doc_dict, lazy=True).to_dict() == doc.to_dict()
+
+    def test_defaults_and_none_are_not_deferred(self):
+        lazy_doc = Document.from_dict({**doc_dict, "user": None}, lazy=True)
+        assert vars(lazy_doc)["user"] is None
+        assert vars(lazy_doc)["meta"] is None
+        assert Document.meta is None
+
+    def test_materialize(self):
+        lazy_doc = materialize(Document.from_dict(doc_dict, lazy=True))
+        assert not any(k.startswith(_LAZY_PREFIX) for k in vars(lazy_doc))
+        assert not any(k.startswith(_LAZY_PREFIX) for k in vars(vars(lazy_doc)["user"]))
+        assert lazy_doc == doc
+
+    def test_copy_and_pickle(self):
+        lazy_doc = Document.from_dict(doc_dict, lazy=True)
+        copied = copy.copy(lazy_doc)
+        assert lazy_doc.user == doc.user
+        assert copied.user == doc.user
+        assert pickle.loads(pickle.dumps(Document.from_dict(doc_dict, lazy=True))) == doc
+
+    def test_excluded_fields_are_not_decoded(self):
+        lazy_doc = Document.from_dict(doc_dict, lazy=True)
+        assert lazy_doc.to_dict(exclude=["user"]) == {
+            "id": 1, "tags": {"a": [1, 2]}, "meta": None}
+        assert _LAZY_PREFIX + "user" in vars(lazy_doc)
+        lazy_doc = Document.from_dict(doc_dict, lazy=True)
+        assert lazy_doc.to_dict(include=["id"]) == {"id": 1}
+        assert _LAZY_PREFIX + "user" in vars(lazy_doc)
+        assert _LAZY_PREFIX + "tags" in vars(lazy_doc)
+
+    def test_pickle_decodes_deferred_fields(self):
+        state = pickle.dumps(Document.from_dict(doc_dict, lazy=True))
+        # a process that never decoded lazily has no descriptors on Document
+        code = ("import pickle, sys; doc = pickle.loads(sys.stdin.buffer.read()); "
+                "print(doc.user.address.city, doc.tags)")
+        result = subprocess.run([sys.executable, "-c", code], input=state,
+                                stdout=subprocess.PIPE, check=True,
+                                cwd=os.path.dirname(os.path.dirname(__file__)))
+        assert result.stdout.decode().split() == ["Berlin", "{'a':", "[1,", "2]}"]
+        assert not any(k.startswith(_LAZY_PREFIX)
+                       for k in vars(pickle.loads(state)))
+
+    def test_assigned_before_read(self):
+        user = User.from_dict(doc_dict["user"], lazy=True)
+        user.address = Address("Paris")
+        state = vars(pickle.loads(pickle.dumps(user)))
+        assert state["address"] == Address("Paris")
+        assert not any(k.startswith(_LAZY_PREFIX) for k in state)
+        assert not any(k.startswith(_LAZY_PREFIX) for k in vars(user))
+
+    def test_descriptors_only_on_deferred_fields(self):
+        Document.from_dict(doc_dict, lazy=True)
+        assert isinstance(vars(Document)["user"], _LazyField)
+        assert isinstance(vars(Document)["tags"], _LazyField)
+        assert not isinstance(vars(Document).get("id"), _LazyField)
+
+    def test_post_init_classes_are_decoded_eagerly(self):
+        decoded = WithPostInit.from_dict({"user": doc_dict["user"]}, lazy=True)
+        assert isinstance(vars(decoded)["user"], User)
+
+    def test_eager_decode_is_unaffected(self):
+        eager_doc = Document.from_dict(doc_dict)
+        assert isinstance(vars(eager_doc)["user"], User)
+        assert eager_doc == doc
+
+    def test_missing_attribute(self):
+        lazy_doc = Document.from_dict(doc_dict, lazy=True)
+        object.__delattr__(lazy_doc, _LAZY_PREFIX + "user")
+        with pytest.raises(AttributeError):
+            lazy_doc.user
@@ -0,0 +1,117 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from dataclasses_json import (CatchAll, DataClassJsonMixin, LetterCase,
+                              Undefined, config, dataclass_json)
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)  # type: ignore[arg-type]
+@dataclass
+class Row:
+    row_id: int
+    display_name: str
+    created_at: datetime
+    parent_id: Optional[int] = None
+
+
+@dataclass
+class Point(DataClassJsonMixin):
+    x: float
+    y: float
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass_json(undefined=Undefined.INCLUDE)
+@dataclass
+class WithUnknown:
+    id: int
+    unknown: CatchAll = None  # type: ignore[assignment]
+
+
+@dataclass
+class WithExclude(DataClassJsonMixin):
+    id: int
+    note: Optional[str] = field(default=None,
+                                metadata=config(exclude=lambda x: x is None))
+
+
+created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+rows = [Row(1, 'one', created), Row(2, 'two', created, parent_id=1)]
+
+
+class TestToJsonMany:
+    def test_records(self):
+        assert json.loads(Row.to_json_many(rows)) == [  # type: ignore[attr-defined]
+            json.loads(row.to_json()) for row in rows]  # type: ignore[attr-defined]
+
+    def test_rows(self):
+        assert json.loads(Row.to_json_many(rows, layout='rows')) == {  # type: ignore[attr-defined]
+            'fields': ['rowId', 'displayName', 'createdAt', 'parentId'],
+            'rows': [[1, 'one', created.timestamp(), None],
+                     [2, 'two', created.timestamp(), 1]]}
+
+    def test_columns(self):
+        assert json.loads(Row.to_json_many(rows, layout='columns')) == {  # type: ignore[attr-defined]
+            'fields': ['rowId', 'displayName', 'createdAt', 'parentId'],
+            'columns': [[1, 2], ['one', 'two'],
+                        [created.timestamp(), created.timestamp()],
+                        [None, 1]]}
+
+    def test_empty(self):
+        assert json.loads(Point.to_json_many([], layout='columns')) == {
+            'fields': ['x', 'y', 'tags'], 'columns': [[], [], []]}
+
+    def test_json_kwargs(self):
+        assert Point.to_json_many([Point(1, 2)], layout='rows',
+                                  separators=(',', ':')) == \
+            '{"fields":["x","y","tags"],"rows":[[1,2,[]]]}'
+
+    def test_invalid_layout(self):
+        with pytest.raises(ValueError, match='Invalid layout'):
+            Point.to_json_many([], layout='table')
+
+    @pytest.mark.parametrize('obj', [WithUnknown(1, {'extra': 1}),  # type: ignore[call-arg]
+                                     WithExclude(1)])
+    def test_non_uniform_records(self, obj):
+        with pytest.raises(ValueError, match="only supported by the 'records'"):
+            type(obj).to_json_many([obj], layout='rows')
+
+    def test_exclude_predicate_not_triggered(self):
+        assert json.loads(WithExclude.to_json_many([WithExclude(1, 'a')],
+                                                   layout='rows')) == {
+            'fields': ['id', 'note'], 'rows': [[1, 'a']]}
+
+    def test_subclass_instances(self):
+        @dataclass
+        class Point3(Point):
+            z: float = 0
+
+        with pytest.raises(ValueError, match="only supported by the 'records'"):
+            Point.to_json_many([Point(1, 2), Point3(1, 2)], layout='rows')
+
+    def test_rows_match_records(self):
+        points = [Point(1, 2, ['a']), Point(3.5, 4)]
+        records = json.loads(Point.to_json_many(points))
+        assert json.loads(Point.to_json_many(points, layout='rows'))['rows'] \
+            == [list(record.values()) for record in records]
+
+
+class TestFromJsonMany:
+    @pytest.mark.parametrize('layout', ['records', 'rows', 'columns'])
+    def test_round_trip(self, layout):
+        encoded = Row.to_json_many(rows, layout=layout)  # type: ignore[attr-defined]
+        assert Row.from_json_many(encoded, layout=layout) == rows  # type: ignore[attr-defined]
+
+    def test_fields_in_any_order(self):
+        payload = '{"fields": ["tags", "y", "x"], "rows": [[["a"], 2, 1]]}'
+        assert Point.from_json_many(payload, layout='rows') == [
+            Point(1, 2, ['a'])]
+
+    def test_missing_fields_use_defaults(self):
+        payload = '{"fields": ["x", "y"], "columns": [[1, 3], [2, 4]]}'
+        assert Point.from_json_many(payload, layout='columns') == [
+            Point(1, 2), Point(3, 4)]
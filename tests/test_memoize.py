@@ -0,0 +1,131 @@
+import gc
+import pickle
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+import pytest
+
+from dataclasses_json import (DataClassJsonMixin, config, dataclass_json,
+                              global_config)
+from dataclasses_json.core import _memos
+
+
+@dataclass(frozen=True)
+class Currency(DataClassJsonMixin):
+    dataclass_json_config = config(memoize=True)['dataclasses_json']
+    code: str
+    name: str
+
+
+@dataclass_json(memoize=True)
+@dataclass(frozen=True)
+class Country:
+    code: str
+    currencies: Tuple[Currency, ...]
+
+
+@dataclass(frozen=True)
+class Region(DataClassJsonMixin):
+    name: str
+    countries: List[Country]
+
+
+@dataclass_json(memoize=True)
+@dataclass
+class Mutable:
+    value: int
+
+
+euro = Currency('EUR', 'Euro')
+germany = Country('DE', (euro,))
+
+
+class TestMemoize:
+    def test_to_dict(self):
+        currency = Currency('CHF', 'Swiss franc')
+        first = currency.to_dict()
+        assert first == {'code': 'CHF', 'name': 'Swiss franc'}
+        assert currency.to_dict() == first
+        assert currency.to_dict(encode_json=True) == first
+
+    def test_to_json(self):
+        assert euro.to_json() is euro.to_json()
+        assert euro.to_json(indent=2) != euro.to_json()
+        assert euro.to_json(indent=2) is euro.to_json(indent=2)
+
+    def test_instances_are_independent(self):
+        assert Currency('USD', 'Dollar').to_dict() is not \
+            Currency('USD', 'Dollar').to_dict()
+
+    def test_returned_dicts_are_copies(self):
+        currency = Currency('GBP', 'Pound')
+        currency.to_dict()['code'] = 'XXX'
+        assert currency.to_dict() == {'code': 'GBP', 'name': 'Pound'}
+        assert currency.to_json() == '{"code": "GBP", "name": "Pound"}'
+
+    def test_nested_fragments_are_copies(self):
+        country = Country('FR', (euro,))
+        region = Region('Europe', [country])
+        region.to_dict()['countries'][0]['currencies'][0]['code'] = 'XXX'
+        country.to_dict()['code'] = 'XX'
+        assert region.to_dict() == {
+            'name': 'Europe',
+            'countries': [{'code': 'FR',
+                           'currencies': [{'code': 'EUR', 'name': 'Euro'}]}]}
+
+    def test_memo_is_not_stored_on_the_instance(self):
+        currency = Currency('SEK', 'Krona')
+        currency.to_dict()
+        currency.to_json()
+        assert vars(currency) == {'code': 'SEK', 'name': 'Krona'}
+        assert '_dataclasses_json' not in str(pickle.dumps(currency))
+
+    def test_memo_is_freed_with_the_instance(self):
+        currency = Currency('NOK', 'Krone')
+        currency.to_dict()
+        key = id(currency)
+        assert key in _memos
+        del currency
+        gc.collect()
+        assert key not in _memos
+
+    def test_include_and_exclude_are_not_memoized(self):
+        assert euro.to_dict(include=['code']) == {'code': 'EUR'}
+        assert euro.to_json(exclude=['name']) == '{"code": "EUR"}'
+        assert euro.to_dict() == {'code': 'EUR', 'name': 'Euro'}
+
+    def test_equal_to_unmemoized(self):
+        @dataclass(frozen=True)
+        class Plain(DataClassJsonMixin):
+            code: str
+            currencies: Tuple[Currency, ...]
+
+        assert germany.to_json() == Plain('DE', (euro,)).to_json()
+
+    def test_global_config_change_invalidates(self):
+        @dataclass_json(memoize=True)
+        @dataclass(frozen=True)
+        class Event:
+            at: datetime
+
+        event = Event(datetime(2020, 1, 1, tzinfo=timezone.utc))
+        before = event.to_dict(encode_json=True)
+        global_config.encoders[datetime] = datetime.isoformat
+        try:
+            assert event.to_dict(encode_json=True) is not before
+            assert event.to_dict(encode_json=True) == \
+                {'at': '2020-01-01T00:00:00+00:00'}
+        finally:
+            del global_config.encoders[datetime]
+
+    def test_pickled_memo_is_not_trusted(self):
+        currency = Currency('JPY', 'Yen')
+        first = currency.to_dict()
+        copy = pickle.loads(pickle.dumps(currency))
+        assert copy == currency
+        assert copy.to_dict() == first and copy.to_dict() is not first
+
+    def test_frozen_is_required(self):
+        with pytest.raises(ValueError, match='frozen'):
+            Mutable(1).to_dict()
@@ -0,0 +1,69 @@
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+
+from dataclasses_json import config, dataclass_json
+
+np = pytest.importorskip("numpy")
+npt = pytest.importorskip("numpy.typing")
+
+
+@dataclass_json
+@dataclass
+class Arrays:
+    plain: np.ndarray
+    floats: npt.NDArray[np.float64]
+    small: np.ndarray = field(metadata=config(dtype=np.int8))
+    matrices: Dict[str, npt.NDArray[np.int64]] = field(default_factory=dict)
+    maybe: Optional[np.ndarray] = None
+
+
+payload = {'plain': [1, 2, 3], 'floats': [1, 2.5], 'small': [1, 2],
+           'matrices': {'identity': [[1, 0], [0, 1]]}, 'maybe': [True]}
+
+
+class TestNumpy:
+    def test_decode(self):
+        decoded = Arrays.from_dict(payload)
+        assert isinstance(decoded.plain, np.ndarray)
+        assert decoded.plain.dtype.kind == 'i'
+        assert decoded.floats.dtype == np.float64
+        assert decoded.small.dtype == np.int8
+        assert decoded.matrices['identity'].shape == (2, 2)
+        assert decoded.matrices['identity'].dtype == np.int64
+        assert decoded.maybe.dtype == np.bool_
+
+    def test_encode(self):
+        encoded = Arrays.from_dict(payload).to_dict()
+        assert encoded == payload
+        assert type(encoded['plain']) is list
+        assert type(encoded['plain'][0]) is int
+
+    def test_json_round_trip(self):
+        decoded = Arrays.from_json(json.dumps(payload))
+        assert json.loads(decoded.to_json()) == payload
+
+    def test_optional_none(self):
+        assert Arrays.from_dict({**payload, 'maybe': None}).maybe is None
+
+    def test_list_of_arrays(self):
+        @dataclass_json
+        @dataclass
+        class Batch:
+            items: List[npt.NDArray[np.float32]]
+
+        batch = Batch.from_dict({'items': [[1, 2], [3]]})
+        assert [item.dtype for item in batch.items] == [np.float32, np.float32]
+        assert batch.to_dict() == {'items': [[1.0, 2.0], [3.0]]}
+
+    def test_schema(self):
+        decoded = Arrays.from_dict(payload)
+        schema = Arrays.schema()
+        assert schema.dump(decoded) == payload
+        assert json.loads(schema.dumps(decoded)) == payload
+        loaded = schema.loads(json.dumps(payload))
+        assert loaded.small.dtype == np.int8
+        assert loaded.floats.dtype == np.float64
+        assert loaded.matrices['identity'].dtype == np.int64
@@ -0,0 +1,68 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from dataclasses_json import Columns, DataClassJsonMixin
+from dataclasses_json.parallel import parallel_decode
+
+
+@dataclass
+class Item(DataClassJsonMixin):
+    id: int
+    tags: List[str]
+
+
+items = [Item(i, [str(i)]) for i in range(50)]
+chunks = [Item.to_json_many(items[i:i + 7]) for i in range(0, 50, 7)]
+
+
+class TestParallelDecode:
+    def test_order_is_preserved(self):
+        assert parallel_decode(Item, chunks, workers=2) == items
+
+    def test_bytes_and_parsed_chunks(self):
+        mixed = [chunk.encode() if i % 2 else json.loads(chunk)
+                 for i, chunk in enumerate(chunks)]
+        assert parallel_decode(Item, mixed, workers=2) == items
+
+    def test_columnar(self):
+        table = parallel_decode(Item, chunks, workers=2, columnar=True)
+        assert isinstance(table, Columns) and len(table) == 50
+        assert table.columns['id'] == list(range(50))
+        assert table.instances() == items
+
+    def test_table_layout(self):
+        rows = [Item.to_json_many(items[:10], layout='rows'),
+                Item.to_json_many(items[10:], layout='rows')]
+        assert parallel_decode(Item, rows, layout='rows', workers=2) == items
+
+    def test_custom_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            assert parallel_decode(Item, chunks, executor=executor) == items
+
+    def test_workers_receive_raw_chunks(self):
+        received = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def map(self, fn, *iterables, **kwargs):
+                args = list(iterables[0])
+                received.extend(type(chunk) for _, chunk, *_ in args)
+                return super().map(fn, args, **kwargs)
+
+        raw = [chunk.encode() if i % 2 else chunk
+               for i, chunk in enumerate(chunks)]
+        with RecordingExecutor(2) as executor:
+            assert parallel_decode(Item, raw, executor=executor) == items
+        assert received == [type(chunk) for chunk in raw]
+        assert set(received) == {str, bytes}
+
+    def test_local_class(self):
+        @dataclass
+        class Local(DataClassJsonMixin):
+            id: int
+
+        with pytest.raises(ValueError, match="define it at the top level"):
+            parallel_decode(Local, ['[{"id": 1}]'], workers=1)
@@ -0,0 +1,140 @@
+import pickle
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from dataclasses_json import NOT_DECODED, DataClassJsonMixin, LetterCase, config
+
+
+@dataclass
+class Address(DataClassJsonMixin):
+    city: str
+    street: str
+
+
+@dataclass
+class User(DataClassJsonMixin):
+    name: str
+    address: Optional[Address]
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Event(DataClassJsonMixin):
+    id: int
+    user: User
+    body: dict
+    kind: str = field(default="click", metadata=config(letter_case=LetterCase.CAMEL))
+
+
+event_dict = {
+    "id": 1,
+    "user": {"name": "ann", "address": {"city": "Berlin", "street": "Main"},
+             "tags": ["a"]},
+    "body": {"huge": list(range(10))},
+    "kind": "view",
+}
+
+
+@dataclass
+class Feed(DataClassJsonMixin):
+    users: List[User]
+    by_name: Dict[str, Optional[User]]
+    pairs: Tuple[Address, ...] = ()
+    names: List[str] = field(default_factory=list)
+
+
+feed_dict = {
+    "users": [event_dict["user"], {"name": "bob", "address": None}],
+    "by_name": {"ann": event_dict["user"], "bob": None},
+    "pairs": [{"city": "Oslo", "street": "Main"}],
+    "names": ["ann"],
+}
+
+
+class TestOnly:
+    def test_top_level_fields(self):
+        event = Event.from_dict(event_dict, only=["id"])
+        assert event.id == 1
+        assert event.user is NOT_DECODED
+        assert event.body is NOT_DECODED
+        assert event.kind == "click"
+
+    def test_nested_paths(self):
+        event = Event.from_dict(event_dict, only=["id", "user.address.city"])
+        assert event.user.name is NOT_DECODED
+        assert event.user.tags == []
+        assert event.user.address.city == "Berlin"
+        assert event.user.address.street is NOT_DECODED
+
+    def test_whole_field_wins_over_nested_path(self):
+        event = Event.from_dict(event_dict, only=["user.name", "user"])
+        assert event.user == User("ann", Address("Berlin", "Main"), ["a"])
+
+    def test_skipped_fields_may_be_missing(self):
+        event = Event.from_dict({"id": 2}, only=["id"])
+        assert event.id == 2
+
+    def test_from_json(self):
+        event = Event.from_json(Event.from_dict(event_dict).to_json(), only=["body"])
+        assert event.body == event_dict["body"]
+        assert event.id is NOT_DECODED
+
+    def test_with_lazy(self):
+        event = Event.from_dict(event_dict, only=["user.name"], lazy=True)
+        assert event.user.name == "ann"
+        assert event.user.address is NOT_DECODED
+
+    def test_invalid_field(self):
+        with pytest.raises(ValueError, match="adress"):
+            Event.from_dict(event_dict, only=["user.adress"])
+
+    def test_str_is_rejected(self):
+        with pytest.raises(TypeError):
+            Event.from_dict(event_dict, only="id")
+
+    def test_paths_through_collections(self):
+        feed = Feed.from_dict(feed_dict, only=["users.name", "by_name.address.city",
+                                               "pairs.street"])
+        assert [user.name for user in feed.users] == ["ann", "bob"]
+        assert all(user.address is NOT_DECODED for user in feed.users)
+        assert feed.by_name["ann"].address.city == "Berlin"
+        assert feed.by_name["ann"].address.street is NOT_DECODED
+        assert feed.by_name["bob"] is None
+        assert isinstance(feed.pairs, tuple)
+        assert feed.pairs[0].street == "Main"
+        assert feed.pairs[0].city is NOT_DECODED
+
+    def test_paths_through_collections_with_lazy(self):
+        feed = Feed.from_dict(feed_dict, only=["users.name"], lazy=True)
+        assert feed.users[1].name == "bob"
+        assert feed.users[1].address is NOT_DECODED
+
+    def test_invalid_field_in_collection(self):
+        with pytest.raises(ValueError, match="bogus"):
+            Feed.from_dict(feed_dict, only=["users.bogus"])
+        # also checked when there are no items to apply the path to
+        with pytest.raises(ValueError, match="bogus"):
+            Feed.from_dict({"users": [], "by_name": {}}, only=["by_name.bogus"])
+
+    def test_path_into_field_without_dataclasses(self):
+        with pytest.raises(ValueError, match="names"):
+            Feed.from_dict(feed_dict, only=["names.first"])
+        with pytest.raises(ValueError, match="body"):
+            Event.from_dict(event_dict, only=["body.huge"])
+
+    def test_default_factory_called_once(self):
+        calls = []
+
+        @dataclass
+        class Counted(DataClassJsonMixin):
+            id: int
+            items: List[int] = field(default_factory=lambda: calls.append(1) or [])
+
+        assert Counted.from_dict({"id": 1}, only=["id"]).items == []
+        assert calls == [1]
+
+    def test_sentinel(self):
+        assert repr(NOT_DECODED) == "NOT_DECODED"
+        assert pickle.loads(pickle.dumps(NOT_DECODED)) is NOT_DECODED
@@ -0,0 +1,90 @@
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+from dataclasses_json import CatchAll, DataClassJsonMixin, LetterCase, Undefined, config, dataclass_json
+
+
+@dataclass
+class Item(DataClassJsonMixin):
+    sku: str
+    price: float
+
+
+@dataclass
+class Customer(DataClassJsonMixin):
+    name: str
+    email: str
+
+
+@dataclass
+class Order(DataClassJsonMixin):
+    id: int
+    customer: Customer
+    items: List[Item]
+    by_region: Dict[str, Item] = field(default_factory=dict)
+    created_by: str = field(default="system", metadata=config(letter_case=LetterCase.CAMEL))
+
+
+@dataclass_json(undefined=Undefined.INCLUDE)
+@dataclass
+class WithCatchAll:
+    name: str
+    rest: CatchAll = None
+
+
+order = Order(1, Customer("ann", "ann@example.com"),
+              [Item("a", 1.0), Item("b", 2.0)], {"eu": Item("c", 3.0)})
+
+
+class _Unencodable:
+    def __deepcopy__(self, memo):
+        raise AssertionError("excluded values must not be visited")
+
+
+class TestInclude:
+    def test_top_level(self):
+        assert order.to_dict(include=["id"]) == {"id": 1}
+
+    def test_nested_paths_through_collections(self):
+        assert order.to_dict(include=["customer.name", "items.price", "by_region.sku"]) == {
+            "customer": {"name": "ann"},
+            "items": [{"price": 1.0}, {"price": 2.0}],
+            "by_region": {"eu": {"sku": "c"}},
+        }
+
+    def test_letter_case(self):
+        assert order.to_dict(include=["created_by"]) == {"createdBy": "system"}
+
+    def test_to_json(self):
+        assert json.loads(order.to_json(include=["id", "items.sku"])) == {
+            "id": 1, "items": [{"sku": "a"}, {"sku": "b"}]}
+
+
+class TestExclude:
+    def test_top_level(self):
+        assert set(order.to_dict(exclude=["items", "by_region"])) == {"id", "customer", "createdBy"}
+
+    def test_nested_paths(self):
+        encoded = order.to_dict(exclude=["customer.email", "items.price"])
+        assert encoded["customer"] == {"name": "ann"}
+        assert encoded["items"] == [{"sku": "a"}, {"sku": "b"}]
+
+    def test_excluded_values_are_not_visited(self):
+        unencodable = Order(1, Customer("ann", "x"), [_Unencodable()])
+        assert unencodable.to_dict(exclude=["items"])["id"] == 1
+
+    def test_combined_with_include(self):
+        assert order.to_dict(include=["customer"], exclude=["customer.email"]) == {
+            "customer": {"name": "ann"}}
+
+    def test_catch_all_field(self):
+        obj = WithCatchAll.from_dict({"name": "x", "extra": 1})
+        assert obj.to_dict() == {"name": "x", "extra": 1}
+        assert obj.to_dict(exclude=["rest"]) == {"name": "x"}
+
+    def test_invalid_field(self):
+        with pytest.raises(ValueError, match="mail"):
+            order.to_dict(exclude=["customer.mail"])
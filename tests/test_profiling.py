@@ -0,0 +1,101 @@
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+from dataclasses_json import DataClassJsonMixin, config
+from dataclasses_json import profiling
+from dataclasses_json.profiling import profile
+
+
+def parse_created_at(value):
+    return datetime.fromisoformat(value)
+
+
+@dataclass
+class Leaf(DataClassJsonMixin):
+    name: str
+    created_at: datetime = field(metadata=config(decoder=parse_created_at,
+                                                 encoder=datetime.isoformat))
+
+
+@dataclass
+class Tree(DataClassJsonMixin):
+    leaves: List[Leaf]
+    child: Optional["Tree"] = None
+
+
+tree_dict = {"leaves": [{"name": "a", "created_at": "2020-01-01T00:00:00"},
+                        {"name": "b", "created_at": "2020-01-02T00:00:00"}],
+             "child": {"leaves": [], "child": None}}
+
+
+class TestProfile:
+    def test_inactive_by_default(self):
+        assert profiling._active is None
+        Tree.from_dict(tree_dict)
+
+    def test_decode_stats(self):
+        with profile() as prof:
+            Tree.from_dict(tree_dict)
+        stats = prof.as_dict()
+        assert stats["decode"]["Tree"]["calls"] == 2
+        assert stats["decode"]["Leaf"]["calls"] == 2
+        assert stats["decode"]["Leaf"]["fields"]["created_at"]["calls"] == 2
+        assert stats["decode"]["Tree"]["fields"]["leaves"]["calls"] == 2
+        assert stats["decoders"]["parse_created_at"]["calls"] == 2
+        tree_stats = stats["decode"]["Tree"]
+        assert 0 < tree_stats["self_time"] <= tree_stats["time"]
+        assert profiling._active is None
+
+    def test_encode_stats(self):
+        tree = Tree.from_dict(tree_dict)
+        with profile() as prof:
+            tree.to_json()
+        stats = prof.as_dict()
+        assert stats["encode"]["Tree"]["calls"] == 2
+        assert stats["encode"]["Leaf"]["fields"]["name"]["calls"] == 2
+        assert stats["encoders"]["datetime.isoformat"]["calls"] == 2
+        assert stats["decode"] == {}
+
+    def test_collapsed_stacks(self):
+        with profile() as prof:
+            Tree.from_dict(tree_dict)
+        stacks = dict(line.rsplit(" ", 1) for line in prof.collapsed().splitlines())
+        assert "decode:Tree;leaves;decode:Leaf;created_at;decoder:parse_created_at" in stacks
+        assert "decode:Tree;child;decode:Tree" in stacks
+        assert all(value.isdigit() for value in stacks.values())
+
+    def test_exceptions_do_not_corrupt_stacks(self):
+        with profile() as prof:
+            with pytest.raises(ValueError):
+                Tree.from_dict({"leaves": [{"name": "a", "created_at": "nope"}]})
+            Leaf.from_dict(tree_dict["leaves"][0])
+        assert "decode:Leaf;created_at;decoder:parse_created_at" in prof.collapsed()
+        assert prof.as_dict()["decode"]["Leaf"]["calls"] == 2
+
+    def test_threads(self):
+        with profile() as prof:
+            threads = [threading.Thread(target=Tree.from_dict, args=(tree_dict,))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert prof.as_dict()["decode"]["Tree"]["calls"] == 8
+        assert all(line.startswith("decode:Tree") for line in prof.collapsed().splitlines())
+
+    def test_overlapping_blocks_end_in_any_order(self):
+        first, second = profile(), profile()
+        pa = first.__enter__()
+        pb = second.__enter__()
+        assert profiling._active is pb
+        first.__exit__(None, None, None)
+        assert profiling._active is pb
+        Tree.from_dict(tree_dict)
+        second.__exit__(None, None, None)
+        assert profiling._active is None
+        assert pb.as_dict()["decode"]["Tree"]["calls"] == 2
+        assert not pa.as_dict()["decode"]
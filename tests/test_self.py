@@ -3,10 +3,17 @@
  This suite verifies that we are somewhat able to serde self-referencing classes before 3.11.
 """
 import json
-from typing import Dict
+import sys
+import warnings
+from dataclasses import dataclass
+from typing import Dict, List
 
 import pytest
 
+from dataclasses_json import dataclass_json
+from dataclasses_json.core import (_handle_pep0673, _resolve_forward_refs, _self_references,
+                                   _type_hints)
+from dataclasses_json.utils import _get_type_args
 from tests.entities import DataClassWithSelf
 
 
@@ -37,3 +44,58 @@ class TestSelf:
     def test_self_type(self, entity: Dict):
         obj = DataClassWithSelf.from_json(json.dumps(entity))
         assert isinstance(obj, DataClassWithSelf) and (isinstance(obj.ref, DataClassWithSelf) or isinstance(obj.ref, type(None)))
+
+
+class TestSelfReferenceResolution:
+    def test_nested_string_hints_are_resolved(self):
+        @dataclass_json
+        @dataclass
+        class Tree:
+            value: int
+            children: List["Tree"]
+
+        hints = _type_hints(Tree)
+        assert _get_type_args(hints["children"]) == (Tree,)
+        tree = Tree.from_dict({"value": 1, "children": [{"value": 2, "children": []}]})
+        assert tree == Tree(1, [Tree(2, [])])
+
+    def test_string_in_builtin_generic_is_resolved(self):
+        hint = _resolve_forward_refs(Dict[str, "DataClassWithSelf"],
+                                     vars(sys.modules[__name__]), {})
+        assert hint == Dict[str, DataClassWithSelf]
+
+    def test_type_hints_are_cached(self):
+        assert _type_hints(DataClassWithSelf) is _type_hints(DataClassWithSelf)
+
+    def test_module_scan_is_cached_per_owner(self):
+        @dataclass
+        class Owner:
+            pass
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                assert _handle_pep0673(Owner, "DataClassWithSelf") is DataClassWithSelf
+        # every use warns under `WarningPolicy.ALWAYS`, only the first scans
+        assert len(caught) == 3
+        assert _self_references(Owner) == {"DataClassWithSelf": DataClassWithSelf}
+
+    def test_failed_resolution_is_retried(self, monkeypatch):
+        @dataclass
+        class Owner:
+            pass
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert _handle_pep0673(Owner, "_LaterDefinedItem") == "_LaterDefinedItem"
+        assert "Could not resolve" in str(caught[0].message)
+
+        @dataclass
+        class _LaterDefinedItem:
+            name: str
+
+        monkeypatch.setattr(sys.modules[__name__], "_LaterDefinedItem",
+                            _LaterDefinedItem, raising=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            assert _handle_pep0673(Owner, "_LaterDefinedItem") is _LaterDefinedItem
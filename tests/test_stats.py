@@ -0,0 +1,124 @@
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+
+import pytest
+
+from dataclasses_json import CatchAll, DataClassJsonMixin, Undefined, config, dataclass_json, stats
+from dataclasses_json.undefined import UndefinedParameterError
+
+
+@dataclass
+class Cat(DataClassJsonMixin):
+    meows: int
+
+
+@dataclass
+class Dog(DataClassJsonMixin):
+    barks: int
+
+
+@dataclass
+class Pets(DataClassJsonMixin):
+    pets: List[Union[Cat, Dog]]
+    owner: Optional[str]
+
+
+@dataclass_json(undefined=Undefined.INCLUDE)
+@dataclass
+class Included:
+    name: str
+    rest: CatchAll = None
+
+
+@dataclass_json(undefined=Undefined.RAISE)
+@dataclass
+class Raised:
+    name: str
+
+
+def _fail(value):
+    raise RuntimeError("cannot encode")
+
+
+@dataclass
+class Failing(DataClassJsonMixin):
+    value: int = field(metadata=config(encoder=_fail))
+
+
+@pytest.fixture(autouse=True)
+def collect_stats():
+    stats.reset()
+    stats.enable()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+class TestStats:
+    def test_disabled(self):
+        stats.disable()
+        Cat.from_dict({"meows": 1})
+        assert stats.snapshot()["decoded"] == {}
+
+    def test_decoded_and_encoded(self):
+        pets = Pets.from_dict({"pets": [{"meows": 1}, {"barks": 2}], "owner": None})
+        pets.to_dict()
+        snapshot = stats.snapshot()
+        assert snapshot["decoded"] == {"Pets": 1, "Cat": 1, "Dog": 1}
+        assert snapshot["encoded"] == {"Pets": 1, "Cat": 1, "Dog": 1}
+
+    def test_failed_encodes_are_not_counted(self):
+        with pytest.raises(RuntimeError):
+            Failing(1).to_dict()
+        assert stats.snapshot()["encoded"] == {}
+
+    def test_union_attempts(self):
+        with pytest.warns(UserWarning):
+            Pets.from_dict({"pets": [{"barks": 2}, {"purrs": 3}], "owner": None})
+        snapshot = stats.snapshot()
+        assert snapshot["union_attempts"] == {"Cat": 2, "Dog": 2}
+        assert snapshot["union_attempt_failures"] == {"Cat": 2, "Dog": 1}
+        assert list(snapshot["union_unmatched"].values()) == [1]
+
+    def test_infer_missing(self):
+        Pets.from_dict({"pets": []}, infer_missing=True)
+        assert stats.snapshot()["infer_missing"] == {"Pets.owner": 1}
+
+    def test_undefined_parameters(self):
+        Included.from_dict({"name": "x", "a": 1, "b": 2})
+        with pytest.raises(UndefinedParameterError):
+            Raised.from_dict({"name": "x", "c": 3})
+        assert stats.snapshot()["undefined_parameters"] == {"INCLUDE": 2, "RAISE": 1}
+
+    def test_prometheus(self):
+        Cat.from_dict({"meows": 1})
+        Cat.from_dict({"meows": 2})
+        text = stats.prometheus()
+        assert "# TYPE dataclasses_json_decoded_total counter\n" in text
+        assert 'dataclasses_json_decoded_total{class="Cat"} 2\n' in text
+        assert "# TYPE dataclasses_json_union_unmatched_total counter\n" in text
+
+    def test_threads_are_summed(self):
+        barrier = threading.Barrier(4)
+
+        def decode():
+            Cat.from_dict({"meows": 1})
+            # all threads count at the same time
+            barrier.wait()
+
+        threads = [threading.Thread(target=decode) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        Cat.from_dict({"meows": 1})
+        assert stats.snapshot()["decoded"] == {"Cat": 4}
+        for thread in threads:
+            thread.join()
+        # the counts of ended threads are kept
+        assert stats.snapshot()["decoded"] == {"Cat": 4}
+
+    def test_reset(self):
+        Cat.from_dict({"meows": 1})
+        stats.reset()
+        assert all(counts == {} for counts in stats.snapshot().values())
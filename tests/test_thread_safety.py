@@ -0,0 +1,92 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from dataclasses_json import DataClassJsonMixin, global_config
+from dataclasses_json.parallel import parallel_decode
+
+
+class Token(str):
+    pass
+
+
+@dataclass
+class Message(DataClassJsonMixin):
+    id: int
+    token: Token
+    parts: List[str]
+
+
+def lower(value):
+    return Token(value.lower())
+
+
+def upper(value):
+    return Token(value.upper())
+
+
+@pytest.fixture
+def restore_decoders():
+    decoders = dict(global_config.decoders)
+    yield
+    global_config.decoders = decoders
+
+
+class TestGlobalConfigChanges:
+    def test_decoder_added_after_first_decode(self, restore_decoders):
+        assert Message.from_dict({'id': 1, 'token': 'Ab', 'parts': []}).token == 'Ab'
+        global_config.decoders[Token] = lower
+        assert Message.from_dict({'id': 1, 'token': 'Ab', 'parts': []}).token == 'ab'
+        global_config.decoders = {Token: upper}
+        assert Message.from_dict({'id': 1, 'token': 'Ab', 'parts': []}).token == 'AB'
+        del global_config.decoders[Token]
+        assert Message.from_dict({'id': 1, 'token': 'Ab', 'parts': []}).token == 'Ab'
+
+    def test_version_changes_on_every_mutation(self, restore_decoders):
+        versions = {global_config.version}
+        global_config.decoders[Token] = lower
+        versions.add(global_config.version)
+        global_config.decoders.update({Token: upper})
+        versions.add(global_config.version)
+        global_config.decoders.pop(Token)
+        versions.add(global_config.version)
+        global_config.decoders.setdefault(Token, lower)
+        versions.add(global_config.version)
+        global_config.decoders.clear()
+        versions.add(global_config.version)
+        assert len(versions) == 6
+
+
+def test_threaded_decode_while_config_changes(restore_decoders):
+    records = [{'id': i, 'token': 'Ab', 'parts': ['x'] * (i % 5)}
+               for i in range(200)]
+    chunks = [records[i:i + 20] for i in range(0, len(records), 20)]
+    stop = threading.Event()
+
+    def mutate():
+        decoders = [lower, upper]
+        i = 0
+        while not stop.is_set():
+            global_config.decoders[Token] = decoders[i % 2]
+            if i % 3 == 0:
+                del global_config.decoders[Token]
+            i += 1
+
+    mutator = threading.Thread(target=mutate)
+    mutator.start()
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            for _ in range(20):
+                decoded = parallel_decode(Message, chunks, executor=executor)
+                assert [m.id for m in decoded] == list(range(200))
+                assert all(m.token in ('Ab', 'ab', 'AB') for m in decoded)
+                assert all(m.parts == ['x'] * (m.id % 5) for m in decoded)
+    finally:
+        stop.set()
+        mutator.join()
+
+    global_config.decoders[Token] = upper
+    assert parallel_decode(Message, chunks, threads=True, workers=4)[0].token == 'AB'
@@ -5,8 +5,10 @@ import sys
 from marshmallow import fields
 import pytest
 
-from dataclasses_json import dataclass_json
+import dataclasses_json.cfg
+from dataclasses_json import dataclass_json, refresh_local_timezone
 from dataclasses_json.mm import _IsoField
+from dataclasses_json.utils import _local_timezone
 
 
 @dataclass_json
@@ -104,3 +106,35 @@ class TestTime:
     def test_datetime_custom_iso_field_override_schema_decode(self):
         iso = DataClassWithCustomIsoDatetime.schema().loads(self.dc_iso_json)
         assert (iso == DataClassWithCustomIsoDatetime(self.dt))
+
+
+class TestTimestampTimezone:
+    ts = datetime(2018, 11, 17, 16, 55, 28, 456753, tzinfo=timezone.utc).timestamp()
+
+    def teardown_method(self):
+        dataclasses_json.cfg.global_config.timestamp_tz = None
+        refresh_local_timezone()
+
+    def test_local_timezone_is_resolved_once(self):
+        refresh_local_timezone()
+        for _ in range(10_000):
+            DataClassWithDatetime.from_dict({"created_at": self.ts})
+        assert _local_timezone.cache_info().misses == 1
+
+    def test_refresh_local_timezone(self):
+        DataClassWithDatetime.from_dict({"created_at": self.ts})
+        refresh_local_timezone()
+        assert _local_timezone.cache_info().currsize == 0
+        DataClassWithDatetime.from_dict({"created_at": self.ts})
+        assert _local_timezone.cache_info().currsize == 1
+
+    def test_decode_to_configured_timezone(self):
+        dataclasses_json.cfg.global_config.timestamp_tz = timezone.utc
+        decoded = DataClassWithDatetime.from_dict({"created_at": self.ts})
+        assert decoded.created_at.tzinfo is timezone.utc
+        assert decoded.created_at.timestamp() == self.ts
+
+    def test_schema_decode_to_configured_timezone(self):
+        dataclasses_json.cfg.global_config.timestamp_tz = timezone.utc
+        decoded = DataClassWithDatetime.schema().load({"created_at": self.ts})
+        assert decoded.created_at.tzinfo is timezone.utc
@@ -0,0 +1,141 @@
+import sys
+from dataclasses import InitVar, dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from dataclasses_json import (CatchAll, DataClassJsonMixin, Undefined, config,
+                              dataclass_json)
+from dataclasses_json.core import _field_plan
+
+
+@dataclass_json(undefined=Undefined.INCLUDE, trust_init=True)
+@dataclass(frozen=True)
+class FrozenWithUnknown:
+    id: int
+    tags: List[str] = field(default_factory=list)
+    unknown: CatchAll = None  # type: ignore[assignment]
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE, trust_init=True)
+@dataclass
+class WithPostInit:
+    width: int
+    height: int
+    area: int = field(init=False)
+    history: list = field(init=False, default_factory=list)
+
+    def __post_init__(self):
+        self.area = self.width * self.height
+
+
+@dataclass_json(trust_init=True)
+@dataclass
+class WithInitVar:
+    value: int
+    scale: InitVar[int] = 2
+
+    def __post_init__(self, scale):
+        self.value *= scale
+
+
+@dataclass
+class Slotted(DataClassJsonMixin):
+    __slots__ = ('name', 'child')
+    dataclass_json_config = config(trust_init=True)['dataclasses_json']
+
+    name: str
+    child: Optional['Slotted']
+
+
+def _forbid_init(cls, monkeypatch):
+    # the plan is made while `__init__` is still the generated one
+    assert _field_plan(cls).trust_init
+
+    def init(self, *args, **kwargs):
+        raise AssertionError("__init__ was called")
+
+    monkeypatch.setattr(cls, '__init__', init)
+
+
+class TestTrustInit:
+    def test_init_is_not_called(self, monkeypatch):
+        _forbid_init(FrozenWithUnknown, monkeypatch)
+        decoded = FrozenWithUnknown.from_dict(  # type: ignore[attr-defined]
+            {'id': 1, 'tags': ['a'], 'extra': True})
+        assert decoded.id == 1 and decoded.tags == ['a']
+        assert decoded.unknown == {'extra': True}
+
+    def test_same_result_as_init(self):
+        kvs = {'id': 1, 'extra': True}
+        decoded = FrozenWithUnknown.from_dict(kvs)  # type: ignore[attr-defined]
+        assert decoded == FrozenWithUnknown(**kvs)  # type: ignore[call-arg]
+        assert decoded.to_dict() == {'id': 1, 'tags': [], 'extra': True}  # type: ignore[attr-defined]
+
+    def test_frozen_instance_stays_frozen(self):
+        decoded = FrozenWithUnknown.from_dict({'id': 1})  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            decoded.id = 2
+
+    def test_post_init_and_non_init_fields(self, monkeypatch):
+        _forbid_init(WithPostInit, monkeypatch)
+        decoded = WithPostInit.from_dict(  # type: ignore[attr-defined]
+            {'width': 2, 'height': 3, 'ignored': 0})
+        assert decoded.area == 6 and decoded.history == []
+
+    def test_init_vars_fall_back_to_init(self):
+        assert not _field_plan(WithInitVar).trust_init
+        assert WithInitVar.from_dict({'value': 2}).value == 4  # type: ignore[attr-defined]
+
+    def test_custom_init_falls_back_to_init(self):
+        @dataclass_json(trust_init=True)
+        @dataclass
+        class CustomInit:
+            value: int
+
+            def __init__(self, value):
+                self.value = value + 1
+
+        with pytest.warns(UserWarning, match="trust_init"):
+            assert not _field_plan(CustomInit).trust_init
+        assert CustomInit.from_dict({'value': 1}).value == 2  # type: ignore[attr-defined]
+
+    def test_init_false_falls_back_to_init(self):
+        @dataclass_json(trust_init=True)
+        @dataclass(init=False)
+        class NoInit:
+            value: int
+
+            def __init__(self, value):
+                self.value = str(value)
+
+        with pytest.warns(UserWarning, match="trust_init"):
+            assert not _field_plan(NoInit).trust_init
+        assert NoInit.from_dict({'value': 1}).value == '1'  # type: ignore[attr-defined]
+
+    def test_slots(self):
+        decoded = Slotted.from_dict({'name': 'a',
+                                     'child': {'name': 'b', 'child': None}})
+        assert decoded == Slotted('a', Slotted('b', None))
+
+
+if sys.version_info >= (3, 10):
+    @dataclass_json(trust_init=True)
+    @dataclass(slots=True, frozen=True)
+    class SlotsFrozen:
+        id: int
+        name: str = 'unnamed'
+        child: Optional['SlotsFrozen'] = None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass(slots=True) requires Python 3.10")
+class TestSlots:
+    def test_round_trip(self):
+        obj = SlotsFrozen(1, 'a', SlotsFrozen(2))
+        assert obj.to_dict() == {'id': 1, 'name': 'a',  # type: ignore[attr-defined]
+                                 'child': {'id': 2, 'name': 'unnamed', 'child': None}}
+        assert SlotsFrozen.from_dict(obj.to_dict()) == obj  # type: ignore[attr-defined]
+
+    def test_no_instance_dict(self):
+        decoded = SlotsFrozen.from_dict({'id': 1})  # type: ignore[attr-defined]
+        assert not hasattr(decoded, '__dict__')
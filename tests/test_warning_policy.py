@@ -0,0 +1,85 @@
+import warnings
+from dataclasses import dataclass
+from typing import List, Union
+
+import pytest
+
+from dataclasses_json import DataClassJsonMixin, WarningPolicy, stats
+from dataclasses_json.cfg import global_config
+from dataclasses_json.core import _warned_sites
+
+
+@dataclass
+class A(DataClassJsonMixin):
+    a: int
+
+
+@dataclass
+class B(DataClassJsonMixin):
+    b: int
+
+
+@dataclass
+class Holder(DataClassJsonMixin):
+    name: str
+    items: List[Union[A, B]]
+
+
+unmatched = {"name": "x", "items": [{"c": 1}, {"c": 2}]}
+
+
+class _ExplodingRepr(dict):
+    def __repr__(self):
+        raise AssertionError("value must not be formatted")
+
+    __str__ = __repr__
+
+
+@pytest.fixture(autouse=True)
+def restore_policy():
+    yield
+    global_config.warning_policy = WarningPolicy.ALWAYS
+    _warned_sites.clear()
+    stats.reset()
+
+
+class TestWarningPolicy:
+    def test_always_is_the_default(self):
+        assert global_config.warning_policy is WarningPolicy.ALWAYS
+        with pytest.warns(UserWarning) as record:
+            Holder.from_dict(unmatched)
+        assert len(record) == 2
+
+    def test_once(self):
+        global_config.warning_policy = WarningPolicy.ONCE
+        with pytest.warns(RuntimeWarning) as record:
+            Holder.from_dict({"name": None, "items": []})
+            Holder.from_dict({"name": None, "items": []})
+        assert len(record) == 1
+        with pytest.warns(UserWarning) as record:
+            Holder.from_dict(unmatched)
+        assert len(record) == 1
+
+    def test_off(self):
+        global_config.warning_policy = WarningPolicy.OFF
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            Holder.from_dict(unmatched)
+            Holder.from_dict({"name": None, "items": [_ExplodingRepr(c=1)]})
+
+    def test_aggregate(self):
+        global_config.warning_policy = WarningPolicy.AGGREGATE
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            Holder.from_dict(unmatched)
+            Holder.from_dict({"name": None, "items": []})
+        counts = stats.snapshot()["warnings"]
+        assert counts["Holder.name:none"] == 1
+        assert sum(n for site, n in counts.items() if site.endswith(":union_unmatched")) == 2
+
+    def test_raise(self):
+        global_config.warning_policy = WarningPolicy.RAISE
+        with pytest.raises(RuntimeWarning, match="'NoneType' object"):
+            Holder.from_dict({"name": None, "items": []})
+        with pytest.raises(UserWarning, match="Failed to decode"):
+            Holder.from_dict(unmatched)